@@ -1,9 +1,8 @@
 # 导入所需库（确保已安装：streamlit pandas joblib）
 import streamlit as st
-import pandas as pd
-import joblib
-from pathlib import Path
 import os
+from feature_encoder import predict_matrix
+from saved_models import load_medical_model
 
 # 页面配置（美化界面，支持中文）
 st.set_page_config(
@@ -22,13 +21,8 @@ st.markdown("---")
 try:
     # 获取当前脚本目录（避免路径错误）
     current_path = os.path.dirname(os.path.abspath(__file__))
-    # 拼接模型文件路径
-    model_path = os.path.join(current_path, "medical_cost_model.joblib")
-    feature_path = os.path.join(current_path, "feature_columns.joblib")
-    
-    # 加载模型和特征列
-    model = joblib.load(model_path)
-    feature_columns = joblib.load(feature_path)
+    # 加载模型和特征列，并根据特征列构建编码器：分类取值直接映射为特征列下标
+    model, encoder = load_medical_model(current_path)
     st.success("✅ 模型加载成功，可开始预测！")
 except Exception as e:
     st.error(f"❌ 模型加载失败：{e}")
@@ -73,25 +67,19 @@ with st.form("medical_cost_form", clear_on_submit=False):
 
 # 核心步骤3：点击提交后，执行预测逻辑
 if submit_btn:
-    # 步骤3.1：整理用户输入，转换为模型可识别的格式（匹配独热编码）
-    input_data = pd.DataFrame({
-        "年龄": [age],
-        "BMI": [bmi],
-        "子女数量": [children],
-        # 分类特征：对应训练时的独热编码结果（drop_first=True）
-        "性别_男性": [1 if gender == "男性" else 0],
-        "是否吸烟_是": [1 if smoker == "是" else 0],
-        "区域_东北部": [1 if region == "东北部" else 0],
-        "区域_西北部": [1 if region == "西北部" else 0],
-        "区域_东南部": [1 if region == "东南部" else 0]
+    # 步骤3.1：整理用户输入，由编码器直接写入与训练特征列对齐的特征矩阵（未出现的特征列为0）
+    input_data = encoder.transform_row({
+        "年龄": age,
+        "BMI": bmi,
+        "子女数量": children,
+        "性别": gender,
+        "是否吸烟": smoker,
+        "区域": region
     })
     
-    # 步骤3.2：补全缺失特征列（确保与训练模型的特征一致，避免报错）
-    input_data = input_data.reindex(columns=feature_columns, fill_value=0)
-    
     # 步骤3.3：执行预测
     try:
-        predicted_cost = model.predict(input_data)[0]
+        predicted_cost = predict_matrix(model, input_data)[0]
         
         # 步骤3.4：美化展示预测结果
         st.markdown("---")
@@ -1,8 +1,8 @@
 # 导入所需库（确保已安装：streamlit pandas joblib）
 import streamlit as st
-import pandas as pd
-import joblib
 import os
+from feature_encoder import predict_matrix
+from saved_models import load_penguin_model
 
 # 页面配置（美化界面，支持中文）
 st.set_page_config(
@@ -21,12 +21,8 @@ st.markdown("---")
 try:
     # 获取当前脚本目录，避免路径错误
     current_path = os.path.dirname(os.path.abspath(__file__))
-    model_path = os.path.join(current_path, "penguin_model_v2.joblib")
-    feature_path = os.path.join(current_path, "penguin_features_v2.joblib")
-    
-    # 加载模型和特征列
-    model = joblib.load(model_path)
-    feature_columns = joblib.load(feature_path)
+    # 加载模型和特征列，并根据特征列构建编码器：分类取值直接映射为特征列下标
+    model, encoder = load_penguin_model(current_path)
     st.success("✅ 企鹅分类模型加载成功，可开始预测！")
 except Exception as e:
     st.error(f"❌ 模型加载失败：{e}")
@@ -107,26 +103,20 @@ with st.form("penguin_classify_form", clear_on_submit=False):
 
 # 核心步骤3：点击提交后，执行预测逻辑（适配新模型的特征编码）
 if submit_btn:
-    # 步骤3.1：整理用户输入，转换为模型可识别的格式（匹配独热编码结果）
-    input_data = pd.DataFrame({
-        "喙的长度": [bill_length],
-        "喙的深度": [bill_depth],
-        "翅膀的长度": [flipper_length],
-        "身体质量": [body_mass],
-        "观测年份": [observation_year],
-        # 分类特征1：企鹅栖息的岛屿（对应独热编码 drop_first=True）
-        "企鹅栖息的岛屿_Dream": [1 if island == "Dream" else 0],
-        "企鹅栖息的岛屿_Torgersen": [1 if island == "Torgersen" else 0],
-        # 分类特征2：性别（对应独热编码 drop_first=True）
-        "性别_雄性": [1 if gender == "雄性" else 0]
+    # 步骤3.1：整理用户输入，由编码器直接写入与训练特征列对齐的特征矩阵（未出现的特征列为0）
+    input_data = encoder.transform_row({
+        "喙的长度": bill_length,
+        "喙的深度": bill_depth,
+        "翅膀的长度": flipper_length,
+        "身体质量": body_mass,
+        "观测年份": observation_year,
+        "企鹅栖息的岛屿": island,
+        "性别": gender
     })
     
-    # 步骤3.2：补全缺失特征列（确保与训练模型的特征一致，避免报错）
-    input_data = input_data.reindex(columns=feature_columns, fill_value=0)
-    
     # 步骤3.3：执行预测
     try:
-        pred_result = model.predict(input_data)[0]
+        pred_result = predict_matrix(model, input_data)[0]
         
         # 步骤3.4：美化展示预测结果
         st.markdown("---")
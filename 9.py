@@ -1,8 +1,17 @@
 import streamlit as st
+import numpy as np
 import pandas as pd
 import matplotlib.pyplot as plt
 from pathlib import Path
 import os
+from data_loader import load_sales_workbook
+from sales_analytics import (
+    SalesFilterIndex,
+    build_sales_rollup,
+    product_sales_from_rollup,
+    sales_kpis_from_rollup,
+    weekly_sales_from_rollup
+)
 
 # ---------------------- 1. 中文显示与全局配置 ----------------------
 plt.rcParams["font.sans-serif"] = ["SimHei"]  # 启用黑体显示中文
@@ -31,13 +40,9 @@ def load_sales_data():
     file_path = os.path.join(desktop_path, "sj.xlsx")
     
     if os.path.exists(file_path):
-        df = pd.read_excel(file_path, engine="openpyxl", header=1)
+        # 只读流式解析工作簿（多工作表并行），日期解析与补齐后写入Arrow缓存；文件未变化时直接读取缓存
+        df = load_sales_workbook(file_path)
         st.success(f"成功读取表头：{list(df.columns)}")
-        
-        # 日期处理
-        df["日期"] = pd.to_datetime(df["日期"], errors="coerce")
-        if df["日期"].isnull().any():
-            df["日期"] = df["日期"].fillna(pd.date_range(start="2022-01-01", periods=len(df)))
         return df
     else:
         st.error("❌ 桌面未找到sj.xlsx")
@@ -48,19 +53,29 @@ def load_sales_data():
             "城市": pd.Series(["太原", "大同", "临汾"]).sample(n=1000, replace=True).values,
             "产品类型": pd.Series(["健康美容", "电子配件", "食品饮料"]).sample(n=1000, replace=True).values,
             "总价": pd.Series(range(100, 5000, 10)).sample(n=1000, replace=True).values,
-            "评分": pd.Series([round(x,1) for x in pd.np.random.uniform(4,10,1000)]).values
+            "评分": pd.Series([round(x,1) for x in np.random.uniform(4,10,1000)]).values
         })
         return df
 
-sales_df = load_sales_data()
+@st.cache_resource
+def get_sales_rollup():
+    """天 × 城市 × 产品类型 日汇总立方体及其筛选引擎，每次加载数据只构建一次"""
+    return SalesFilterIndex(build_sales_rollup(load_sales_data()))
+
+@st.cache_resource
+def get_sales_index():
+    """原始订单的筛选引擎（按日期排序 + 取值位图），只在查看订单明细时构建"""
+    return SalesFilterIndex(load_sales_data())
+
+sales_rollup = get_sales_rollup()
 
 # ---------------------- 3. 侧边栏筛选 ----------------------
 with st.sidebar:
     st.markdown("<div class='filter-card'>", unsafe_allow_html=True)
     st.subheader("数据筛选")
     
-    date_min = sales_df["日期"].min()
-    date_max = sales_df["日期"].max()
+    date_min = sales_rollup.date_min
+    date_max = sales_rollup.date_max
     selected_dates = st.date_input(
         "日期范围",
         value=[date_min, date_max],
@@ -68,23 +83,21 @@ with st.sidebar:
         max_value=date_max
     )
     
-    selected_cities = st.multiselect("城市", sales_df["城市"].unique(), default=sales_df["城市"].unique())
-    selected_products = st.multiselect("产品类型", sales_df["产品类型"].unique(), default=sales_df["产品类型"].unique())
+    selected_cities = st.multiselect("城市", sales_rollup.values["城市"], default=sales_rollup.values["城市"])
+    selected_products = st.multiselect("产品类型", sales_rollup.values["产品类型"], default=sales_rollup.values["产品类型"])
     st.markdown("</div>", unsafe_allow_html=True)
 
 # ---------------------- 4. 数据筛选与KPI计算 ----------------------
-filtered_df = sales_df[
-    (sales_df["日期"] >= pd.Timestamp(selected_dates[0])) &
-    (sales_df["日期"] <= pd.Timestamp(selected_dates[1])) &
-    (sales_df["城市"].isin(selected_cities)) &
-    (sales_df["产品类型"].isin(selected_products))
-]
-
-# 正确计算KPI
-total_sales = filtered_df["总价"].sum()
-avg_rating = filtered_df["评分"].mean().round(1)
-total_orders = filtered_df["订单号"].nunique() if "订单号" in filtered_df.columns else len(filtered_df)
-avg_sales_per_order = (total_sales / total_orders).round(2) if total_orders > 0 else 0
+# 日期范围二分查找 + 城市/产品类型位图与运算，筛选的是日汇总单元格而不是原始订单
+filter_selections = {"城市": selected_cities, "产品类型": selected_products}
+filtered_cells = sales_rollup.filter(selected_dates[0], selected_dates[1], filter_selections)
+
+# 正确计算KPI（从汇总单元格推导）
+sales_kpis = sales_kpis_from_rollup(filtered_cells)
+total_sales = sales_kpis["total_sales"]
+avg_rating = sales_kpis["avg_rating"]
+total_orders = sales_kpis["total_orders"]
+avg_sales_per_order = sales_kpis["avg_sales_per_order"]
 
 # ---------------------- 5. 可视化展示（核心：图表1改为每周趋势） ----------------------
 st.title("2022年前3个月销售数据仪表盘")
@@ -109,9 +122,7 @@ col1, col2 = st.columns(2)
 with col1:
     st.subheader("每周销售额趋势")  # 标题更新为“每周”
     # 关键修改：按周聚合数据（freq="W" 代表按周分组）
-    weekly_sales = filtered_df.groupby(
-        pd.Grouper(key="日期", freq="W")  # 按周聚合，自动合并一周内的所有数据
-    ).agg({"总价": "sum"}).reset_index()  # 聚合每周的总销售额
+    weekly_sales = weekly_sales_from_rollup(filtered_cells)  # 按周聚合日汇总单元格，得到每周的总销售额
     
     # 简化日期显示（格式：YYYY-MM 第W周，清晰不密集）
     weekly_sales["每周标签"] = weekly_sales["日期"].dt.strftime("%Y-%m") + " 第" + (weekly_sales["日期"].dt.isocalendar().week).astype(str) + "周"
@@ -137,7 +148,7 @@ with col1:
 # 图表2：产品类型销售额分布（保持不变）
 with col2:
     st.subheader("产品类型销售额分布")
-    product_sales = filtered_df.groupby("产品类型")["总价"].sum().sort_values(ascending=True).reset_index()
+    product_sales = product_sales_from_rollup(filtered_cells)
     fig, ax = plt.subplots(figsize=(8, 5), facecolor="#000000")
     ax.set_facecolor("#000000")
     ax.barh(
@@ -150,4 +161,10 @@ with col2:
     ax.set_ylabel("产品类型", color="#ffffff", fontsize=10)
     plt.xticks(color="#ffffff")
     plt.yticks(color="#ffffff")
-    st.pyplot(fig)
\ No newline at end of file
+    st.pyplot(fig)
+
+# ---------------------- 6. 订单明细（下钻时才读取原始订单）----------------------
+if st.checkbox("查看订单明细"):
+    detail_df = get_sales_index().filter(selected_dates[0], selected_dates[1], filter_selections)
+    st.caption(f"共 {len(detail_df)} 条订单")
+    st.dataframe(detail_df, use_container_width=True, hide_index=True)
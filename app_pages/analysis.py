@@ -0,0 +1,173 @@
+# ---------------------- 界面2：专业数据分析 ----------------------
+# 由 Final_project.py 的 st.navigation 调度，切换到本页时只执行本文件。
+import streamlit as st
+
+from app_services import show_cached_figure
+from figure_cache import frame_fingerprint
+from student_analytics import (
+    gender_dist_from_cube,
+    gender_ratio_from_cube,
+    major_statistics_from_cube,
+    radar_values_from_statistics
+)
+from ui_components import load_shared_resources, render_lazy_sections
+
+app_resources = load_shared_resources()
+
+st.markdown('<h1 class="main-title">📊 专业学业数据分析</h1>', unsafe_allow_html=True)
+st.markdown("---")
+
+# 数据预处理：从预计算的 专业 × 性别 聚合立方体推导（不再逐次扫描全量数据）
+major_cube = app_resources.major_cube
+major_statistics = major_statistics_from_cube(major_cube)
+
+# 1. 数据总览表格
+st.markdown('<h2 class="sub-title">📋 专业数据总览</h2>', unsafe_allow_html=True)
+
+# 添加排序功能
+col1, col2, col3 = st.columns([2, 2, 1])
+with col1:
+    sort_by = st.selectbox("排序依据", ["期末平均分", "期中平均分", "平均出勤率", "平均学习时长", "学生人数"])
+with col2:
+    sort_order = st.radio("排序顺序", ["降序", "升序"], horizontal=True)
+with col3:
+    show_all = st.checkbox("显示所有专业", value=True)
+
+# 排序逻辑
+sort_column = {
+    "期末平均分": "期末平均分",
+    "期中平均分": "期中平均分", 
+    "平均出勤率": "平均出勤率",
+    "平均学习时长": "平均学习时长",
+    "学生人数": "学生人数"
+}[sort_by]
+
+sorted_df = major_statistics.sort_values(
+    sort_column, 
+    ascending=(sort_order == "升序")
+)
+
+if not show_all and len(sorted_df) > 5:
+    display_df = sorted_df.head(5)
+else:
+    display_df = sorted_df
+
+# 美化表格 - 添加宝石蓝表头
+st.dataframe(
+    display_df.style.background_gradient(
+        subset=['期末平均分', '期中平均分'], 
+        cmap='RdYlGn'
+    ).set_table_styles(
+        [{'selector': 'thead th',
+          'props': [('background-color', '#4169E1'),
+                   ('color', 'white'),
+                   ('font-weight', 'bold')]}]
+    ).format({
+        '平均出勤率': '{:.1%}',
+        '平均学习时长': '{:.1f}小时',
+        '期末平均分': '{:.1f}分',
+        '期中平均分': '{:.1f}分'
+    }),
+    use_container_width=True,
+    height=400
+)
+
+# 2. 可视化分析
+st.markdown('<h2 class="sub-title">📈 可视化分析</h2>', unsafe_allow_html=True)
+
+# 绘图模块（及 matplotlib）只在本页导入
+from student_charts import plot_gender_distribution, plot_major_comparison, plot_major_radar
+
+# 惰性分区：每个分区封装为函数，只有当前选中的分区会计算和渲染
+def render_comparison_section():
+    # 综合对比图（输入未变化时直接使用缓存的渲染结果）
+    show_cached_figure(
+        "major_comparison",
+        frame_fingerprint(major_statistics),
+        lambda: plot_major_comparison(major_statistics)
+    )
+
+def render_gender_section():
+    # 性别分布
+    gender_dist = gender_dist_from_cube(major_cube)
+
+    show_cached_figure(
+        "gender_distribution",
+        frame_fingerprint(gender_dist),
+        lambda: plot_gender_distribution(gender_dist)
+    )
+
+    # 添加性别比例计算
+    gender_ratio = gender_ratio_from_cube(major_cube)
+    st.dataframe(
+        gender_ratio.style.format('{:.1%}'),
+        use_container_width=True
+    )
+
+def render_major_detail_section():
+    # 专业选择器
+    selected_major = st.selectbox("选择专业查看详情", major_statistics.index.tolist())
+
+    # 显示专业详情 - 使用宝石蓝卡片
+    major_data = major_statistics.loc[selected_major]
+
+    col1, col2, col3, col4 = st.columns(4)
+    with col1:
+        st.markdown(f"""
+            <div style="background: linear-gradient(135deg, #4169E1 0%, #1E40AF 100%); 
+                        color: white; padding: 15px; border-radius: 10px; text-align: center;">
+                <div style="font-size: 0.9rem; color: #f0f0f0;">学生人数</div>
+                <div style="font-size: 1.5rem; font-weight: bold; color: #FFD700;">{int(major_data['学生人数'])}人</div>
+            </div>
+        """, unsafe_allow_html=True)
+    with col2:
+        st.markdown(f"""
+            <div style="background: linear-gradient(135deg, #4169E1 0%, #1E40AF 100%); 
+                        color: white; padding: 15px; border-radius: 10px; text-align: center;">
+                <div style="font-size: 0.9rem; color: #f0f0f0;">期末平均分</div>
+                <div style="font-size: 1.5rem; font-weight: bold; color: #FFD700;">{major_data['期末平均分']}分</div>
+            </div>
+        """, unsafe_allow_html=True)
+    with col3:
+        st.markdown(f"""
+            <div style="background: linear-gradient(135deg, #4169E1 0%, #1E40AF 100%); 
+                        color: white; padding: 15px; border-radius: 10px; text-align: center;">
+                <div style="font-size: 0.9rem; color: #f0f0f0;">期中平均分</div>
+                <div style="font-size: 1.5rem; font-weight: bold; color: #FFD700;">{major_data['期中平均分']}分</div>
+            </div>
+        """, unsafe_allow_html=True)
+    with col4:
+        st.markdown(f"""
+            <div style="background: linear-gradient(135deg, #4169E1 0%, #1E40AF 100%); 
+                        color: white; padding: 15px; border-radius: 10px; text-align: center;">
+                <div style="font-size: 0.9rem; color: #f0f0f0;">平均出勤率</div>
+                <div style="font-size: 1.5rem; font-weight: bold; color: #FFD700;">{major_data['平均出勤率']:.1%}</div>
+            </div>
+        """, unsafe_allow_html=True)
+
+def render_special_section():
+    # 专项分析
+    if "大数据管理" in major_statistics.index:
+        # 创建雷达图
+        categories = ['期末成绩', '期中成绩', '学习时长', '出勤率', '学生规模']
+
+        # 数据归一化
+        norm_data = radar_values_from_statistics(major_statistics, "大数据管理")
+
+        show_cached_figure(
+            "major_radar:大数据管理",
+            frame_fingerprint(major_statistics),
+            lambda: plot_major_radar(norm_data, categories, '大数据管理专业综合表现雷达图')
+        )
+    else:
+        st.info("当前数据中未包含「大数据管理」专业")
+
+render_lazy_sections(
+    {
+        "📊 综合对比": render_comparison_section,
+        "👥 性别分布": render_gender_section,
+        "📚 专业详情": render_major_detail_section,
+        "🎯 专项分析": render_special_section
+    },
+    key="analysis_section"
+)
@@ -0,0 +1,107 @@
+# ---------------------- 界面4：模型洞察 ----------------------
+# 由 Final_project.py 的 st.navigation 调度，切换到本页时只执行本文件。
+# 特征重要性与部分依赖在训练时随模型一起计算并保存，这里只读取结果绘图
+import numpy as np
+import pandas as pd
+import streamlit as st
+
+from app_services import show_cached_figure
+from figure_cache import frame_fingerprint
+from student_model import DEFAULT_MAX_DEPTH
+from student_what_if import SENSITIVITY_SPECS
+from training_metrics import read_metrics
+from ui_components import load_shared_resources
+
+app_resources = load_shared_resources()
+model_bundle = app_resources.model_registry.current()
+
+st.markdown('<h1 class="main-title">🧠 模型洞察</h1>', unsafe_allow_html=True)
+st.markdown("---")
+
+from student_charts import plot_feature_importances, plot_latency_accuracy, plot_partial_dependence
+
+model_insights = model_bundle.insights
+if model_insights is None:
+    st.info("当前模型尚未生成洞察数据，重新训练模型后即可查看")
+else:
+    st.caption(
+        f"模型版本 {model_bundle.version}，基于 {model_insights['sample_rows']} 条训练样本计算"
+        f"（训练时耗时 {model_insights['compute_seconds']}s）"
+    )
+
+    st.markdown('<h3 style="color:#2196F3;">📊 特征重要性</h3>', unsafe_allow_html=True)
+    if not model_insights["importances"]:
+        # 没有 feature_importances_ 的模型（如梯度提升）保存的是空列表
+        st.info("当前模型不提供特征重要性（如梯度提升模型），请参考下方的部分依赖曲线")
+    else:
+        show_cached_figure(
+            "feature_importances",
+            model_bundle.version,
+            lambda: plot_feature_importances(model_insights["importances"])
+        )
+        importance_df = pd.DataFrame(model_insights["importances"])
+        importance_df["重要性"] = importance_df["重要性"].map(lambda v: f"{v:.2%}")
+        st.dataframe(importance_df, use_container_width=True, hide_index=True)
+
+    st.markdown('<h3 style="color:#2196F3;">📈 部分依赖</h3>', unsafe_allow_html=True)
+    if not model_insights["partial_dependence"]:
+        st.info("当前模型没有部分依赖数据，重新训练模型后即可查看")
+    else:
+        # 百分比特征以界面上的百分数展示
+        pdp_curves = {
+            col: (np.asarray(curve["grid"]) / SENSITIVITY_SPECS[col]["scale"], curve["mean"])
+            for col, curve in model_insights["partial_dependence"].items()
+        }
+        pdp_labels = {col: SENSITIVITY_SPECS[col]["label"] for col in pdp_curves}
+        show_cached_figure(
+            "partial_dependence",
+            model_bundle.version,
+            lambda: plot_partial_dependence(pdp_curves, pdp_labels)
+        )
+        st.caption("部分依赖：把该特征固定为横轴取值、其余特征保持样本原值时，模型预测成绩的平均值")
+
+# 训练记录：应用训练、增量扫描与交叉验证的耗时和MAE（命令行 train_pipeline.py 的结果也在这里）
+st.markdown("---")
+st.markdown('<h3 style="color:#2196F3;">⏱️ 训练记录</h3>', unsafe_allow_html=True)
+
+sweep_col1, sweep_col2 = st.columns([3, 1])
+with sweep_col1:
+    sweep_depth = st.select_slider("扫描深度", options=[4, 6, 8, 10, 12, 15], value=DEFAULT_MAX_DEPTH)
+with sweep_col2:
+    run_sweep = st.button("▶️ 运行增量扫描", use_container_width=True)
+if run_sweep:
+    # 训练流水线（sklearn）只在真正运行扫描时导入
+    from train_pipeline import DEFAULT_TREE_STEPS, incremental_sweep
+
+    with st.status(f"正在扫描深度 {sweep_depth}（树的数量 {list(DEFAULT_TREE_STEPS)}）...") as sweep_status:
+        incremental_sweep(
+            app_resources.df, sweep_depth, DEFAULT_TREE_STEPS,
+            data_fingerprint=app_resources.data_fingerprint,
+            progress_fn=lambda r: sweep_status.write(
+                f"{r['n_estimators']} 棵树：MAE {r['mae']:.3f}，单行 {r['single_row_ms']:.2f} ms"
+            )
+        )
+        sweep_status.update(label="扫描完成", state="complete")
+
+sweep_records = read_metrics(kind="sweep")
+if sweep_records:
+    sweep_df = pd.DataFrame(sweep_records)
+    # 每个 (深度, 树的数量) 只保留最近一次的结果
+    sweep_df = sweep_df.drop_duplicates(subset=["max_depth", "n_estimators"], keep="last")
+    show_cached_figure(
+        "latency_accuracy",
+        frame_fingerprint(sweep_df[["max_depth", "n_estimators", "single_row_ms", "mae"]]),
+        lambda: plot_latency_accuracy(sweep_df)
+    )
+else:
+    st.info("暂无增量扫描记录：点击上方按钮，或运行 python train_pipeline.py sweep")
+
+history = read_metrics()
+if history:
+    history_df = pd.DataFrame(history[-20:][::-1])
+    history_columns = [
+        col for col in ["logged_at", "kind", "n_estimators", "max_depth", "n_cores",
+                        "fit_seconds", "wall_seconds", "predict_seconds", "mae"]
+        if col in history_df.columns
+    ]
+    st.dataframe(history_df[history_columns], use_container_width=True, hide_index=True)
@@ -0,0 +1,143 @@
+# ---------------------- 界面1：项目概述 ----------------------
+# 由 Final_project.py 的 st.navigation 调度，切换到本页时只执行本文件。
+# 数据指标来自进程级缓存的 专业 × 性别 聚合立方体，不扫描全量数据。
+import pandas as pd
+import streamlit as st
+
+from data_loader import CORE_DATA_COLUMNS
+from student_analytics import overall_summary_from_cube
+from ui_components import load_shared_resources
+
+app_resources = load_shared_resources()
+overall_summary = overall_summary_from_cube(app_resources.major_cube)
+
+# 主标题
+st.markdown('<h1 class="main-title">🎓 智能学生成绩分析预测平台</h1>', unsafe_allow_html=True)
+st.markdown("---")
+
+# 简介卡片
+st.markdown("""
+    <div style="background:linear-gradient(135deg, #4169E1 0%, #1E40AF 100%); 
+                color:white; padding:30px; border-radius:15px; margin-bottom:30px; box-shadow: 0 6px 15px rgba(65, 105, 225, 0.3);">
+        <h2 style="color:white; margin-top:0; text-shadow: 1px 1px 2px rgba(0,0,0,0.3);">📈 数据驱动的学业分析平台</h2>
+        <p style="font-size:1.1rem; color:#f0f0f0;">基于机器学习技术，为学生成绩提供精准分析与智能预测，帮助教师和学生更好地理解学业表现。</p>
+    </div>
+""", unsafe_allow_html=True)
+
+# 功能概览 - 使用卡片布局
+st.markdown('<h2 class="sub-title">✨ 核心功能模块</h2>', unsafe_allow_html=True)
+
+col1, col2 = st.columns(2, gap="large")
+
+with col1:
+    st.markdown("""
+        <div class="custom-card">
+            <h3 style="color:#2196F3; margin-top:0;">📊 专业数据分析</h3>
+            <ul style="color:#333;">
+                <li><b>📋 核心指标汇总</b> - 各专业学业表现总览</li>
+                <li><b>👥 性别分布分析</b> - 双层柱状图展示</li>
+                <li><b>📈 成绩趋势分析</b> - 期中期末对比折线图</li>
+                <li><b>✅ 出勤率分析</b> - 各专业出勤情况统计</li>
+                <li><b>🎯 专业专项分析</b> - 大数据管理等专业深度分析</li>
+            </ul>
+        </div>
+    """, unsafe_allow_html=True)
+
+with col2:
+    st.markdown("""
+        <div class="custom-card">
+            <h3 style="color:#4CAF50; margin-top:0;">🔮 AI成绩预测</h3>
+            <ul style="color:#333;">
+                <li><b>🤖 智能预测模型</b> - 基于随机森林算法</li>
+                <li><b>📝 个性化输入</b> - 学生信息定制化录入</li>
+                <li><b>🎯 精准预测</b> - 期末成绩智能预测</li>
+                <li><b>📊 结果可视化</b> - 直观图表展示</li>
+                <li><b>💡 学习建议</b> - 个性化改进方案</li>
+            </ul>
+        </div>
+    """, unsafe_allow_html=True)
+
+# 数据指标展示
+st.markdown('<h2 class="sub-title">📋 数据概览</h2>', unsafe_allow_html=True)
+
+# 创建指标卡片 - 使用宝石蓝主题
+col1, col2, col3, col4 = st.columns(4)
+
+with col1:
+    st.markdown(f"""
+        <div style="background: linear-gradient(135deg, #4169E1 0%, #1E40AF 100%); 
+                    color: white; padding: 20px; border-radius: 12px; box-shadow: 0 4px 10px rgba(65, 105, 225, 0.3); 
+                    margin: 5px; text-align: center;">
+            <h4 style="color:#f0f0f0; margin:0 0 10px 0;">👥 总学生数</h4>
+            <h2 style="color:#FFD700; margin:0; text-shadow: 1px 1px 2px rgba(0,0,0,0.3);">{overall_summary['学生人数']}</h2>
+        </div>
+    """, unsafe_allow_html=True)
+
+with col2:
+    st.markdown(f"""
+        <div style="background: linear-gradient(135deg, #4169E1 0%, #1E40AF 100%); 
+                    color: white; padding: 20px; border-radius: 12px; box-shadow: 0 4px 10px rgba(65, 105, 225, 0.3); 
+                    margin: 5px; text-align: center;">
+            <h4 style="color:#f0f0f0; margin:0 0 10px 0;">🎓 专业数量</h4>
+            <h2 style="color:#FFD700; margin:0; text-shadow: 1px 1px 2px rgba(0,0,0,0.3);">{overall_summary['专业数量']}</h2>
+        </div>
+    """, unsafe_allow_html=True)
+
+with col3:
+    avg_score = overall_summary['期末平均分']
+    st.markdown(f"""
+        <div style="background: linear-gradient(135deg, #4169E1 0%, #1E40AF 100%); 
+                    color: white; padding: 20px; border-radius: 12px; box-shadow: 0 4px 10px rgba(65, 105, 225, 0.3); 
+                    margin: 5px; text-align: center;">
+            <h4 style="color:#f0f0f0; margin:0 0 10px 0;">📊 平均期末分</h4>
+            <h2 style="color:#FFD700; margin:0; text-shadow: 1px 1px 2px rgba(0,0,0,0.3);">{avg_score:.1f}</h2>
+        </div>
+    """, unsafe_allow_html=True)
+
+with col4:
+    avg_attendance = overall_summary['平均出勤率'] * 100
+    st.markdown(f"""
+        <div style="background: linear-gradient(135deg, #4169E1 0%, #1E40AF 100%); 
+                    color: white; padding: 20px; border-radius: 12px; box-shadow: 0 4px 10px rgba(65, 105, 225, 0.3); 
+                    margin: 5px; text-align: center;">
+            <h4 style="color:#f0f0f0; margin:0 0 10px 0;">✅ 平均出勤率</h4>
+            <h2 style="color:#FFD700; margin:0; text-shadow: 1px 1px 2px rgba(0,0,0,0.3);">{avg_attendance:.1f}%</h2>
+        </div>
+    """, unsafe_allow_html=True)
+
+# 数据字段说明
+st.markdown('<h2 class="sub-title">📄 数据字段说明</h2>', unsafe_allow_html=True)
+
+fields_data = {
+    "字段名": CORE_DATA_COLUMNS,
+    "说明": [
+        "学生唯一标识符",
+        "学生性别信息",
+        "所学专业名称",
+        "每周平均学习时间(小时)",
+        "课程出勤百分比(0-100%)",
+        "期中考试成绩(0-100分)",
+        "作业完成百分比(0-100%)",
+        "期末考试成绩(0-100分)"
+    ],
+    "类型": [
+        "字符串",
+        "分类",
+        "分类",
+        "数值",
+        "百分比",
+        "分数",
+        "百分比",
+        "分数"
+    ]
+}
+
+# 以HTML表格展示：DataFrame.style（Styler）会导入 matplotlib，不应出现在首页的首次运行路径上
+fields_df = pd.DataFrame(fields_data)
+st.markdown("""
+<style>
+    .fields-table { width: 100%; border-collapse: collapse; }
+    .fields-table th, .fields-table td { padding: 6px 10px; border: 1px solid #ddd; text-align: left; }
+    .fields-table td:first-child { background-color: #4169E1; color: white; font-weight: bold; }
+</style>
+""" + fields_df.to_html(index=False, classes="fields-table", border=0), unsafe_allow_html=True)
@@ -0,0 +1,359 @@
+# ---------------------- 界面3：期末成绩预测 ----------------------
+# 由 Final_project.py 的 st.navigation 调度，切换到本页时只执行本文件。
+import streamlit as st
+
+from app_services import get_micro_batcher, get_prediction_cache, show_cached_figure
+from figure_cache import frame_fingerprint
+from student_analytics import major_statistics_from_cube, overall_summary_from_cube
+from student_model import INTERACTIVE_PROFILE
+from student_what_if import PASS_SCORE, SENSITIVITY_SPECS, minimal_changes_to_pass, sensitivity_curves
+from ui_components import (
+    display_result_image,
+    load_shared_resources,
+    render_batch_prediction,
+    resolve_model_profile,
+    select_model_profile
+)
+
+app_resources = load_shared_resources()
+model_registries = app_resources.model_registries
+# 表单选项取默认档案模型的编码器（各档案在同一份数据上训练，分类取值一致）
+feature_encoder = app_resources.model_registry.current().encoder
+
+st.markdown('<h1 class="main-title">🔮 AI成绩预测系统</h1>', unsafe_allow_html=True)
+st.markdown("---")
+
+# 创建两列布局
+col_input, col_result = st.columns([1, 1.5], gap="large")
+
+with col_input:
+    st.markdown('<div class="custom-card">', unsafe_allow_html=True)
+    st.markdown('<h3 style="color:#2196F3; margin-top:0;">📝 学生信息录入</h3>', unsafe_allow_html=True)
+
+    # 表单设计
+    with st.form("prediction_form", border=False):
+        # 学生基本信息
+        st.markdown("**👤 基本信息**")
+        col_id, col_gender = st.columns(2)
+        with col_id:
+            student_id = st.text_input(
+                "学号",
+                placeholder="请输入学号",
+                help="学生的唯一标识"
+            )
+        with col_gender:
+            gender = st.radio(
+                "性别",
+                options=feature_encoder.categories["性别"],
+                horizontal=True
+            )
+
+        major = st.selectbox(
+            "专业",
+            options=feature_encoder.categories["专业"],
+            help="选择学生所学专业"
+        )
+
+        st.markdown("---")
+        st.markdown("**📊 学业表现**")
+
+        # 学习时长
+        study_hours = st.slider(
+            "每周学习时长(小时)",
+            min_value=0.0,
+            max_value=50.0,
+            value=20.0,
+            step=0.5,
+            help="每周投入学习的总时间"
+        )
+
+        # 出勤率
+        attendance = st.slider(
+            "上课出勤率(%)",
+            min_value=0.0,
+            max_value=100.0,
+            value=85.0,
+            step=1.0,
+            format="%.0f%%",
+            help="按时上课的比例"
+        )
+
+        # 期中成绩
+        midterm_score = st.slider(
+            "期中考试分数",
+            min_value=0,
+            max_value=100,
+            value=75,
+            step=1,
+            help="期中考试成绩"
+        )
+
+        # 作业完成率
+        homework_rate = st.slider(
+            "作业完成率(%)",
+            min_value=0.0,
+            max_value=100.0,
+            value=90.0,
+            step=1.0,
+            format="%.0f%%",
+            help="按时完成作业的比例"
+        )
+
+        st.markdown("---")
+        # 交互预测默认使用单行延迟最低的档案
+        selected_profile = select_model_profile(
+            model_registries, "🤖 预测模型", INTERACTIVE_PROFILE, key="form_profile"
+        )
+
+        # 提交按钮
+        submit_col1, submit_col2 = st.columns([3, 1])
+        with submit_col1:
+            submit_btn = st.form_submit_button(
+                "🚀 开始AI预测",
+                use_container_width=True,
+                type="primary"
+            )
+
+    st.markdown('</div>', unsafe_allow_html=True)
+
+    # 添加示例数据提示
+    with st.expander("💡 示例数据参考", expanded=False):
+        st.info("**优秀学生示例：**")
+        st.markdown("- 学习时长: 25-35小时/周")
+        st.markdown("- 出勤率: 90-100%")
+        st.markdown("- 期中成绩: 85-95分")
+        st.markdown("- 作业完成率: 95-100%")
+
+        st.info("**待提升学生示例：**")
+        st.markdown("- 学习时长: 5-15小时/周")
+        st.markdown("- 出勤率: 60-75%")
+        st.markdown("- 期中成绩: 50-65分")
+        st.markdown("- 作业完成率: 70-85%")
+
+with col_result:
+    if submit_btn and student_id:
+        try:
+            # 编码输入：分类取值直接映射为特征列下标，写入预分配的特征矩阵
+            input_values = {
+                "性别": gender,
+                "专业": major,
+                "每周学习时长": study_hours,
+                "上课出勤率": attendance / 100,
+                "期中考试分数": midterm_score,
+                "作业完成率": homework_rate / 100
+            }
+            active_profile, active_bundle, prediction_model = resolve_model_profile(model_registries, selected_profile)
+            active_encoder = active_bundle.encoder
+            input_row = active_encoder.transform_row(input_values)
+
+            # 执行预测（相同输入在同一档案、同一模型版本下直接复用缓存的预测值；
+            # 未命中时交给微批处理器，与其他会话同时提交的请求合并为一次批量预测）
+            predicted_score = get_prediction_cache().get_or_predict(
+                active_bundle.version,
+                input_row,
+                lambda row: get_micro_batcher().predict(prediction_model, row),
+                profile=active_profile
+            )
+            predicted_score_rounded = round(predicted_score, 2)
+            is_passed = predicted_score_rounded >= PASS_SCORE
+
+            # 敏感性分析：四个数值特征的扫描点拼成一个矩阵，一次预测得到全部曲线
+            sensitivity = sensitivity_curves(prediction_model, active_encoder, input_values)
+
+            # 显示预测结果卡片
+            st.markdown('<div class="custom-card">', unsafe_allow_html=True)
+
+            # 学生信息概览
+            st.markdown('<h3 style="color:#2196F3; margin-top:0;">📋 学生信息概览</h3>', unsafe_allow_html=True)
+
+            info_col1, info_col2 = st.columns(2)
+            with info_col1:
+                st.markdown(f"""
+                    <div style="background: linear-gradient(135deg, #4169E1 0%, #1E40AF 100%); 
+                                color: white; padding: 15px; border-radius: 10px; margin: 5px 0;">
+                        <p style="color:#f0f0f0; margin:0 0 5px 0; font-size:0.9rem;">🎓 专业</p>
+                        <h4 style="color:#FFD700; margin:0;">{major}</h4>
+                    </div>
+                """, unsafe_allow_html=True)
+
+                st.markdown(f"""
+                    <div style="background: linear-gradient(135deg, #4169E1 0%, #1E40AF 100%); 
+                                color: white; padding: 15px; border-radius: 10px; margin: 5px 0;">
+                        <p style="color:#f0f0f0; margin:0 0 5px 0; font-size:0.9rem;">📚 学习时长</p>
+                        <h4 style="color:#FFD700; margin:0;">{study_hours}小时/周</h4>
+                    </div>
+                """, unsafe_allow_html=True)
+
+            with info_col2:
+                st.markdown(f"""
+                    <div style="background: linear-gradient(135deg, #4169E1 0%, #1E40AF 100%); 
+                                color: white; padding: 15px; border-radius: 10px; margin: 5px 0;">
+                        <p style="color:#f0f0f0; margin:0 0 5px 0; font-size:0.9rem;">🚻 性别</p>
+                        <h4 style="color:#FFD700; margin:0;">{gender}</h4>
+                    </div>
+                """, unsafe_allow_html=True)
+
+                st.markdown(f"""
+                    <div style="background: linear-gradient(135deg, #4169E1 0%, #1E40AF 100%); 
+                                color: white; padding: 15px; border-radius: 10px; margin: 5px 0;">
+                        <p style="color:#f0f0f0; margin:0 0 5px 0; font-size:0.9rem;">✅ 出勤率</p>
+                        <h4 style="color:#FFD700; margin:0;">{attendance:.0f}%</h4>
+                    </div>
+                """, unsafe_allow_html=True)
+
+            st.markdown("---")
+
+            # 预测结果展示
+            st.markdown('<h3 style="color:#2196F3; margin-top:0;">🎯 AI预测结果</h3>', unsafe_allow_html=True)
+
+            # 分数展示 - 使用宝石蓝背景
+            score_color = "#4CAF50" if is_passed else "#F44336"
+            score_bg = "#4169E1" if is_passed else "#D32F2F"
+            score_emoji = "🎉" if is_passed else "💪"
+            score_text = "通过" if is_passed else "未通过"
+
+            st.markdown(f"""
+                <div style="background: linear-gradient(135deg, {score_bg} 0%, {score_bg}80 100%); 
+                            padding:20px; border-radius:12px; border:2px solid rgba(255,255,255,0.3); 
+                            text-align:center; margin:15px 0; box-shadow: 0 4px 15px rgba(65, 105, 225, 0.4);">
+                    <h2 style="color:white; margin:0; text-shadow: 1px 1px 2px rgba(0,0,0,0.3);">{score_emoji} {predicted_score_rounded}分</h2>
+                    <h3 style="color:#FFD700; margin:10px 0; text-shadow: 1px 1px 2px rgba(0,0,0,0.3);">{score_text} (及格线: 60分)</h3>
+                    <p style="color:#f0f0f0; margin:0;">预测准确率: ±3分</p>
+                </div>
+            """, unsafe_allow_html=True)
+
+            # 显示结果图片
+            display_result_image(is_passed, predicted_score_rounded)
+
+            st.markdown("---")
+
+            # 分析与建议
+            st.markdown('<h3 style="color:#2196F3; margin-top:0;">💡 学习分析与建议</h3>', unsafe_allow_html=True)
+
+            if is_passed:
+                st.success("**🎊 优秀表现！**")
+                st.markdown("""
+                    基于你的数据，AI分析显示：
+                    - ✅ **学习习惯良好**：保持当前的学习节奏
+                    - ✅ **课堂参与度高**：继续保持高出勤率
+                    - ✅ **作业完成优秀**：作业完成率表现良好
+
+                    **💪 继续保持建议：**
+                    1. **深化学习内容** - 尝试挑战更高难度的学习内容
+                    2. **参与课堂互动** - 积极提问和参与讨论
+                    3. **帮助其他同学** - 分享学习经验和方法
+                    4. **拓展知识面** - 学习相关领域的补充知识
+                """)
+            else:
+                st.warning("**📝 需要改进**")
+
+                # 针对性建议：由模型给出单独调整每一项达到及格线所需的最小改动
+                pass_changes = minimal_changes_to_pass(sensitivity, input_values)
+                if not pass_changes.empty:
+                    st.markdown("**📊 改进方向（单独调整一项即可及格）：**")
+                    for _, change in pass_changes.iterrows():
+                        st.markdown(
+                            f"- **{change['特征']}** - 当前{change['当前值']:.1f}，"
+                            f"调整到{change['所需值']:.1f}（{change['调整量']:+.1f}）"
+                            f"预计可得{change['预测分数']:.1f}分"
+                        )
+                else:
+                    st.markdown("**📊 改进方向：** 单独调整任何一项都难以及格，需要多方面同时提升")
+
+                st.markdown("""
+                    **🚀 学习策略建议：**
+                    1. **制定学习计划** - 每周制定详细的学习时间表
+                    2. **课前预习** - 提前预习课程内容，提高课堂效率
+                    3. **课后复习** - 及时复习巩固知识点
+                    4. **寻求帮助** - 遇到困难时及时向老师或同学请教
+                """)
+
+            st.markdown("---")
+
+            # 成绩敏感性曲线：每项输入在滑块范围内变化时的预测成绩
+            from student_charts import plot_sensitivity_curves
+            st.markdown('<h3 style="color:#2196F3; margin-top:0;">🔍 成绩敏感性分析</h3>', unsafe_allow_html=True)
+            sensitivity_labels = {col: spec["label"] for col, spec in SENSITIVITY_SPECS.items()}
+            current_ui_values = {
+                col: input_values[col] / spec["scale"] for col, spec in SENSITIVITY_SPECS.items()
+            }
+            show_cached_figure(
+                "sensitivity_curves",
+                frame_fingerprint(*sensitivity.values()) + f":{current_ui_values}",
+                lambda: plot_sensitivity_curves(sensitivity, sensitivity_labels, current_ui_values, PASS_SCORE)
+            )
+            st.caption("每条曲线只改变对应的一项输入，其余输入保持当前取值")
+
+            st.markdown("---")
+
+            # 数据对比 - 使用宝石蓝主题
+            st.markdown('<h3 style="color:#2196F3; margin-top:0;">📈 数据对比分析</h3>', unsafe_allow_html=True)
+
+            # 计算对比数据
+            # 对比数据取自聚合立方体（随源文件的追加写入增量更新）
+            major_cube = app_resources.major_cube
+            major_avg = major_statistics_from_cube(major_cube)["期末平均分"].get(major, float("nan"))
+            overall_avg = overall_summary_from_cube(major_cube)["期末平均分"]
+
+            # 使用st.columns展示对比
+            comp_col1, comp_col2, comp_col3 = st.columns(3)
+            with comp_col1:
+                st.markdown(f"""
+                    <div style="background: linear-gradient(135deg, #4169E1 0%, #1E40AF 100%); 
+                                text-align:center; padding:15px; color:white; border-radius:10px;">
+                        <p style="margin:0; font-weight:bold; color:#f0f0f0;">你的分数</p>
+                        <h3 style="margin:5px 0; color:#FFD700;">{predicted_score_rounded}</h3>
+                    </div>
+                """, unsafe_allow_html=True)
+
+            with comp_col2:
+                st.markdown(f"""
+                    <div style="background: linear-gradient(135deg, #4169E1 0%, #1E40AF 100%); 
+                                text-align:center; padding:15px; color:white; border-radius:10px;">
+                        <p style="margin:0; font-weight:bold; color:#f0f0f0;">专业平均</p>
+                        <h3 style="margin:5px 0; color:#FFD700;">{major_avg:.1f}</h3>
+                    </div>
+                """, unsafe_allow_html=True)
+
+            with comp_col3:
+                st.markdown(f"""
+                    <div style="background: linear-gradient(135deg, #4169E1 0%, #1E40AF 100%); 
+                                text-align:center; padding:15px; color:white; border-radius:10px;">
+                        <p style="margin:0; font-weight:bold; color:#f0f0f0;">全校平均</p>
+                        <h3 style="margin:5px 0; color:#FFD700;">{overall_avg:.1f}</h3>
+                    </div>
+                """, unsafe_allow_html=True)
+
+            st.markdown('</div>', unsafe_allow_html=True)
+
+            # 成功效果
+            if is_passed:
+                st.balloons()
+                st.snow()
+
+        except Exception as e:
+            st.error(f"预测失败：{str(e)}")
+            st.info("请检查输入数据是否完整有效")
+
+    else:
+        # 初始状态显示
+        st.markdown('<div class="custom-card">', unsafe_allow_html=True)
+        st.markdown("""
+            <div style="text-align:center; padding:50px 20px;">
+                <span style="font-size:60px; color:#ddd;">🤖</span>
+                <h3 style="color:#666; margin:20px 0;">等待预测请求</h3>
+                <p style="color:#888;">请在左侧输入学生信息后，点击「开始AI预测」按钮</p>
+                <div style="margin-top:30px; padding:20px; background:#f8f9fa; border-radius:10px;">
+                    <h4 style="color:#2196F3;">💡 使用说明</h4>
+                    <p style="color:#666; text-align:left;">1. 完整填写左侧所有学生信息</p>
+                    <p style="color:#666; text-align:left;">2. 滑动调整器设置准确的学业表现数据</p>
+                    <p style="color:#666; text-align:left;">3. 点击「开始AI预测」按钮获取预测结果</p>
+                    <p style="color:#666; text-align:left;">4. 查看详细的预测分析和个性化建议</p>
+                </div>
+            </div>
+        """, unsafe_allow_html=True)
+        st.markdown('</div>', unsafe_allow_html=True)
+
+# 批量预测（整批学生一次性评分）
+st.markdown("---")
+render_batch_prediction(model_registries)
@@ -0,0 +1,220 @@
+# ---------------------- 进程级共享服务（所有浏览器会话共用）----------------------
+# 通过 st.cache_resource 在整个进程内只保留一份数据和模型，各会话拿到的是同一个只读对象，
+# 而不是每个会话各自持有一份拷贝。run_app.py 在服务启动时调用 warm_up() 预先加载。
+# 学生数据监听 student.csv 的追加写入并增量更新；每次运行通过 get_app_resources() 取最新的数据快照。
+import os
+import sys
+import time
+from collections import deque
+from typing import NamedTuple
+
+try:
+    import resource
+except ImportError:  # Windows 下没有 resource 模块
+    resource = None
+
+import pandas as pd
+import streamlit as st
+from streamlit.runtime.scriptrunner import get_script_run_ctx
+
+from figure_cache import FigureCache
+from micro_batcher import DEFAULT_MAX_BATCH_SIZE, DEFAULT_WINDOW_MS, MicroBatcher
+from prediction_cache import PredictionCache
+from student_ingest import LiveStudentDataset
+from student_model import DEFAULT_PROFILE, RETRAIN_GROWTH_FRACTION, create_model_registries
+
+# 开启写时复制：会话内对共享数据的任何修改都只作用于局部副本，不会污染共享数据
+pd.set_option("mode.copy_on_write", True)
+
+# 超过该时长未活动的会话不再计入活跃会话数（秒）
+SESSION_IDLE_TIMEOUT = 30 * 60
+
+# 单行预测微批处理的等待窗口（毫秒）与最大批量，可通过环境变量调整
+MICRO_BATCH_WINDOW_MS = float(os.environ.get("STUDENT_MICRO_BATCH_WINDOW_MS", DEFAULT_WINDOW_MS))
+MICRO_BATCH_MAX_SIZE = int(os.environ.get("STUDENT_MICRO_BATCH_MAX_SIZE", DEFAULT_MAX_BATCH_SIZE))
+
+# 每个页面保留最近多少次运行耗时用于统计
+PAGE_TIMING_WINDOW = 200
+
+# 各会话检查共享数据是否有更新的间隔（秒）
+DATA_POLL_SECONDS = 2
+
+
+@st.cache_resource(show_spinner=False)
+def get_student_dataset(csv_path="student.csv"):
+    """获取进程内共享的紧凑学生数据（分类编码 + int32学号 + float32指标），
+    并开始监听源文件：追加的新行增量并入数据与聚合立方体"""
+    dataset = LiveStudentDataset(csv_path)
+    dataset.start_watching()
+    return dataset
+
+
+class AppResources(NamedTuple):
+    """本次运行使用的只读句柄：数据快照（df / 指纹 / 专业 × 性别 聚合立方体 / 版本号）与共享模型。
+    模型通过 model_registry.current() 获取（可能被后台重训替换）；
+    model_registries 为 {档案名: 注册表}，model_registry 为其中的默认档案"""
+    df: pd.DataFrame
+    data_fingerprint: str
+    major_cube: pd.DataFrame
+    data_version: int
+    model_registry: object
+    model_registries: dict
+
+
+def _retrain_on_growth(registries):
+    """数据更新回调：新行累计达到 RETRAIN_GROWTH_FRACTION 时让各档案在后台重训"""
+    state = {"trained_rows": None, "new_rows": 0}
+
+    def on_update(snapshot, new_rows):
+        if state["trained_rows"] is None:
+            state["trained_rows"] = len(snapshot.df) - new_rows
+        state["new_rows"] += new_rows
+        if state["new_rows"] < RETRAIN_GROWTH_FRACTION * max(state["trained_rows"], 1):
+            return
+        for registry in registries.values():
+            registry.ensure_fresh(snapshot.df, snapshot.fingerprint)
+        state["trained_rows"] = len(snapshot.df)
+        state["new_rows"] = 0
+
+    return on_update
+
+
+@st.cache_resource(show_spinner="正在初始化系统...")
+def get_model_registries(csv_path="student.csv"):
+    """进程级模型注册表：{档案名: 注册表}"""
+    dataset = get_student_dataset(csv_path)
+    snapshot = dataset.current()
+    registries = create_model_registries(snapshot.df, snapshot.fingerprint)
+    dataset.add_listener(_retrain_on_growth(registries))
+    return registries
+
+
+def get_app_resources(csv_path="student.csv"):
+    """返回最新的共享数据快照与预测模型（数据与模型本身只加载一次，这里只组装句柄）"""
+    snapshot = get_student_dataset(csv_path).current()
+    model_registries = get_model_registries(csv_path)
+    return AppResources(
+        df=snapshot.df,
+        data_fingerprint=snapshot.fingerprint,
+        major_cube=snapshot.major_cube,
+        data_version=snapshot.version,
+        model_registry=model_registries[DEFAULT_PROFILE],
+        model_registries=model_registries
+    )
+
+
+def warm_up(csv_path="student.csv"):
+    """预热注册表（在服务启动时调用，使首个访问者无需等待加载/训练）"""
+    start = time.perf_counter()
+    resources = get_app_resources(csv_path)
+    registry = resources.model_registry
+    print(
+        f"[warm_up] 已加载 {len(resources.df)} 条学生数据与预测模型 {registry.current().version}"
+        f"{'（模型已过期，后台重新训练中）' if registry.is_retraining else ''}"
+        f"，耗时 {time.perf_counter() - start:.2f}s",
+        flush=True
+    )
+    for profile, profile_registry in resources.model_registries.items():
+        # 非默认档案延迟到首次选用时加载，这里不触发加载
+        if profile_registry.is_loaded and not profile_registry.is_ready:
+            print(f"[warm_up] 模型档案 {profile} 尚无可用模型，后台训练中", flush=True)
+    return resources
+
+
+@st.cache_resource(show_spinner=False)
+def get_figure_cache():
+    """进程级图表渲染缓存（PNG字节，LRU + 字节预算）"""
+    return FigureCache()
+
+
+def show_cached_figure(chart_id, data_fingerprint, render_fn):
+    """按 (图表ID, 数据指纹, 主题) 取缓存的图表字节并展示，未命中时才构建并渲染"""
+    theme = st.get_option("theme.base") or "light"
+    image_bytes = get_figure_cache().get_or_render(chart_id, data_fingerprint, theme, render_fn)
+    st.image(image_bytes, use_container_width=True)
+
+
+@st.cache_resource(show_spinner=False)
+def get_prediction_cache():
+    """进程级单行预测缓存（键含模型版本，模型替换后自动失效）"""
+    return PredictionCache()
+
+
+@st.cache_resource(show_spinner=False)
+def get_micro_batcher():
+    """进程级单行预测微批处理器（各会话并发提交的单行预测合并为一次批量预测）"""
+    return MicroBatcher(MICRO_BATCH_WINDOW_MS, MICRO_BATCH_MAX_SIZE)
+
+
+@st.cache_resource(show_spinner=False)
+def _session_registry():
+    """记录各会话最近一次运行的时间：{session_id: timestamp}"""
+    return {}
+
+
+def track_session():
+    """登记当前会话，返回当前活跃会话数"""
+    registry = _session_registry()
+    now = time.time()
+    ctx = get_script_run_ctx()
+    if ctx is not None:
+        registry[ctx.session_id] = now
+    for session_id, last_seen in list(registry.items()):
+        if now - last_seen > SESSION_IDLE_TIMEOUT:
+            registry.pop(session_id, None)
+    return len(registry)
+
+
+@st.cache_resource(show_spinner=False)
+def _page_timing_registry():
+    """各页面最近若干次运行的耗时：{页面: deque[秒]}"""
+    return {}
+
+
+def record_page_run(page, seconds):
+    """记录一次页面运行（入口脚本 + 页面脚本）的耗时"""
+    _page_timing_registry().setdefault(page, deque(maxlen=PAGE_TIMING_WINDOW)).append(seconds)
+
+
+def page_timing_stats():
+    """各页面的运行次数与耗时分位数（毫秒），按页面首次运行的顺序排列"""
+    rows = []
+    for page, samples in list(_page_timing_registry().items()):
+        timings = sorted(samples)
+        if not timings:
+            continue
+        rows.append({
+            "页面": page,
+            "运行次数": len(timings),
+            "p50(ms)": timings[len(timings) // 2] * 1000,
+            "p95(ms)": timings[min(len(timings) - 1, int(len(timings) * 0.95))] * 1000,
+        })
+    return rows
+
+
+def current_rss_mb():
+    """当前进程的常驻内存（MB）；无法读取 /proc 时退回峰值RSS"""
+    try:
+        with open("/proc/self/status") as f:
+            for line in f:
+                if line.startswith("VmRSS:"):
+                    return int(line.split()[1]) / 1024
+    except OSError:
+        pass
+    if resource is None:
+        return float("nan")
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak / (1024 * 1024) if sys.platform == "darwin" else peak / 1024
+
+
+def memory_report(df):
+    """汇总共享数据占用、进程RSS与活跃会话数"""
+    session_count = track_session()
+    rss_mb = current_rss_mb()
+    return {
+        "frame_mb": df.memory_usage(deep=True).sum() / (1024 * 1024),
+        "rss_mb": rss_mb,
+        "sessions": session_count,
+        "rss_per_session_mb": rss_mb / session_count if session_count else rss_mb,
+        "pid": os.getpid(),
+    }
@@ -0,0 +1,93 @@
+# ---------------------- 学生数据加载基准测试 ----------------------
+# 每种加载方式在独立的子进程中运行，分别记录冷加载耗时与峰值内存（RSS）。
+# 用法：python bench_load.py [--csv student.csv] [--repeat 3]
+import argparse
+import json
+import os
+import resource
+import subprocess
+import sys
+import tempfile
+import time
+
+MODES = {
+    "legacy": "原逻辑：utf-8-sig 失败后以 gbk 重新解析全部列",
+    "sniffed": "探测编码，单次解析核心列并指定列类型",
+    "cached": "读取内存映射的Arrow缓存",
+}
+
+
+def _peak_rss_mb():
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux 下单位为KB，macOS 下单位为字节
+    return peak / (1024 * 1024) if sys.platform == "darwin" else peak / 1024
+
+
+def _run_mode(mode, csv_path, cache_dir):
+    """在当前进程中执行一次加载，返回耗时与峰值内存"""
+    import pandas as pd
+    import data_loader
+
+    baseline_rss = _peak_rss_mb()
+    start = time.perf_counter()
+    if mode == "legacy":
+        try:
+            df_raw = pd.read_csv(csv_path, encoding="utf-8-sig")
+        except UnicodeDecodeError:
+            df_raw = pd.read_csv(csv_path, encoding="gbk")
+        df_raw.columns = df_raw.columns.str.strip().str.replace(" ", "")
+        df = df_raw[data_loader.CORE_DATA_COLUMNS].dropna(axis=0, how="any")
+    elif mode == "sniffed":
+        df = data_loader.parse_student_csv(csv_path)
+    else:
+        df = data_loader.load_student_core(csv_path, cache_dir=cache_dir)
+    elapsed = time.perf_counter() - start
+
+    return {
+        "mode": mode,
+        "rows": len(df),
+        "seconds": elapsed,
+        "peak_rss_mb": _peak_rss_mb(),
+        "import_rss_mb": baseline_rss,
+        "frame_mb": df.memory_usage(deep=True).sum() / (1024 * 1024),
+    }
+
+
+def _run_in_subprocess(mode, csv_path, cache_dir):
+    output = subprocess.check_output(
+        [sys.executable, __file__, "--child", mode, "--csv", csv_path, "--cache-dir", cache_dir],
+        cwd=os.path.dirname(os.path.abspath(__file__)),
+    )
+    return json.loads(output.decode().strip().splitlines()[-1])
+
+
+def main():
+    parser = argparse.ArgumentParser(description="学生数据冷加载基准测试")
+    parser.add_argument("--csv", default="student.csv")
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--cache-dir", default=None)
+    parser.add_argument("--child", choices=sorted(MODES), help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.child:
+        print(json.dumps(_run_mode(args.child, args.csv, args.cache_dir)))
+        return
+
+    csv_path = os.path.abspath(args.csv)
+    with tempfile.TemporaryDirectory() as cache_dir:
+        # 预先生成缓存，使 cached 模式测得的是命中缓存的冷启动
+        _run_in_subprocess("cached", csv_path, cache_dir)
+
+        print(f"{'模式':<10}{'耗时(ms)':>12}{'峰值RSS(MB)':>14}{'加载增量(MB)':>14}{'DataFrame(MB)':>15}")
+        for mode in MODES:
+            runs = [_run_in_subprocess(mode, csv_path, cache_dir) for _ in range(args.repeat)]
+            best = min(runs, key=lambda r: r["seconds"])
+            print(
+                f"{mode:<10}{best['seconds'] * 1000:>12.1f}{best['peak_rss_mb']:>14.1f}"
+                f"{best['peak_rss_mb'] - best['import_rss_mb']:>14.1f}{best['frame_mb']:>15.2f}"
+                f"   {MODES[mode]}"
+            )
+
+
+if __name__ == "__main__":
+    main()
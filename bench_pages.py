@@ -0,0 +1,93 @@
+# ---------------------- 页面重跑耗时基准测试 ----------------------
+# 用 streamlit.testing.v1.AppTest 在进程内运行应用，依次切换到每个页面并多次重跑，
+# 记录每次重跑（入口脚本 + 页面脚本）的耗时。首次运行用于预热共享数据与模型，不计入统计。
+# 用法：python bench_pages.py [--app Final_project.py] [--repeat 10] [--json 结果.json]
+# 拆分为多页面之前的单脚本版本以 --legacy 运行（通过侧边栏单选框切换页面），例如：
+#   git worktree add ../before <拆分前的提交> && python bench_pages.py --app ../before/Final_project.py --legacy
+import argparse
+import json
+import os
+import statistics
+import time
+
+# (页面标题, app_pages 下的页面脚本, 拆分前侧边栏单选框的选项)
+PAGES = [
+    ("项目总览", "app_pages/overview.py", "📊 项目总览"),
+    ("专业数据分析", "app_pages/analysis.py", "📈 专业数据分析"),
+    ("成绩预测", "app_pages/prediction.py", "🔮 成绩预测"),
+    ("模型洞察", "app_pages/insights.py", "🧠 模型洞察"),
+]
+
+# 首次运行可能需要训练模型，超时放宽
+WARM_UP_TIMEOUT = 600
+
+
+def _timed_run(app_test, timeout):
+    start = time.perf_counter()
+    app_test.run(timeout=timeout)
+    elapsed = time.perf_counter() - start
+    if app_test.exception:
+        raise RuntimeError(f"页面运行出错：{app_test.exception[0].value}")
+    return elapsed
+
+
+def _switch(app_test, page_path, radio_label, legacy):
+    """切换页面：多页面版本调用 switch_page，拆分前的版本设置侧边栏单选框"""
+    if legacy:
+        app_test.sidebar.radio[0].set_value(radio_label)
+    else:
+        app_test.switch_page(page_path)
+
+
+def bench_pages(app_path, repeat, legacy=False, timeout=30):
+    """返回每个页面的重跑耗时统计（毫秒）"""
+    from streamlit.testing.v1 import AppTest
+
+    # 与 streamlit run 一致：以应用所在目录为工作目录，保证相对路径的数据文件可被找到
+    os.chdir(os.path.dirname(os.path.abspath(app_path)))
+    app_test = AppTest.from_file(os.path.basename(app_path), default_timeout=timeout)
+    _timed_run(app_test, WARM_UP_TIMEOUT)
+
+    results = []
+    for title, page_path, radio_label in PAGES:
+        # 切换后的第一次运行包含页面首次导入与图表渲染，单独记录
+        _switch(app_test, page_path, radio_label, legacy)
+        switch_seconds = _timed_run(app_test, timeout)
+        timings = [_timed_run(app_test, timeout) for _ in range(repeat)]
+        results.append({
+            "page": title,
+            "switch_ms": switch_seconds * 1000,
+            "rerun_p50_ms": statistics.median(timings) * 1000,
+            "rerun_min_ms": min(timings) * 1000,
+            "rerun_max_ms": max(timings) * 1000,
+            "repeat": repeat,
+        })
+    return results
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="各页面的重跑耗时基准测试")
+    parser.add_argument("--app", default="Final_project.py")
+    parser.add_argument("--repeat", type=int, default=10)
+    parser.add_argument("--timeout", type=float, default=30, help="单次运行的超时时间（秒）")
+    parser.add_argument("--legacy", action="store_true", help="拆分前的单脚本版本（侧边栏单选框导航）")
+    parser.add_argument("--json", default=None, help="把结果写入JSON文件")
+    args = parser.parse_args(argv)
+
+    json_path = os.path.abspath(args.json) if args.json else None
+    results = bench_pages(args.app, args.repeat, legacy=args.legacy, timeout=args.timeout)
+
+    print(f"{'页面':<12}{'切换(ms)':>12}{'重跑p50(ms)':>14}{'最快(ms)':>12}{'最慢(ms)':>12}")
+    for r in results:
+        print(
+            f"{r['page']:<12}{r['switch_ms']:>12.1f}{r['rerun_p50_ms']:>14.1f}"
+            f"{r['rerun_min_ms']:>12.1f}{r['rerun_max_ms']:>12.1f}"
+        )
+
+    if json_path:
+        with open(json_path, "w", encoding="utf-8") as f:
+            json.dump({"app": args.app, "legacy": args.legacy, "results": results}, f, ensure_ascii=False, indent=2)
+
+
+if __name__ == "__main__":
+    main()
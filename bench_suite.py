@@ -0,0 +1,224 @@
+# ---------------------- 多规模基准测试套件 ----------------------
+# 用 synth_data.py 为每个数据集生成指定规模的合成数据，依次测量：
+#   load（解析源文件）、clean（清洗/类型转换）、aggregate（页面用到的聚合）、
+#   train（模型训练）、single_predict（单行预测延迟）、batch_predict（整批预测吞吐量）。
+# 销售数据（9.py 仪表盘）没有模型，只测前三项。每个 (数据集, 规模) 的结果连同当前提交号
+# 追加一行到 JSONL 结果文件，便于比较不同提交之间的性能变化。
+# 用法：python bench_suite.py [--datasets student medical sales] [--scales 100000 1000000]
+#                             [--profile fast] [--max-train-rows 1000000] [--output bench_results.jsonl]
+import argparse
+import json
+import os
+import platform
+import subprocess
+import time
+
+import numpy as np
+import pandas as pd
+
+from data_loader import (
+    CORE_DATA_COLUMNS,
+    MEDICAL_DATA_COLUMNS,
+    MEDICAL_DTYPES,
+    SALES_HEADER_ROW,
+    STUDENT_PARSE_DTYPES,
+    clean_sales_frame,
+    coerce_numeric_columns,
+    compact_student_frame,
+    read_csv_sniffed,
+    read_excel_streaming
+)
+from feature_encoder import FeatureEncoder
+from sales_analytics import (
+    SalesFilterIndex,
+    build_sales_rollup,
+    product_sales_from_rollup,
+    sales_kpis_from_rollup,
+    weekly_sales_from_rollup
+)
+from student_analytics import build_major_cube, gender_dist_from_cube, major_statistics_from_cube
+from student_model import (
+    CATEGORICAL_COLUMNS,
+    benchmark_predictor,
+    build_estimator,
+    encode_training_frame,
+    holdout_split
+)
+from synth_data import DATASETS, write_dataset
+
+DEFAULT_SCALES = (100_000, 1_000_000)
+DEFAULT_OUTPUT = "bench_results.jsonl"
+MEDICAL_CATEGORICAL_COLUMNS = ["性别", "是否吸烟", "区域"]
+MEDICAL_TARGET_COLUMN = "医疗费用"
+
+
+def _timed(fn, *args, **kwargs):
+    start = time.perf_counter()
+    result = fn(*args, **kwargs)
+    return result, time.perf_counter() - start
+
+
+def _git_commit():
+    try:
+        return subprocess.check_output(
+            ["git", "rev-parse", "--short", "HEAD"],
+            cwd=os.path.dirname(os.path.abspath(__file__)),
+            stderr=subprocess.DEVNULL
+        ).decode().strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def _train_and_predict(X, y, encoder_frame, feature_columns, categorical_columns, profile, max_train_rows, seed):
+    """训练（超过 max_train_rows 时抽样训练）并测量单行延迟与整批吞吐量"""
+    if max_train_rows and len(X) > max_train_rows:
+        sample_index = np.random.default_rng(seed).choice(len(X), max_train_rows, replace=False)
+        X_fit, y_fit = X.iloc[sample_index], y.iloc[sample_index]
+    else:
+        X_fit, y_fit = X, y
+    X_train, _, y_train, _ = holdout_split(X_fit, y_fit)
+    model = build_estimator(profile)
+    _, train_seconds = _timed(model.fit, X_train, y_train)
+
+    encoder = FeatureEncoder.fit(encoder_frame, feature_columns, categorical_columns)
+    X_all, encode_seconds = _timed(encoder.transform_frame, encoder_frame)
+    benchmark = benchmark_predictor(model, X_all)
+    return {
+        "train": {"seconds": train_seconds, "train_rows": len(X_train)},
+        "single_predict": {
+            "p50_ms": benchmark["single_row_p50_ms"],
+            "p99_ms": benchmark["single_row_p99_ms"],
+        },
+        "batch_predict": {
+            "rows_per_second": benchmark["batch_rows_per_second"],
+            "encode_seconds": encode_seconds,
+        },
+    }
+
+
+def bench_student(path, profile, max_train_rows, seed):
+    stages = {}
+    df_raw, seconds = _timed(read_csv_sniffed, path, columns=CORE_DATA_COLUMNS, dtype=STUDENT_PARSE_DTYPES)
+    stages["load"] = {"seconds": seconds}
+
+    df, seconds = _timed(lambda: compact_student_frame(
+        coerce_numeric_columns(df_raw).dropna(axis=0, how="any").reset_index(drop=True)
+    ))
+    stages["clean"] = {"seconds": seconds, "frame_mb": df.memory_usage(deep=True).sum() / (1024 * 1024)}
+
+    def aggregate():
+        cube = build_major_cube(df)
+        return major_statistics_from_cube(cube), gender_dist_from_cube(cube)
+
+    _, seconds = _timed(aggregate)
+    stages["aggregate"] = {"seconds": seconds}
+
+    X, y = encode_training_frame(df)
+    stages.update(_train_and_predict(X, y, df, X.columns, CATEGORICAL_COLUMNS, profile, max_train_rows, seed))
+    return len(df), stages
+
+
+def bench_medical(path, profile, max_train_rows, seed):
+    stages = {}
+    df_raw, seconds = _timed(read_csv_sniffed, path, columns=MEDICAL_DATA_COLUMNS, dtype=MEDICAL_DTYPES)
+    stages["load"] = {"seconds": seconds}
+
+    df, seconds = _timed(lambda: df_raw.dropna(axis=0, how="any").reset_index(drop=True))
+    stages["clean"] = {"seconds": seconds, "frame_mb": df.memory_usage(deep=True).sum() / (1024 * 1024)}
+
+    _, seconds = _timed(
+        lambda: df.groupby(["区域", "是否吸烟"], observed=True)[MEDICAL_TARGET_COLUMN].agg(["mean", "count"])
+    )
+    stages["aggregate"] = {"seconds": seconds}
+
+    # 与 10.py 模型一致：独热编码（drop_first）
+    X = pd.get_dummies(
+        df.drop(columns=[MEDICAL_TARGET_COLUMN]), columns=MEDICAL_CATEGORICAL_COLUMNS, drop_first=True, dtype=int
+    )
+    y = df[MEDICAL_TARGET_COLUMN]
+    stages.update(_train_and_predict(X, y, df, X.columns, MEDICAL_CATEGORICAL_COLUMNS, profile, max_train_rows, seed))
+    return len(df), stages
+
+
+def bench_sales(path, profile, max_train_rows, seed):
+    stages = {}
+    df_raw, seconds = _timed(read_excel_streaming, path, header_row=SALES_HEADER_ROW)
+    stages["load"] = {"seconds": seconds}
+
+    df, seconds = _timed(clean_sales_frame, df_raw)
+    stages["clean"] = {"seconds": seconds, "frame_mb": df.memory_usage(deep=True).sum() / (1024 * 1024)}
+
+    def aggregate():
+        rollup = SalesFilterIndex(build_sales_rollup(df))
+        cells = rollup.filter(rollup.date_min, rollup.date_max, {})
+        return sales_kpis_from_rollup(cells), weekly_sales_from_rollup(cells), product_sales_from_rollup(cells)
+
+    _, seconds = _timed(aggregate)
+    stages["aggregate"] = {"seconds": seconds}
+    return len(df), stages
+
+
+BENCHMARKS = {
+    "student": bench_student,
+    "medical": bench_medical,
+    "sales": bench_sales,
+}
+
+
+def run_suite(datasets, scales, data_dir, profile, max_train_rows, seed, encoding=None):
+    """逐个 (数据集, 规模) 运行，产出结果记录"""
+    commit = _git_commit()
+    for dataset in datasets:
+        for rows in scales:
+            path, generate_seconds = _timed(write_dataset, dataset, rows, data_dir, seed, encoding)
+            loaded_rows, stages = BENCHMARKS[dataset](path, profile, max_train_rows, seed)
+            yield {
+                "logged_at": time.strftime("%Y-%m-%d %H:%M:%S"),
+                "commit": commit,
+                "dataset": dataset,
+                "rows": rows,
+                "loaded_rows": loaded_rows,
+                "file_mb": os.path.getsize(path) / (1024 * 1024),
+                "encoding": encoding or DATASETS[dataset][1],
+                "seed": seed,
+                "profile": profile,
+                "python": platform.python_version(),
+                "cpu_count": os.cpu_count(),
+                "generate_seconds": generate_seconds,
+                "stages": stages,
+            }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="各数据集在不同规模下的加载、聚合、训练与预测基准测试")
+    parser.add_argument("--datasets", nargs="+", choices=sorted(BENCHMARKS), default=list(BENCHMARKS))
+    parser.add_argument("--scales", nargs="+", type=int, default=list(DEFAULT_SCALES))
+    parser.add_argument("--data-dir", default=".bench_data")
+    parser.add_argument("--profile", default="fast", help="训练使用的模型档案（见 student_model.MODEL_PROFILES）")
+    parser.add_argument("--max-train-rows", type=int, default=1_000_000, help="训练抽样行数上限（0表示不抽样）")
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--encoding", default=None, help="CSV编码（默认与源文件一致）")
+    parser.add_argument("--output", default=DEFAULT_OUTPUT)
+    args = parser.parse_args(argv)
+
+    print(f"{'数据集':<10}{'行数':>12}{'加载(s)':>10}{'清洗(s)':>10}{'聚合(s)':>10}{'训练(s)':>10}{'单行p50(ms)':>14}{'批量(行/秒)':>14}")
+    for record in run_suite(args.datasets, args.scales, args.data_dir, args.profile,
+                            args.max_train_rows, args.seed, args.encoding):
+        with open(args.output, "a", encoding="utf-8") as f:
+            f.write(json.dumps(record, ensure_ascii=False) + "\n")
+        stages = record["stages"]
+        train = stages.get("train", {}).get("seconds")
+        single = stages.get("single_predict", {}).get("p50_ms")
+        batch = stages.get("batch_predict", {}).get("rows_per_second")
+        print(
+            f"{record['dataset']:<10}{record['rows']:>12,}{stages['load']['seconds']:>10.2f}"
+            f"{stages['clean']['seconds']:>10.2f}{stages['aggregate']['seconds']:>10.3f}"
+            f"{train if train is not None else float('nan'):>10.2f}"
+            f"{single if single is not None else float('nan'):>14.3f}"
+            f"{batch if batch is not None else float('nan'):>14,.0f}",
+            flush=True
+        )
+
+
+if __name__ == "__main__":
+    main()
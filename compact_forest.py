@@ -0,0 +1,100 @@
+# ---------------------- 紧凑随机森林（扁平节点数组 + numpy推理）----------------------
+# 把 RandomForestRegressor 的所有树展开为一个结构化节点数组，保存为 .npy 文件并以内存映射方式加载：
+# 多个 Streamlit 工作进程共享同一份只读页面，无需各自反序列化完整的 sklearn 模型。
+# 推理只依赖 numpy，所有树同时逐层下降，单行预测没有 sklearn 的参数校验与线程池开销。
+import os
+
+import numpy as np
+
+from feature_encoder import predict_matrix
+
+NODE_DTYPE = np.dtype([
+    ("feature", "<i4"),
+    ("threshold", "<f8"),
+    ("left", "<i4"),
+    ("right", "<i4"),
+    ("value", "<f8"),
+])
+
+
+class CompactForest:
+    """扁平化的回归森林；叶节点的左右子节点都指向自身，逐层下降到叶节点后保持不动"""
+
+    def __init__(self, nodes, roots):
+        self.nodes = nodes
+        self.roots = np.asarray(roots, dtype=np.intp)
+        # 结构化数组的字段视图（内存映射时不会产生拷贝）
+        self._feature = nodes["feature"]
+        self._threshold = nodes["threshold"]
+        self._left = nodes["left"]
+        self._right = nodes["right"]
+        self._value = nodes["value"]
+
+    @property
+    def n_trees(self):
+        return len(self.roots)
+
+    @classmethod
+    def from_sklearn(cls, model):
+        """从已训练的 RandomForestRegressor（单输出）导出"""
+        trees = [estimator.tree_ for estimator in model.estimators_]
+        nodes = np.empty(sum(tree.node_count for tree in trees), dtype=NODE_DTYPE)
+        roots = np.empty(len(trees), dtype=np.int64)
+
+        offset = 0
+        for tree_index, tree in enumerate(trees):
+            count = tree.node_count
+            own_index = np.arange(offset, offset + count)
+            is_leaf = tree.children_left == -1
+            block = nodes[offset:offset + count]
+            block["feature"] = np.where(is_leaf, 0, tree.feature)
+            block["threshold"] = np.where(is_leaf, np.inf, tree.threshold)
+            block["left"] = np.where(is_leaf, own_index, tree.children_left + offset)
+            block["right"] = np.where(is_leaf, own_index, tree.children_right + offset)
+            block["value"] = tree.value[:, 0, 0]
+            roots[tree_index] = offset
+            offset += count
+        return cls(nodes, roots)
+
+    def predict(self, X):
+        """预测；X 为 (行数, 特征数) 矩阵。与 sklearn 一致：特征先转为float32再与float64阈值比较"""
+        X = np.asarray(X, dtype=np.float32)
+        if X.ndim == 1:
+            X = X[np.newaxis, :]
+        rows = np.arange(X.shape[0])[:, np.newaxis]
+        node_index = np.broadcast_to(self.roots, (X.shape[0], self.n_trees)).copy()
+
+        while True:
+            go_left = X[rows, self._feature[node_index]] <= self._threshold[node_index]
+            next_index = np.where(go_left, self._left[node_index], self._right[node_index])
+            if np.array_equal(next_index, node_index):
+                break
+            node_index = next_index
+
+        # 按树的顺序依次累加（cumsum为顺序求和），与 sklearn 逐棵累加后取平均的方式一致
+        leaf_values = self._value[node_index]
+        return np.cumsum(leaf_values, axis=1)[:, -1] / self.n_trees
+
+    def save(self, nodes_path, roots_path):
+        """原子写入节点数组与根节点下标（先写临时文件再替换）"""
+        for path, array in ((nodes_path, np.ascontiguousarray(self.nodes)),
+                            (roots_path, np.asarray(self.roots, dtype=np.int64))):
+            tmp_path = f"{path}.tmp{os.getpid()}"
+            with open(tmp_path, "wb") as f:
+                np.save(f, array)
+            os.replace(tmp_path, path)
+
+    @classmethod
+    def load(cls, nodes_path, roots_path, mmap=True):
+        """加载导出的森林；mmap=True 时节点数组以只读内存映射方式打开，多进程共享物理页"""
+        nodes = np.load(nodes_path, mmap_mode="r" if mmap else None)
+        roots = np.load(roots_path)
+        return cls(nodes, roots)
+
+
+def max_prediction_diff(compact_forest, model, X):
+    """校验紧凑森林与原模型的预测差异（返回最大绝对误差）"""
+    X = np.asarray(X, dtype=np.float32)
+    expected = predict_matrix(model, X)
+    actual = compact_forest.predict(X)
+    return float(np.max(np.abs(expected - actual))) if len(X) else 0.0
@@ -0,0 +1,349 @@
+# ---------------------- 数据加载工具（CSV解析 + 列式缓存）----------------------
+# 冷启动时优先从Arrow IPC缓存（内存映射）读取清洗后的核心数据，
+# 只有源文件的 mtime / 大小 / 内容哈希 变化时才重新解析CSV。
+# CSV编码由文件开头的有限样本探测得出，整个文件只解码、解析一次。
+# Excel工作簿（sj.xlsx）以只读流式方式逐行解析，多个工作表并行读取，清洗后同样写入Arrow缓存。
+import codecs
+import csv
+import hashlib
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+import pyarrow.ipc as pa_ipc
+
+# 核心数据列（与student.csv列名完全匹配）
+CORE_DATA_COLUMNS = [
+    "学号",
+    "性别",
+    "专业",
+    "每周学习时长",
+    "上课出勤率",
+    "期中考试分数",
+    "作业完成率",
+    "期末考试分数"
+]
+
+# 解析时直接指定的列类型（分类列用category，分数类用float32）
+STUDENT_DTYPES = {
+    "性别": "category",
+    "专业": "category",
+    "每周学习时长": "float32",
+    "上课出勤率": "float32",
+    "期中考试分数": "float32",
+    "作业完成率": "float32",
+    "期末考试分数": "float32"
+}
+
+# 指标列：解析时不指定类型，无法解析为数值的取值按缺失处理，随后整行丢弃
+# （全量加载与增量导入使用同一规则，见 coerce_numeric_columns）
+NUMERIC_CORE_COLUMNS = ["每周学习时长", "上课出勤率", "期中考试分数", "作业完成率", "期末考试分数"]
+STUDENT_PARSE_DTYPES = {col: col_type for col, col_type in STUDENT_DTYPES.items() if col not in NUMERIC_CORE_COLUMNS}
+
+# 医疗费用数据（sj2.csv，10.py模型的训练数据）
+MEDICAL_DATA_COLUMNS = ["年龄", "性别", "BMI", "子女数量", "是否吸烟", "区域", "医疗费用"]
+MEDICAL_DTYPES = {
+    "性别": "category",
+    "是否吸烟": "category",
+    "区域": "category",
+    "BMI": "float32",
+    "医疗费用": "float32"
+}
+
+# 销售数据（sj.xlsx，9.py仪表盘）：第1行为标题，第2行为表头
+SALES_HEADER_ROW = 1
+SALES_START_DATE = "2022-01-01"
+
+# 编码探测的样本大小，以及依次尝试的候选编码（gb18030兼容gbk）
+SNIFF_SAMPLE_BYTES = 64 * 1024
+CANDIDATE_ENCODINGS = ["utf-8", "gb18030"]
+
+# 缓存目录与格式版本（清洗逻辑变化时递增版本号，使旧缓存自动失效）
+CACHE_DIR = ".data_cache"
+CACHE_FORMAT_VERSION = 4
+
+
+class MissingColumnsError(ValueError):
+    """源文件缺少核心列"""
+
+    def __init__(self, missing_columns):
+        super().__init__(f"缺少核心列：{missing_columns}")
+        self.missing_columns = missing_columns
+
+
+def content_hasher(file_path, length, chunk_size=1 << 20):
+    """文件前 length 字节的内容哈希对象；文件追加写入后可继续 update 新字节，无需重读整个文件"""
+    hasher = hashlib.blake2b(digest_size=16)
+    with open(file_path, "rb") as f:
+        remaining = length
+        while remaining > 0:
+            chunk = f.read(min(chunk_size, remaining))
+            if not chunk:
+                break
+            hasher.update(chunk)
+            remaining -= len(chunk)
+    return hasher
+
+
+def fingerprint_from_content(content_digest, size, mtime_ns):
+    """由内容哈希、大小与 mtime 组合出文件指纹"""
+    key = f"{size}:{mtime_ns}:{CACHE_FORMAT_VERSION}:{content_digest}"
+    return hashlib.blake2b(key.encode(), digest_size=16).hexdigest()
+
+
+def file_fingerprint(file_path, chunk_size=1 << 20):
+    """根据文件的 mtime、大小和内容哈希生成指纹"""
+    stat = os.stat(file_path)
+    hasher = content_hasher(file_path, stat.st_size, chunk_size)
+    return fingerprint_from_content(hasher.hexdigest(), stat.st_size, stat.st_mtime_ns)
+
+
+def _cache_path(file_path, fingerprint, cache_dir):
+    base_name = os.path.splitext(os.path.basename(file_path))[0]
+    return os.path.join(cache_dir, f"{base_name}-{fingerprint}.arrow")
+
+
+def _read_arrow_cache(cache_path):
+    """内存映射读取Arrow IPC文件，数值列尽量零拷贝转换为DataFrame"""
+    with pa.memory_map(cache_path, "r") as source:
+        table = pa_ipc.open_file(source).read_all()
+        return table.to_pandas(split_blocks=True)
+
+
+def _write_arrow_cache(df, cache_path):
+    """原子写入Arrow IPC缓存（不压缩，便于内存映射），并清理同源旧缓存"""
+    cache_dir = os.path.dirname(cache_path)
+    os.makedirs(cache_dir, exist_ok=True)
+    table = pa.Table.from_pandas(df, preserve_index=False)
+    tmp_path = f"{cache_path}.tmp{os.getpid()}"
+    with pa.OSFile(tmp_path, "wb") as sink:
+        with pa_ipc.new_file(sink, table.schema) as writer:
+            writer.write_table(table)
+    os.replace(tmp_path, cache_path)
+
+    prefix = os.path.basename(cache_path).rsplit("-", 1)[0] + "-"
+    for name in os.listdir(cache_dir):
+        old_path = os.path.join(cache_dir, name)
+        if name.startswith(prefix) and name.endswith(".arrow") and old_path != cache_path:
+            try:
+                os.remove(old_path)
+            except OSError:
+                pass
+
+
+def sniff_encoding(sample):
+    """根据文件开头的字节样本判断编码"""
+    if sample.startswith(codecs.BOM_UTF8):
+        return "utf-8-sig"
+    for encoding in CANDIDATE_ENCODINGS:
+        try:
+            # 增量解码允许样本末尾截断半个多字节字符
+            codecs.getincrementaldecoder(encoding)().decode(sample, final=False)
+            return encoding
+        except UnicodeDecodeError:
+            continue
+    return "latin-1"
+
+
+def _clean_column_name(name):
+    return name.strip().replace(" ", "")
+
+
+def _read_header(sample, encoding):
+    """从样本中解析表头行"""
+    first_line = sample.split(b"\n", 1)[0].decode(encoding, errors="replace")
+    return next(csv.reader([first_line.rstrip("\r")]), [])
+
+
+def _read_sample(csv_source, sample_size):
+    """读取开头样本；csv_source 可以是文件路径，也可以是二进制文件对象（如上传的文件）"""
+    if hasattr(csv_source, "read"):
+        csv_source.seek(0)
+        sample = csv_source.read(sample_size)
+        csv_source.seek(0)
+        return sample
+    with open(csv_source, "rb") as f:
+        return f.read(sample_size)
+
+
+def read_csv_sniffed(csv_path, columns=None, dtype=None, sample_size=SNIFF_SAMPLE_BYTES):
+    """探测编码后单次解析CSV；只解析需要的列，并在解析时直接转换列类型"""
+    sample = _read_sample(csv_path, sample_size)
+    encoding = sniff_encoding(sample)
+
+    # 列名清洗（去除空格）在解析前完成，usecols/dtype 直接使用原始列名
+    raw_by_clean = {_clean_column_name(raw): raw for raw in _read_header(sample, encoding)}
+    usecols = None
+    if columns is not None:
+        missing_columns = [col for col in columns if col not in raw_by_clean]
+        if missing_columns:
+            raise MissingColumnsError(missing_columns)
+        usecols = [raw_by_clean[col] for col in columns]
+    raw_dtype = {raw_by_clean[col]: col_type for col, col_type in (dtype or {}).items() if col in raw_by_clean}
+
+    read_kwargs = dict(usecols=usecols, dtype=raw_dtype, engine="c")
+    try:
+        df = pd.read_csv(csv_path, encoding=encoding, **read_kwargs)
+    except UnicodeDecodeError:
+        # 样本只覆盖文件开头，极少数情况下非ASCII字符出现在样本之后
+        if encoding == "gb18030":
+            raise
+        if hasattr(csv_path, "seek"):
+            csv_path.seek(0)
+        df = pd.read_csv(csv_path, encoding="gb18030", **read_kwargs)
+
+    df.columns = [_clean_column_name(col) for col in df.columns]
+    return df[columns] if columns is not None else df
+
+
+def coerce_numeric_columns(df, columns=NUMERIC_CORE_COLUMNS):
+    """把非数值列中无法解析为数值的取值转换为缺失值（已是数值类型的列不做处理）"""
+    for col in columns:
+        if not pd.api.types.is_numeric_dtype(df[col]):
+            df[col] = pd.to_numeric(df[col], errors="coerce")
+    return df
+
+
+def compact_student_frame(df):
+    """转换为紧凑表示：学号int32，性别/专业为分类编码，指标列float32"""
+    df_compact = df.astype(STUDENT_DTYPES)
+    student_ids = df_compact["学号"]
+    int32_info = np.iinfo(np.int32)
+    if (pd.api.types.is_numeric_dtype(student_ids) and len(student_ids)
+            and student_ids.min() >= int32_info.min and student_ids.max() <= int32_info.max):
+        df_compact["学号"] = student_ids.astype(np.int32)
+    return df_compact
+
+
+def append_student_rows(df, delta):
+    """把新增数据（已经过 compact_student_frame）追加到已有数据之后：分类列先合并两边的类别
+    （原有类别顺序不变），避免拼接后退化为object列"""
+    if delta.empty:
+        return df
+    delta = delta[df.columns]
+    df_parts = {}
+    delta_parts = {}
+    for col in df.columns:
+        if isinstance(df[col].dtype, pd.CategoricalDtype):
+            categories = df[col].cat.categories.union(delta[col].astype(str).unique(), sort=False)
+            df_parts[col] = df[col].cat.set_categories(categories)
+            delta_parts[col] = pd.Categorical(delta[col].astype(str), categories=categories)
+        else:
+            # 例如新增学号超出int32范围时，两边统一提升为int64
+            common_dtype = np.result_type(df[col].dtype, delta[col].dtype)
+            if common_dtype != df[col].dtype:
+                df_parts[col] = df[col].astype(common_dtype)
+            delta_parts[col] = delta[col].astype(common_dtype)
+    return pd.concat(
+        [df.assign(**df_parts), pd.DataFrame(delta_parts, columns=df.columns)],
+        ignore_index=True
+    )
+
+
+def parse_student_csv(csv_path):
+    """解析学生CSV文件（不经过缓存），保留核心列、移除缺失值与指标无法解析为数值的行，并转换为紧凑表示"""
+    df_core = read_csv_sniffed(csv_path, columns=CORE_DATA_COLUMNS, dtype=STUDENT_PARSE_DTYPES)
+    df_core = coerce_numeric_columns(df_core).dropna(axis=0, how="any").reset_index(drop=True)
+    return compact_student_frame(df_core)
+
+
+def load_medical_data(csv_path="sj2.csv"):
+    """加载医疗费用数据（sj2.csv，GBK编码）"""
+    df = read_csv_sniffed(csv_path, columns=MEDICAL_DATA_COLUMNS, dtype=MEDICAL_DTYPES)
+    return df.dropna(axis=0, how="any").reset_index(drop=True)
+
+
+def load_student_core(csv_path="student.csv", cache_dir=CACHE_DIR, fingerprint=None):
+    """加载清洗后的核心学生数据：命中缓存时内存映射读取，否则解析CSV并写入缓存"""
+    if fingerprint is None:
+        fingerprint = file_fingerprint(csv_path)
+    cache_path = _cache_path(csv_path, fingerprint, cache_dir)
+
+    if os.path.exists(cache_path):
+        try:
+            return _read_arrow_cache(cache_path)
+        except (OSError, pa.ArrowInvalid):
+            # 缓存损坏时回退到CSV解析
+            pass
+
+    df_core = parse_student_csv(csv_path)
+    try:
+        _write_arrow_cache(df_core, cache_path)
+    except OSError:
+        # 缓存目录不可写时不影响正常加载
+        pass
+    return df_core
+
+
+def _read_sheet(xlsx_path, sheet_name, header_row):
+    """以只读模式流式解析一个工作表：逐行读取单元格值，不构建完整的单元格对象模型"""
+    import openpyxl
+
+    workbook = openpyxl.load_workbook(xlsx_path, read_only=True, data_only=True)
+    try:
+        rows = workbook[sheet_name].iter_rows(values_only=True)
+        for _ in range(header_row):
+            next(rows, None)
+        header = next(rows, None)
+        if header is None:
+            return pd.DataFrame()
+        columns = [_clean_column_name(str(col)) if col is not None else f"列{i}" for i, col in enumerate(header)]
+        # 跳过完全空白的行（只读模式下工作表末尾常带有格式化过的空行）
+        records = [row for row in rows if any(value is not None for value in row)]
+        return pd.DataFrame.from_records(records, columns=columns)
+    finally:
+        workbook.close()
+
+
+def _read_sheet_task(args):
+    return _read_sheet(*args)
+
+
+def read_excel_streaming(xlsx_path, header_row=0, max_workers=None):
+    """读取工作簿的全部工作表并纵向拼接；多个工作表时在多个进程中并行解析（openpyxl为纯Python，受GIL限制）"""
+    import openpyxl
+
+    workbook = openpyxl.load_workbook(xlsx_path, read_only=True)
+    sheet_names = workbook.sheetnames
+    workbook.close()
+
+    if len(sheet_names) == 1:
+        return _read_sheet(xlsx_path, sheet_names[0], header_row)
+
+    tasks = [(xlsx_path, name, header_row) for name in sheet_names]
+    with ProcessPoolExecutor(max_workers=max_workers or min(len(tasks), os.cpu_count() or 1)) as pool:
+        frames = [frame for frame in pool.map(_read_sheet_task, tasks) if not frame.empty]
+    return pd.concat(frames, ignore_index=True) if frames else pd.DataFrame()
+
+
+def clean_sales_frame(df):
+    """销售数据清洗：解析日期，无法解析的日期按行号从 SALES_START_DATE 起逐日补齐"""
+    df = df.copy()
+    df["日期"] = pd.to_datetime(df["日期"], errors="coerce")
+    if df["日期"].isnull().any():
+        fill_dates = pd.Series(pd.date_range(start=SALES_START_DATE, periods=len(df)), index=df.index)
+        df["日期"] = df["日期"].fillna(fill_dates)
+    return df
+
+
+def load_sales_workbook(xlsx_path="sj.xlsx", cache_dir=CACHE_DIR, fingerprint=None):
+    """加载清洗后的销售数据：命中缓存时内存映射读取，否则流式解析工作簿并写入缓存"""
+    if fingerprint is None:
+        fingerprint = file_fingerprint(xlsx_path)
+    cache_path = _cache_path(xlsx_path, fingerprint, cache_dir)
+
+    if os.path.exists(cache_path):
+        try:
+            return _read_arrow_cache(cache_path)
+        except (OSError, pa.ArrowInvalid):
+            pass
+
+    df_sales = clean_sales_frame(read_excel_streaming(xlsx_path, header_row=SALES_HEADER_ROW))
+    try:
+        _write_arrow_cache(df_sales, cache_path)
+    except (OSError, pa.ArrowException):
+        # 缓存目录不可写，或个别列为Arrow无法表示的混合类型时，不影响正常加载
+        pass
+    return df_sales
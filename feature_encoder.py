@@ -0,0 +1,138 @@
+# ---------------------- 特征编码器（原始取值 -> 模型特征矩阵）----------------------
+# 训练时根据模型特征列构建并随模型一起保存；预测时把原始分类取值直接映射为列下标，
+# 写入预分配的 numpy 矩阵，不需要加载训练数据、构造 DataFrame 或 reindex。
+# 独热列名沿用 pd.get_dummies 的 "<列名>_<取值>" 约定，10.py / 11.py 的模型同样适用。
+import warnings
+
+import numpy as np
+import pandas as pd
+
+ENCODER_VERSION = 1
+
+
+class FeatureEncoder:
+    """把原始输入（数值列 + 分类列）编码为与 feature_columns 对齐的 float32 矩阵"""
+
+    def __init__(self, feature_columns, categorical_columns, categories=None):
+        self.feature_columns = list(feature_columns)
+        self.categorical_columns = list(categorical_columns)
+        self.version = ENCODER_VERSION
+
+        # 分类列：取值 -> 特征列下标（drop_first 丢弃的基准类别不在映射中，编码为全0）
+        self.category_index = {col: {} for col in self.categorical_columns}
+        # 数值列：列名 -> 特征列下标
+        self.numeric_index = {}
+        for index, feature in enumerate(self.feature_columns):
+            for col in self.categorical_columns:
+                prefix = f"{col}_"
+                if feature.startswith(prefix):
+                    self.category_index[col][feature[len(prefix):]] = index
+                    break
+            else:
+                self.numeric_index[feature] = index
+
+        # 各分类列的全部取值（含基准类别），用于界面选项与输入校验
+        self.categories = {
+            col: list((categories or {}).get(col, self.category_index[col].keys()))
+            for col in self.categorical_columns
+        }
+
+    @classmethod
+    def from_feature_columns(cls, feature_columns, categorical_columns, categories=None):
+        """根据模型特征列名构建编码器（适用于已保存特征列的现有模型）"""
+        return cls(feature_columns, categorical_columns, categories)
+
+    @classmethod
+    def fit(cls, df, feature_columns, categorical_columns):
+        """根据训练数据与训练得到的特征列构建编码器，并记录每个分类列的全部取值"""
+        categories = {}
+        for col in categorical_columns:
+            values = df[col]
+            if isinstance(values.dtype, pd.CategoricalDtype):
+                categories[col] = [str(v) for v in values.cat.categories]
+            else:
+                categories[col] = sorted(str(v) for v in values.dropna().unique())
+        return cls(feature_columns, categorical_columns, categories)
+
+    @property
+    def n_features(self):
+        return len(self.feature_columns)
+
+    def transform_row(self, values, out=None):
+        """编码单条输入（dict），返回形状为 (1, n_features) 的矩阵；未提供的特征为0"""
+        if out is None:
+            out = np.zeros((1, self.n_features), dtype=np.float32)
+        else:
+            out.fill(0)
+        row = out[0]
+        for col, index in self.numeric_index.items():
+            if col in values:
+                row[index] = values[col]
+        for col, mapping in self.category_index.items():
+            index = mapping.get(str(values.get(col)))
+            if index is not None:
+                row[index] = 1.0
+        return out
+
+    def transform_frame(self, df):
+        """向量化编码整批数据（DataFrame），返回形状为 (行数, n_features) 的矩阵"""
+        n_rows = len(df)
+        out = np.zeros((n_rows, self.n_features), dtype=np.float32)
+        for col, index in self.numeric_index.items():
+            if col in df.columns:
+                out[:, index] = df[col].to_numpy(dtype=np.float32)
+        row_positions = np.arange(n_rows)
+        for col, mapping in self.category_index.items():
+            if col not in df.columns or not mapping:
+                continue
+            values = df[col]
+            if isinstance(values.dtype, pd.CategoricalDtype):
+                # 分类列只需映射各类别一次，再按编码查表（编码-1表示缺失，对应查找表最后一项）
+                lookup = np.array([mapping.get(str(c), -1) for c in values.cat.categories] + [-1], dtype=np.intp)
+                column_index = lookup[values.cat.codes.to_numpy()]
+            else:
+                column_index = values.astype(str).map(mapping).fillna(-1).to_numpy(dtype=np.intp)
+            valid = column_index >= 0
+            out[row_positions[valid], column_index[valid]] = 1.0
+        return out
+
+    def unknown_category_mask(self, df):
+        """整批数据中分类取值不在 categories 内的行（这些行会被编码为全0，即按基准类别预测）"""
+        mask = np.zeros(len(df), dtype=bool)
+        for col in self.categorical_columns:
+            allowed = self.categories.get(col)
+            if allowed and col in df.columns:
+                mask |= ~df[col].astype(str).isin(allowed).to_numpy()
+        return mask
+
+    def to_dict(self):
+        return {
+            "version": self.version,
+            "feature_columns": self.feature_columns,
+            "categorical_columns": self.categorical_columns,
+            "categories": self.categories,
+        }
+
+    def save(self, path):
+        import joblib
+
+        joblib.dump(self.to_dict(), path)
+
+    @classmethod
+    def load(cls, path):
+        """加载编码器；版本不一致时抛出 ValueError，由调用方重新构建"""
+        import joblib
+
+        state = joblib.load(path)
+        if state.get("version") != ENCODER_VERSION:
+            raise ValueError(f"编码器版本不匹配：{state.get('version')} != {ENCODER_VERSION}")
+        return cls(state["feature_columns"], state["categorical_columns"], state["categories"])
+
+
+def predict_matrix(model, X):
+    """用 numpy 矩阵调用 model.predict；模型以带列名的 DataFrame 训练时屏蔽列名缺失的警告"""
+    if hasattr(model, "feature_names_in_"):
+        with warnings.catch_warnings():
+            warnings.filterwarnings("ignore", message="X does not have valid feature names")
+            return model.predict(X)
+    return model.predict(X)
@@ -0,0 +1,99 @@
+# ---------------------- 图表渲染缓存（按字节预算的LRU）----------------------
+# 以 (图表ID, 输入数据指纹, 主题) 为键缓存渲染好的PNG字节，输入未变化时直接返回字节，
+# 不再重新构建和栅格化 matplotlib 图形。
+import io
+import threading
+import time
+from collections import OrderedDict
+
+import pandas as pd
+
+# pyplot 不是线程安全的，Streamlit 的多个会话在不同线程中运行，渲染需串行化
+_RENDER_LOCK = threading.Lock()
+
+
+def frame_fingerprint(*frames):
+    """计算一个或多个 DataFrame/Series 的内容指纹（含索引与列名）"""
+    parts = []
+    for frame in frames:
+        parts.append(str(int(pd.util.hash_pandas_object(frame, index=True).sum())))
+        if isinstance(frame, pd.DataFrame):
+            parts.append("|".join(map(str, frame.columns)))
+    return ":".join(parts)
+
+
+class FigureCache:
+    """渲染结果LRU缓存：总字节数超过预算时淘汰最久未使用的图表"""
+
+    def __init__(self, max_bytes=32 * 1024 * 1024, fmt="png", dpi=100):
+        self.max_bytes = max_bytes
+        self.fmt = fmt
+        self.dpi = dpi
+        self._entries = OrderedDict()
+        self._total_bytes = 0
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.render_seconds = 0.0
+
+    def get_or_render(self, chart_id, data_fingerprint, theme, render_fn):
+        """命中时返回缓存字节，否则调用 render_fn() 构建图形并渲染"""
+        key = (chart_id, data_fingerprint, theme, self.fmt)
+        with self._lock:
+            image_bytes = self._entries.get(key)
+            if image_bytes is not None:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return image_bytes
+            self.misses += 1
+
+        image_bytes, elapsed = self._render(render_fn)
+
+        with self._lock:
+            self.render_seconds += elapsed
+            if key not in self._entries:
+                self._entries[key] = image_bytes
+                self._total_bytes += len(image_bytes)
+            self._evict()
+        return image_bytes
+
+    def _render(self, render_fn):
+        import matplotlib.pyplot as plt
+
+        with _RENDER_LOCK:
+            start = time.perf_counter()
+            fig = render_fn()
+            try:
+                buffer = io.BytesIO()
+                fig.savefig(buffer, format=self.fmt, dpi=self.dpi, bbox_inches="tight")
+            finally:
+                plt.close(fig)
+            return buffer.getvalue(), time.perf_counter() - start
+
+    def _evict(self):
+        # 至少保留最新的一项，避免单张超大图表被立即淘汰
+        while self._total_bytes > self.max_bytes and len(self._entries) > 1:
+            _, image_bytes = self._entries.popitem(last=False)
+            self._total_bytes -= len(image_bytes)
+            self.evictions += 1
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self._total_bytes = 0
+
+    def stats(self):
+        """命中率、渲染耗时等计数"""
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": self.hits / lookups if lookups else 0.0,
+                "entries": len(self._entries),
+                "bytes": self._total_bytes,
+                "evictions": self.evictions,
+                "render_seconds": self.render_seconds,
+                "avg_render_ms": self.render_seconds * 1000 / self.misses if self.misses else 0.0,
+            }
@@ -0,0 +1,106 @@
+# ---------------------- 启动导入耗时检查 ----------------------
+# 在全新子进程中以 python -X importtime 用 streamlit 的 AppTest 执行入口脚本的首次运行
+# （默认页面即项目总览，包含共享数据与模型注册表的加载），只统计首次运行期间发生的导入，
+# 汇总总耗时与耗时最多的模块，并检查：
+#   1. 首次运行的导入耗时不超过预算；
+#   2. 首次运行路径上没有训练/绘图才需要的重型模块（sklearn、matplotlib 等）。
+# 应在模型已训练的热启动状态下运行（模型缺失时首次运行会同步训练，必然导入 sklearn）。
+# 不满足时以非零状态码退出，可作为提交前检查。
+# 用法：python import_budget.py [--script Final_project.py] [--budget-ms 3000] [--repeat 3]
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+
+DEFAULT_BUDGET_MS = 3000
+# 启动路径上不应出现的模块（只在训练或绘图时延迟导入）
+DEFERRED_MODULES = ("sklearn", "scipy", "matplotlib")
+TOP_N = 15
+
+
+# 子进程中执行：先导入 AppTest（不计入），输出分隔标记后执行入口脚本的首次运行
+FIRST_RUN_CODE = """
+import json, sys, time
+from streamlit.testing.v1 import AppTest
+print("{marker}", file=sys.stderr, flush=True)
+start = time.perf_counter()
+app_test = AppTest.from_file({script!r}, default_timeout={timeout})
+app_test.run()
+print(json.dumps({{
+    "seconds": time.perf_counter() - start,
+    "exception": [str(e.value) for e in app_test.exception],
+    "modules": sorted(sys.modules),
+}}))
+"""
+RUN_MARKER = "--- first run ---"
+
+
+def parse_importtime(stderr):
+    """解析 -X importtime 输出：返回 [(模块名, 自身耗时us, 累计耗时us, 嵌套深度)]"""
+    entries = []
+    for line in stderr.splitlines():
+        if not line.startswith("import time:") or "imported package" in line:
+            continue
+        self_us, cumulative_us, name = line[len("import time:"):].split("|")
+        depth = (len(name) - len(name.lstrip(" ")) - 1) // 2
+        entries.append((name.strip(), int(self_us), int(cumulative_us), depth))
+    return entries
+
+
+def measure(script, cwd, timeout):
+    """在全新子进程中执行入口脚本的首次运行，返回 (importtime 条目, 运行结果)"""
+    code = FIRST_RUN_CODE.format(marker=RUN_MARKER, script=os.path.basename(script), timeout=timeout)
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code],
+        cwd=cwd, capture_output=True, text=True
+    )
+    if result.returncode != 0:
+        raise RuntimeError(f"首次运行失败：\n{result.stderr[-2000:]}")
+    run = json.loads(result.stdout.strip().splitlines()[-1])
+    if run["exception"]:
+        raise RuntimeError(f"首次运行出错：{run['exception'][0]}")
+    stderr = result.stderr.split(RUN_MARKER, 1)[-1]
+    return parse_importtime(stderr), run
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="入口脚本首次运行的导入耗时检查")
+    parser.add_argument("--script", default="Final_project.py")
+    parser.add_argument("--budget-ms", type=float, default=DEFAULT_BUDGET_MS)
+    parser.add_argument("--repeat", type=int, default=3, help="重复测量次数（取中位数，首次含磁盘冷缓存）")
+    parser.add_argument("--timeout", type=float, default=120, help="首次运行的超时时间（秒）")
+    args = parser.parse_args(argv)
+
+    cwd = os.path.dirname(os.path.abspath(args.script))
+    runs = [measure(args.script, cwd, args.timeout) for _ in range(args.repeat)]
+
+    totals_ms = [sum(entry[2] for entry in entries if entry[3] == 0) / 1000 for entries, _ in runs]
+    total_ms = statistics.median(totals_ms)
+    run_ms = statistics.median(run["seconds"] * 1000 for _, run in runs)
+    entries, last_run = runs[-1]
+
+    print(f"入口脚本: {args.script}（首次运行 {run_ms:.0f} ms）")
+    print(f"首次运行导入耗时: {total_ms:.0f} ms（各次 {', '.join(f'{t:.0f}' for t in totals_ms)} ms，预算 {args.budget_ms:.0f} ms）")
+    print(f"\n累计耗时最多的 {TOP_N} 个模块：")
+    for name, self_us, cumulative_us, _ in sorted(entries, key=lambda e: e[2], reverse=True)[:TOP_N]:
+        print(f"  {cumulative_us / 1000:8.1f} ms  (自身 {self_us / 1000:6.1f} ms)  {name}")
+
+    # 以运行结束时的 sys.modules 为准（包括后台线程中发生的导入）
+    imported = {name.split(".")[0] for name in last_run["modules"]}
+    deferred_found = sorted(imported.intersection(DEFERRED_MODULES))
+    failures = []
+    if total_ms > args.budget_ms:
+        failures.append(f"首次运行导入耗时 {total_ms:.0f} ms 超出预算 {args.budget_ms:.0f} ms")
+    if deferred_found:
+        failures.append(f"首次运行路径导入了应延迟导入的模块：{deferred_found}")
+
+    if failures:
+        print("\n❌ " + "\n❌ ".join(failures))
+        sys.exit(1)
+    print("\n✅ 导入耗时在预算内，首次运行路径未导入训练/绘图模块")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,96 @@
+# ---------------------- 预测服务压力测试 ----------------------
+# 以固定并发向 prediction_server.py 发送请求，统计吞吐量与延迟分位数（p50/p95/p99）。
+# 用法：
+#   python prediction_server.py &
+#   python load_test.py --model student --requests 5000 --concurrency 50
+#   python load_test.py --model student --batch-size 100 --profile standard
+import argparse
+import asyncio
+import json
+import time
+
+import numpy as np
+from tornado.httpclient import AsyncHTTPClient, HTTPClientError
+
+# 各模型的示例请求（与表单默认值一致）
+SAMPLE_INSTANCES = {
+    "student": {
+        "性别": "男", "专业": "人工智能", "每周学习时长": 20.0,
+        "上课出勤率": 0.85, "期中考试分数": 75, "作业完成率": 0.9,
+    },
+    "medical": {
+        "年龄": 30, "性别": "男性", "BMI": 24.0, "子女数量": 0, "是否吸烟": "否", "区域": "西南部",
+    },
+    "penguin": {
+        "企鹅栖息的岛屿": "Biscoe", "喙的长度": 45.0, "喙的深度": 20.0, "翅膀的长度": 195,
+        "身体质量": 4500, "性别": "雄性", "观测年份": 2007,
+    },
+}
+
+
+async def run_load_test(url, body, total_requests, concurrency):
+    """并发发送请求，返回 (各请求延迟秒数, 失败数, 总耗时)"""
+    client = AsyncHTTPClient(max_clients=concurrency)
+    latencies = []
+    failures = 0
+    next_request = 0
+
+    async def worker():
+        nonlocal next_request, failures
+        while next_request < total_requests:
+            next_request += 1
+            start = time.perf_counter()
+            try:
+                await client.fetch(url, method="POST", body=body,
+                                   headers={"Content-Type": "application/json"})
+            except (HTTPClientError, OSError):
+                failures += 1
+                continue
+            latencies.append(time.perf_counter() - start)
+
+    start = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    return latencies, failures, time.perf_counter() - start
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="预测服务压力测试")
+    parser.add_argument("--url", default="http://127.0.0.1:8600")
+    parser.add_argument("--model", choices=sorted(SAMPLE_INSTANCES), default="student")
+    parser.add_argument("--profile", default=None, help="学生模型档案（fast / standard / hgb）")
+    parser.add_argument("--requests", type=int, default=2000)
+    parser.add_argument("--concurrency", type=int, default=20)
+    parser.add_argument("--batch-size", type=int, default=1, help="每个请求包含的记录数（1为单条）")
+    parser.add_argument("--warmup", type=int, default=50)
+    args = parser.parse_args(argv)
+
+    url = f"{args.url.rstrip('/')}/predict/{args.model}"
+    if args.profile:
+        url += f"?profile={args.profile}"
+    instance = SAMPLE_INSTANCES[args.model]
+    payload = instance if args.batch_size == 1 else {"instances": [instance] * args.batch_size}
+    body = json.dumps(payload, ensure_ascii=False).encode("utf-8")
+
+    # 预热：建立连接、触发模型的首次预测
+    asyncio.run(run_load_test(url, body, args.warmup, min(args.concurrency, args.warmup)))
+    latencies, failures, wall_seconds = asyncio.run(
+        run_load_test(url, body, args.requests, args.concurrency)
+    )
+    if not latencies:
+        print(f"全部 {failures} 个请求失败，请确认服务已启动：{url}")
+        return
+
+    latencies_ms = np.asarray(latencies) * 1000
+    print(f"目标: {url}")
+    print(f"请求数: {len(latencies)}（失败 {failures}），并发 {args.concurrency}，每请求 {args.batch_size} 条")
+    print(f"吞吐量: {len(latencies) / wall_seconds:,.1f} 请求/秒（{len(latencies) * args.batch_size / wall_seconds:,.0f} 条/秒）")
+    print(
+        f"延迟: p50 {np.percentile(latencies_ms, 50):.2f} ms | "
+        f"p95 {np.percentile(latencies_ms, 95):.2f} ms | "
+        f"p99 {np.percentile(latencies_ms, 99):.2f} ms | "
+        f"max {latencies_ms.max():.2f} ms"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,103 @@
+# ---------------------- 单行预测微批处理 ----------------------
+# 多个会话同时提交单行预测时，每次 predict 的固定开销（参数校验、线程池调度）远大于计算本身。
+# 这里把并发到达的单行请求排队等待一个很短的窗口（默认几毫秒），拼成一个矩阵一次预测，
+# 再把结果分发回各个等待的调用方。窗口与最大批量可配置，并统计批量分布与排队延迟。
+import queue
+import threading
+import time
+from collections import Counter, deque
+from concurrent.futures import Future
+
+import numpy as np
+
+from feature_encoder import predict_matrix
+
+DEFAULT_WINDOW_MS = 5
+DEFAULT_MAX_BATCH_SIZE = 64
+# 保留最近多少次请求的排队延迟用于计算分位数
+DELAY_HISTORY = 2000
+
+
+class MicroBatcher:
+    """把并发的单行预测请求合并为批量预测；同一批内按模型分组，模型替换前后的请求互不混用"""
+
+    def __init__(self, window_ms=DEFAULT_WINDOW_MS, max_batch_size=DEFAULT_MAX_BATCH_SIZE):
+        self.window_seconds = window_ms / 1000
+        self.max_batch_size = max_batch_size
+        self._queue = queue.Queue()
+        self._lock = threading.Lock()
+        self.batch_sizes = Counter()
+        self._queue_delays = deque(maxlen=DELAY_HISTORY)
+        self.requests = 0
+        self.batches = 0
+        self.errors = 0
+        self._worker = threading.Thread(target=self._run, name="micro-batcher", daemon=True)
+        self._worker.start()
+
+    def submit(self, model, row):
+        """提交单行特征（形状为 (1, n) 或 (n,)），返回 Future，结果为该行的预测值"""
+        future = Future()
+        self._queue.put((model, np.asarray(row, dtype=np.float32).reshape(1, -1), time.perf_counter(), future))
+        return future
+
+    def predict(self, model, row, timeout=10):
+        """提交并等待结果"""
+        return self.submit(model, row).result(timeout=timeout)
+
+    def _collect(self):
+        # 阻塞等待第一个请求，然后在窗口期内继续收集，直到达到最大批量
+        batch = [self._queue.get()]
+        deadline = time.perf_counter() + self.window_seconds
+        while len(batch) < self.max_batch_size:
+            remaining = deadline - time.perf_counter()
+            if remaining <= 0:
+                break
+            try:
+                batch.append(self._queue.get(timeout=remaining))
+            except queue.Empty:
+                break
+        return batch
+
+    def _run(self):
+        while True:
+            batch = self._collect()
+            dispatched_at = time.perf_counter()
+
+            groups = {}
+            for item in batch:
+                groups.setdefault(id(item[0]), []).append(item)
+
+            for items in groups.values():
+                model = items[0][0]
+                try:
+                    predictions = predict_matrix(model, np.vstack([item[1] for item in items]))
+                except Exception as e:
+                    for item in items:
+                        item[3].set_exception(e)
+                    with self._lock:
+                        self.errors += len(items)
+                    continue
+                for item, prediction in zip(items, predictions):
+                    item[3].set_result(prediction)
+
+            with self._lock:
+                self.requests += len(batch)
+                self.batches += 1
+                self.batch_sizes[len(batch)] += 1
+                self._queue_delays.extend(dispatched_at - item[2] for item in batch)
+
+    def stats(self):
+        """批量分布、平均批量与排队延迟分位数（毫秒）"""
+        with self._lock:
+            delays_ms = np.asarray(self._queue_delays) * 1000
+            return {
+                "requests": self.requests,
+                "batches": self.batches,
+                "errors": self.errors,
+                "avg_batch_size": self.requests / self.batches if self.batches else 0.0,
+                "batch_sizes": dict(sorted(self.batch_sizes.items())),
+                "queue_p50_ms": float(np.percentile(delays_ms, 50)) if len(delays_ms) else 0.0,
+                "queue_p99_ms": float(np.percentile(delays_ms, 99)) if len(delays_ms) else 0.0,
+                "window_ms": self.window_seconds * 1000,
+                "max_batch_size": self.max_batch_size,
+            }
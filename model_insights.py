@@ -0,0 +1,87 @@
+# ---------------------- 模型洞察（特征重要性 + 部分依赖）----------------------
+# 训练完成时计算一次并与模型文件一起保存，页面只读取保存的结果，不在浏览时扫描数据。
+# 部分依赖：在训练数据抽样上把某个特征固定为网格上的各个取值，逐个网格点用 sklearn 模型整批预测，
+# 每个取值的平均预测即为该点的部分依赖值（不拼接全部网格点，后台重训时内存只多占一份抽样矩阵）。
+import json
+import os
+import time
+
+import numpy as np
+
+from feature_encoder import predict_matrix
+
+INSIGHTS_VERSION = 1
+PDP_GRID_POINTS = 25
+PDP_SAMPLE_ROWS = 2000
+
+
+def feature_importances(model, encoder):
+    """按原始特征汇总的重要性（独热列合并回所属分类列），按重要性降序；
+    模型没有 feature_importances_（如梯度提升）时返回空列表"""
+    if not hasattr(model, "feature_importances_"):
+        return []
+    importances = np.asarray(model.feature_importances_, dtype=np.float64)
+    totals = {col: float(importances[index]) for col, index in encoder.numeric_index.items()}
+    for col, mapping in encoder.category_index.items():
+        totals[col] = float(importances[list(mapping.values())].sum()) if mapping else 0.0
+    return [
+        {"特征": col, "重要性": value}
+        for col, value in sorted(totals.items(), key=lambda item: item[1], reverse=True)
+    ]
+
+
+def partial_dependence(model, encoder, df_input, features, grid_points=PDP_GRID_POINTS,
+                       sample_rows=PDP_SAMPLE_ROWS):
+    """各数值特征的部分依赖曲线：{特征: {"grid": [...], "mean": [...]}}；
+    逐个网格点预测，复用同一个抽样矩阵，内存只占一份抽样数据"""
+    sample = df_input.sample(n=min(sample_rows, len(df_input)), random_state=0)
+    X_base = encoder.transform_frame(sample)
+    X_point = X_base.copy()
+
+    # 网格取全量数据的分位点（1%~99%），去掉重复值
+    quantiles = np.linspace(0.01, 0.99, grid_points)
+    curves = {}
+    for col in features:
+        if col not in encoder.numeric_index:
+            continue
+        index = encoder.numeric_index[col]
+        grid = np.unique(np.quantile(df_input[col].to_numpy(dtype=np.float64), quantiles))
+        means = []
+        for value in grid:
+            X_point[:, index] = value
+            means.append(float(np.mean(predict_matrix(model, X_point))))
+        X_point[:, index] = X_base[:, index]
+        curves[col] = {"grid": grid.tolist(), "mean": means}
+    return curves
+
+
+def compute_model_insights(model, encoder, df_input, features, model_version):
+    """计算模型洞察：特征重要性与部分依赖都使用 sklearn 模型"""
+    start = time.perf_counter()
+    return {
+        "version": INSIGHTS_VERSION,
+        "model_version": model_version,
+        "importances": feature_importances(model, encoder),
+        "partial_dependence": partial_dependence(model, encoder, df_input, features),
+        "sample_rows": int(min(PDP_SAMPLE_ROWS, len(df_input))),
+        "compute_seconds": round(time.perf_counter() - start, 2),
+    }
+
+
+def save_insights(insights, path):
+    tmp_path = f"{path}.tmp{os.getpid()}"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump(insights, f, ensure_ascii=False, indent=2)
+    os.replace(tmp_path, path)
+
+
+def load_insights(path, model_version):
+    """读取保存的模型洞察；文件缺失、格式版本或模型版本不一致时返回 None"""
+    try:
+        with open(path, encoding="utf-8") as f:
+            insights = json.load(f)
+    except (OSError, ValueError):
+        return None
+    if insights.get("version") != INSIGHTS_VERSION or insights.get("model_version") != model_version:
+        return None
+    return insights
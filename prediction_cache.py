@@ -0,0 +1,84 @@
+# ---------------------- 预测结果缓存（按条目数的LRU）----------------------
+# 表单输入都是粗粒度的（专业、性别与几个滑块），很多用户会提交相同的组合。
+# 以 (模型档案, 归一化后的特征向量) 为键缓存预测值，命中时不再调用模型；
+# 某个档案的模型被后台重训替换后版本号变化，该档案旧版本的条目整体失效。
+import threading
+from collections import OrderedDict
+
+import numpy as np
+
+# 特征值保留的小数位数：消除 出勤率/100 之类换算带来的浮点尾差
+KEY_DECIMALS = 4
+
+
+def feature_key(row):
+    """把编码后的单行特征归一化为可哈希的键"""
+    return np.round(np.asarray(row, dtype=np.float32).ravel(), KEY_DECIMALS).tobytes()
+
+
+class PredictionCache:
+    """单行预测的LRU缓存；条目数超过上限时淘汰最久未使用的条目"""
+
+    def __init__(self, max_entries=4096):
+        self.max_entries = max_entries
+        # {(档案, 特征键): 预测值}
+        self._entries = OrderedDict()
+        # {档案: 当前模型版本}
+        self._model_versions = {}
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.invalidations = 0
+
+    def _check_version(self, profile, model_version):
+        # 调用方需持有锁；档案的模型版本变化时清空该档案旧模型的全部结果
+        if self._model_versions.get(profile) != model_version:
+            stale_keys = [key for key in self._entries if key[0] == profile]
+            if stale_keys:
+                self.invalidations += 1
+            for key in stale_keys:
+                del self._entries[key]
+            self._model_versions[profile] = model_version
+
+    def get_or_predict(self, model_version, row, predict_fn, profile=None):
+        """命中时返回缓存的预测值，否则调用 predict_fn(row) 并缓存结果"""
+        key = (profile, feature_key(row))
+        with self._lock:
+            self._check_version(profile, model_version)
+            value = self._entries.get(key)
+            if value is not None:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return value
+            self.misses += 1
+
+        value = float(predict_fn(row))
+
+        with self._lock:
+            # 预测期间模型可能已被替换，只缓存当前版本的结果
+            if model_version == self._model_versions.get(profile):
+                self._entries[key] = value
+                self._entries.move_to_end(key)
+                while len(self._entries) > self.max_entries:
+                    self._entries.popitem(last=False)
+                    self.evictions += 1
+        return value
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self):
+        """命中率、条目数等计数"""
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": self.hits / lookups if lookups else 0.0,
+                "entries": len(self._entries),
+                "evictions": self.evictions,
+                "invalidations": self.invalidations,
+                "model_versions": dict(self._model_versions),
+            }
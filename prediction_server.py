@@ -0,0 +1,266 @@
+# ---------------------- 预测HTTP服务（无界面，JSON接口）----------------------
+# 与 Streamlit 应用加载同一套模型文件，为外部系统（如LMS）提供程序化调用：
+#   GET  /health                      服务状态与已加载的模型
+#   POST /predict/student?profile=fast 学生期末成绩（profile 可选，默认交互档案）
+#   POST /predict/medical              医疗费用（10.py 的模型）
+#   POST /predict/penguin              企鹅种类（11.py 的模型）
+# 请求体为单条记录 {"字段": 值, ...} 或批量 {"instances": [{...}, ...]}；
+# 预测在线程池中执行，事件循环只负责收发请求。学生模型文件被应用重新训练替换后自动重新加载。
+# 开启微批处理后（--batch-window-ms > 0），各线程并发的单条请求会合并为一次批量预测。
+# 用法：python prediction_server.py [--port 8600] [--threads 4] [--batch-window-ms 2]
+import argparse
+import asyncio
+import json
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+import pandas as pd
+import tornado.ioloop
+import tornado.web
+
+from feature_encoder import predict_matrix
+from micro_batcher import DEFAULT_MAX_BATCH_SIZE, MicroBatcher
+from saved_models import MEDICAL_MODEL_SPEC, PENGUIN_MODEL_SPEC, load_saved_model
+from student_model import (
+    CATEGORICAL_COLUMNS,
+    INTERACTIVE_PROFILE,
+    MODEL_PROFILES,
+    NUMERIC_FEATURE_COLUMNS,
+    load_model_bundle,
+    profile_paths
+)
+
+DEFAULT_PORT = 8600
+# 单次请求允许的最大批量
+MAX_BATCH_SIZE = 10000
+# 检查学生模型文件是否被替换的间隔（毫秒）
+RELOAD_CHECK_MS = 30 * 1000
+
+
+class InvalidRequest(ValueError):
+    """请求内容不合法（返回400）"""
+
+
+class ServedModel:
+    """一个可服务的模型：预测对象、编码器、必填字段与版本信息"""
+
+    def __init__(self, name, predictor, encoder, numeric_columns, categorical_columns, version, meta_path=None,
+                 predictor_for=None):
+        self.name = name
+        self.predictor = predictor
+        # 按请求行数选择预测对象（学生模型：大批量改用 sklearn 模型）；未提供时总是使用 predictor
+        self.predictor_for = predictor_for or (lambda n_rows: predictor)
+        self.encoder = encoder
+        self.required_columns = list(numeric_columns) + list(categorical_columns)
+        self.categorical_columns = list(categorical_columns)
+        self.version = version
+        self.meta_path = meta_path
+        self.meta_mtime = os.path.getmtime(meta_path) if meta_path and os.path.exists(meta_path) else None
+
+    def _validate(self, instances):
+        for position, instance in enumerate(instances):
+            if not isinstance(instance, dict):
+                raise InvalidRequest(f"第 {position} 条记录不是JSON对象")
+            missing = [col for col in self.required_columns if col not in instance]
+            if missing:
+                raise InvalidRequest(f"第 {position} 条记录缺少字段：{missing}")
+            for col in self.categorical_columns:
+                allowed = self.encoder.categories.get(col)
+                if allowed and str(instance[col]) not in allowed:
+                    raise InvalidRequest(f"第 {position} 条记录的 {col}={instance[col]!r} 不在 {allowed} 中")
+
+    def predict(self, instances, batcher=None):
+        """校验并预测一批记录，返回可JSON序列化的预测值列表；单条记录可交给微批处理器合并预测"""
+        self._validate(instances)
+        try:
+            if len(instances) == 1:
+                X = self.encoder.transform_row(instances[0])
+            else:
+                X = self.encoder.transform_frame(pd.DataFrame.from_records(instances))
+        except (TypeError, ValueError) as e:
+            raise InvalidRequest(f"字段取值无法转换为数值：{e}") from e
+        if batcher is not None and len(instances) == 1:
+            predictions = np.asarray([batcher.predict(self.predictor, X)])
+        else:
+            predictions = predict_matrix(self.predictor_for(len(instances)), X)
+        if np.issubdtype(np.asarray(predictions).dtype, np.floating):
+            predictions = np.round(predictions, 4)
+        return np.asarray(predictions).tolist()
+
+
+def load_student_models():
+    """加载全部已训练的学生模型档案：{档案名: ServedModel}"""
+    models = {}
+    for profile in MODEL_PROFILES:
+        paths = profile_paths(profile)
+        bundle = load_model_bundle(**paths)
+        if bundle is None:
+            continue
+        models[profile] = ServedModel(
+            f"student:{profile}", bundle.predictor, bundle.encoder,
+            NUMERIC_FEATURE_COLUMNS, CATEGORICAL_COLUMNS, bundle.version, paths["meta_path"],
+            predictor_for=bundle.predictor_for
+        )
+    return models
+
+
+def load_other_model(name, spec):
+    try:
+        model, encoder = load_saved_model(spec)
+    except OSError as e:
+        print(f"[server] 未加载 {name} 模型：{e}", flush=True)
+        return None
+    return ServedModel(name, model, encoder, spec["numeric_columns"], spec["categorical_columns"], spec["model_file"])
+
+
+class ServiceState:
+    """服务中的全部模型与请求计数"""
+
+    def __init__(self, threads, batch_window_ms=0, max_batch_size=DEFAULT_MAX_BATCH_SIZE):
+        self.executor = ThreadPoolExecutor(max_workers=threads, thread_name_prefix="predict")
+        self.batcher = MicroBatcher(batch_window_ms, max_batch_size) if batch_window_ms > 0 else None
+        self.student_models = load_student_models()
+        self.other_models = {
+            "medical": load_other_model("medical", MEDICAL_MODEL_SPEC),
+            "penguin": load_other_model("penguin", PENGUIN_MODEL_SPEC),
+        }
+        self.started_at = time.time()
+        self.requests = 0
+        self.errors = 0
+
+    def student_model(self, profile=None):
+        """取指定档案的学生模型；未指定时使用交互档案，交互档案尚未训练则退回任意可用档案"""
+        if profile:
+            return self.student_models.get(profile)
+        return self.student_models.get(INTERACTIVE_PROFILE) or next(iter(self.student_models.values()), None)
+
+    def reload_changed_student_models(self):
+        """学生模型元数据文件有新增或修改时重新加载（模型由应用后台重训后替换）"""
+        on_disk = {}
+        for profile in MODEL_PROFILES:
+            meta_path = profile_paths(profile)["meta_path"]
+            if os.path.exists(meta_path):
+                on_disk[profile] = os.path.getmtime(meta_path)
+        loaded = {profile: served.meta_mtime for profile, served in self.student_models.items()}
+        if on_disk == loaded:
+            return False
+        self.student_models = load_student_models()
+        versions = {profile: served.version for profile, served in self.student_models.items()}
+        print(f"[server] 已重新加载学生模型：{versions}", flush=True)
+        return True
+
+
+class BaseHandler(tornado.web.RequestHandler):
+    def initialize(self, state):
+        self.state = state
+
+    def set_default_headers(self):
+        self.set_header("Content-Type", "application/json; charset=utf-8")
+
+    def write_json(self, data, status=200):
+        self.set_status(status)
+        self.finish(json.dumps(data, ensure_ascii=False))
+
+    def write_error(self, status_code, **kwargs):
+        self.finish(json.dumps({"error": self._reason}, ensure_ascii=False))
+
+
+class HealthHandler(BaseHandler):
+    def get(self):
+        state = self.state
+        self.write_json({
+            "status": "ok",
+            "uptime_seconds": round(time.time() - state.started_at, 1),
+            "requests": state.requests,
+            "errors": state.errors,
+            "student_profiles": {profile: served.version for profile, served in state.student_models.items()},
+            "models": [name for name, served in state.other_models.items() if served is not None],
+            "micro_batching": state.batcher.stats() if state.batcher is not None else None,
+        })
+
+
+class PredictHandler(BaseHandler):
+    async def post(self, model_name):
+        state = self.state
+        state.requests += 1
+        if model_name == "student":
+            served = state.student_model(self.get_query_argument("profile", None))
+        else:
+            served = state.other_models.get(model_name)
+        if served is None:
+            state.errors += 1
+            return self.write_json({"error": f"模型 {model_name} 不可用"}, status=404)
+
+        try:
+            payload = json.loads(self.request.body or b"{}")
+        except ValueError:
+            state.errors += 1
+            return self.write_json({"error": "请求体不是合法的JSON"}, status=400)
+        is_batch = isinstance(payload, dict) and "instances" in payload
+        instances = payload["instances"] if is_batch else [payload]
+        if not isinstance(instances, list) or not instances:
+            state.errors += 1
+            return self.write_json({"error": "instances 必须是非空数组"}, status=400)
+        if len(instances) > MAX_BATCH_SIZE:
+            state.errors += 1
+            return self.write_json({"error": f"单次最多 {MAX_BATCH_SIZE} 条记录"}, status=413)
+
+        start = time.perf_counter()
+        try:
+            # 预测在线程池中执行，不阻塞事件循环
+            predictions = await asyncio.get_running_loop().run_in_executor(
+                state.executor, served.predict, instances, state.batcher
+            )
+        except InvalidRequest as e:
+            state.errors += 1
+            return self.write_json({"error": str(e)}, status=400)
+
+        result = {
+            "model": served.name,
+            "model_version": served.version,
+            "predict_ms": round((time.perf_counter() - start) * 1000, 3),
+        }
+        if is_batch:
+            result["predictions"] = predictions
+        else:
+            result["prediction"] = predictions[0]
+        self.write_json(result)
+
+
+def make_app(state):
+    return tornado.web.Application([
+        (r"/health", HealthHandler, {"state": state}),
+        (r"/predict/(student|medical|penguin)", PredictHandler, {"state": state}),
+    ])
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="学生成绩 / 医疗费用 / 企鹅分类 预测HTTP服务")
+    parser.add_argument("--port", type=int, default=DEFAULT_PORT)
+    parser.add_argument("--address", default="127.0.0.1")
+    parser.add_argument("--threads", type=int, default=4, help="执行预测的线程数（开启微批处理时应不小于期望的批量）")
+    parser.add_argument("--batch-window-ms", type=float, default=0, help="单条请求的微批等待窗口，0为关闭")
+    parser.add_argument("--max-batch-size", type=int, default=DEFAULT_MAX_BATCH_SIZE)
+    args = parser.parse_args(argv)
+
+    # 与 run_app.py 一致：模型文件按脚本所在目录查找
+    os.chdir(os.path.dirname(os.path.abspath(__file__)))
+    state = ServiceState(args.threads, args.batch_window_ms, args.max_batch_size)
+    if not state.student_models:
+        print("[server] 未找到已训练的学生模型，请先启动一次应用或运行训练", flush=True)
+
+    app = make_app(state)
+    app.listen(args.port, address=args.address)
+    tornado.ioloop.PeriodicCallback(state.reload_changed_student_models, RELOAD_CHECK_MS).start()
+    print(
+        f"[server] 预测服务已启动：http://{args.address}:{args.port} "
+        f"（学生模型档案 {sorted(state.student_models)}，预测线程 {args.threads}）",
+        flush=True
+    )
+    tornado.ioloop.IOLoop.current().start()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,29 @@
+# ---------------------- 应用启动脚本（启动时预热共享数据与模型）----------------------
+# 用法：python run_app.py（服务配置通过 .streamlit/config.toml 或环境变量，
+#       例如 STREAMLIT_SERVER_PORT=8502 python run_app.py）
+# 与 `streamlit run Final_project.py` 等价，但会在服务启动的同时于后台线程中
+# 调用 app_services.warm_up()，首个访问者打开页面时数据与模型已就绪。
+import os
+import sys
+import threading
+
+from streamlit.web import bootstrap
+
+import app_services
+
+APP_SCRIPT = "Final_project.py"
+
+
+def main():
+    # 与 streamlit run 一致：以脚本所在目录为工作目录，保证相对路径的数据文件可被找到
+    os.chdir(os.path.dirname(os.path.abspath(__file__)))
+
+    warm_up_thread = threading.Thread(target=app_services.warm_up, name="warm-up", daemon=True)
+    warm_up_thread.start()
+
+    bootstrap.load_config_options(flag_options={})
+    bootstrap.run(APP_SCRIPT, False, sys.argv[1:], {})
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,113 @@
+# ---------------------- 销售数据筛选引擎（9.py 仪表盘）----------------------
+# 每次加载数据只构建一次：数据按日期排序，日期范围用二分查找得到连续的行区间；
+# 城市、产品类型的每个取值预先计算一张行位图，筛选时只对日期区间内的位图切片做向量化与运算，
+# 耗时与所选日期区间的行数成正比，而不是与全表行数成正比。
+import numpy as np
+import pandas as pd
+
+DATE_COLUMN = "日期"
+FILTER_COLUMNS = ["城市", "产品类型"]
+
+
+class SalesFilterIndex:
+    """按日期排序的销售数据 + 各筛选列的取值位图"""
+
+    def __init__(self, df, filter_columns=FILTER_COLUMNS):
+        self.filter_columns = list(filter_columns)
+        # 侧边栏选项沿用原数据中的出现顺序
+        self.values = {col: list(pd.unique(df[col])) for col in self.filter_columns}
+
+        # 稳定排序：同一天的订单保持原有先后顺序
+        self.df = df.sort_values(DATE_COLUMN, kind="mergesort").reset_index(drop=True)
+        self._dates = self.df[DATE_COLUMN].to_numpy(dtype="datetime64[ns]")
+
+        # 位图：{列名: {取值: 长度为全表行数的布尔数组}}
+        self.bitmaps = {}
+        for col in self.filter_columns:
+            codes, uniques = pd.factorize(self.df[col])
+            self.bitmaps[col] = {value: codes == code for code, value in enumerate(uniques)}
+
+    @property
+    def date_min(self):
+        return self.df[DATE_COLUMN].min()
+
+    @property
+    def date_max(self):
+        return self.df[DATE_COLUMN].max()
+
+    def date_bounds(self, start, end):
+        """日期范围 [start, end] 对应的行区间 [lo, hi)（二分查找）"""
+        lo = np.searchsorted(self._dates, pd.Timestamp(start).to_datetime64(), side="left")
+        hi = np.searchsorted(self._dates, pd.Timestamp(end).to_datetime64(), side="right")
+        return int(lo), int(max(lo, hi))
+
+    def _column_mask(self, col, selected, lo, hi):
+        """某一筛选列在 [lo, hi) 区间内的行掩码；全部取值都选中时返回 None（无需筛选）"""
+        bitmaps = self.bitmaps[col]
+        selected = [value for value in dict.fromkeys(selected) if value in bitmaps]
+        if len(selected) == len(bitmaps):
+            return None
+        if not selected:
+            return np.zeros(hi - lo, dtype=bool)
+        return np.logical_or.reduce([bitmaps[value][lo:hi] for value in selected])
+
+    def row_positions(self, start, end, selections):
+        """返回满足筛选条件的行位置；selections 为 {列名: 选中的取值}。
+        只有日期条件时返回 slice，避免生成整段行号"""
+        lo, hi = self.date_bounds(start, end)
+        mask = None
+        for col, selected in selections.items():
+            column_mask = self._column_mask(col, selected, lo, hi)
+            if column_mask is not None:
+                mask = column_mask if mask is None else mask & column_mask
+        if mask is None:
+            return slice(lo, hi)
+        return lo + np.flatnonzero(mask)
+
+    def filter(self, start, end, selections):
+        """筛选后的数据（与原先四个布尔掩码逐行比较的结果一致，行按日期排序）"""
+        return self.df.iloc[self.row_positions(start, end, selections)]
+
+
+# ---------------------- 日汇总立方体（天 × 城市 × 产品类型）----------------------
+# 加载时把原始订单汇总到 天 × 城市 × 产品类型 单元格；KPI卡片、每周趋势与产品分布都从单元格推导，
+# 单元格同样用 SalesFilterIndex 索引，任意筛选组合都不需要再扫描原始订单。
+ROLLUP_DIMENSIONS = [DATE_COLUMN] + FILTER_COLUMNS
+
+
+def build_sales_rollup(df):
+    """构建日汇总立方体：每行一个 (日期, 城市, 产品类型) 单元格，列为 销售额、评分和、评分数、订单数。
+    订单数为单元格内去重的订单号数；同一订单号只出现在一个单元格中时，各单元格相加即为总订单数"""
+    keys = [df[DATE_COLUMN].dt.normalize()] + [df[col] for col in FILTER_COLUMNS]
+    grouped = df.groupby(keys, observed=True, dropna=False)
+    return pd.DataFrame({
+        "销售额": grouped["总价"].sum(),
+        "评分和": grouped["评分"].sum(),
+        "评分数": grouped["评分"].count(),
+        "订单数": grouped["订单号"].nunique() if "订单号" in df.columns else grouped.size(),
+    }).reset_index()
+
+
+def sales_kpis_from_rollup(cells):
+    """总销售额、平均评分、总订单数、每单均价"""
+    total_sales = cells["销售额"].sum()
+    rating_count = cells["评分数"].sum()
+    total_orders = int(cells["订单数"].sum())
+    return {
+        "total_sales": total_sales,
+        "avg_rating": round(cells["评分和"].sum() / rating_count, 1) if rating_count else float("nan"),
+        "total_orders": total_orders,
+        "avg_sales_per_order": round(total_sales / total_orders, 2) if total_orders > 0 else 0,
+    }
+
+
+def weekly_sales_from_rollup(cells):
+    """每周销售额（与原 groupby(pd.Grouper(key="日期", freq="W")) 结果一致），列为 日期、总价"""
+    weekly = cells.groupby(pd.Grouper(key=DATE_COLUMN, freq="W"))["销售额"].sum()
+    return weekly.rename("总价").reset_index()
+
+
+def product_sales_from_rollup(cells):
+    """各产品类型销售额（升序），列为 产品类型、总价"""
+    product_sales = cells.groupby("产品类型", observed=True)["销售额"].sum().sort_values(ascending=True)
+    return product_sales.rename("总价").reset_index()
@@ -0,0 +1,44 @@
+# ---------------------- 医疗费用 / 企鹅分类模型的加载 ----------------------
+# 10.py、11.py 与预测服务（prediction_server.py）共用同一套模型文件与编码器定义。
+import os
+
+import joblib
+
+from feature_encoder import FeatureEncoder
+
+# 各模型的文件名、分类列及其全部取值（与训练时 drop_first=True 的独热编码一致）
+MEDICAL_MODEL_SPEC = {
+    "model_file": "medical_cost_model.joblib",
+    "features_file": "feature_columns.joblib",
+    "categorical_columns": ["性别", "是否吸烟", "区域"],
+    "categories": {"性别": ["女性", "男性"], "是否吸烟": ["否", "是"], "区域": ["西南部", "东南部", "东北部", "西北部"]},
+    "numeric_columns": ["年龄", "BMI", "子女数量"],
+}
+PENGUIN_MODEL_SPEC = {
+    "model_file": "penguin_model_v2.joblib",
+    "features_file": "penguin_features_v2.joblib",
+    "categorical_columns": ["企鹅栖息的岛屿", "性别"],
+    "categories": {"企鹅栖息的岛屿": ["Biscoe", "Dream", "Torgersen"], "性别": ["雌性", "雄性"]},
+    "numeric_columns": ["喙的长度", "喙的深度", "翅膀的长度", "身体质量", "观测年份"],
+}
+
+
+def load_saved_model(spec, base_dir=None):
+    """加载模型与特征列并构建编码器，返回 (model, encoder)；文件缺失时抛出 OSError"""
+    base_dir = base_dir or os.path.dirname(os.path.abspath(__file__))
+    model = joblib.load(os.path.join(base_dir, spec["model_file"]))
+    feature_columns = joblib.load(os.path.join(base_dir, spec["features_file"]))
+    encoder = FeatureEncoder.from_feature_columns(
+        feature_columns,
+        categorical_columns=spec["categorical_columns"],
+        categories=spec["categories"]
+    )
+    return model, encoder
+
+
+def load_medical_model(base_dir=None):
+    return load_saved_model(MEDICAL_MODEL_SPEC, base_dir)
+
+
+def load_penguin_model(base_dir=None):
+    return load_saved_model(PENGUIN_MODEL_SPEC, base_dir)
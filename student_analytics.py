@@ -0,0 +1,90 @@
+# ---------------------- 专业聚合立方体（专业 × 性别）----------------------
+# 每个数据版本只扫描一次全量数据，得到 专业 × 性别 单元格的人数、各指标的和与平方和；
+# 页面上的所有统计表、图表和比例都从立方体推导，耗时只与专业数量有关。
+import pandas as pd
+
+CUBE_DIMENSIONS = ["专业", "性别"]
+CUBE_METRICS = ["每周学习时长", "上课出勤率", "期中考试分数", "作业完成率", "期末考试分数"]
+
+# 专业统计表的列名 -> 对应的指标列
+MAJOR_STAT_COLUMNS = {
+    "平均学习时长": "每周学习时长",
+    "期中平均分": "期中考试分数",
+    "期末平均分": "期末考试分数",
+    "平均出勤率": "上课出勤率",
+}
+
+
+def build_major_cube(df):
+    """构建聚合立方体：索引为 (专业, 性别)，列为 人数、<指标>_sum、<指标>_sumsq"""
+    # 以float64累加，避免float32在大数据量下的精度损失
+    metrics = df[CUBE_METRICS].astype("float64")
+    keys = [df[dim] for dim in CUBE_DIMENSIONS]
+
+    sums = metrics.groupby(keys, observed=True).sum().add_suffix("_sum")
+    sumsq = (metrics * metrics).groupby(keys, observed=True).sum().add_suffix("_sumsq")
+    counts = metrics.groupby(keys, observed=True).size().rename("人数")
+
+    return pd.concat([counts, sums, sumsq], axis=1)
+
+
+def major_statistics_from_cube(cube):
+    """各专业统计表（与原 groupby("专业").agg(...) 结果一致）"""
+    by_major = cube.groupby(level="专业", observed=True).sum()
+    counts = by_major["人数"]
+
+    stats = pd.DataFrame(index=by_major.index)
+    for stat_name, metric in MAJOR_STAT_COLUMNS.items():
+        stats[stat_name] = by_major[f"{metric}_sum"] / counts
+    stats["学生人数"] = counts.astype("int64")
+    return stats.round(2)
+
+
+def gender_dist_from_cube(cube):
+    """各专业男女人数（与原 pd.crosstab(专业, 性别) 结果一致）"""
+    gender_dist = cube["人数"].unstack(level="性别", fill_value=0).astype("int64")
+    gender_dist.columns.name = "性别"
+    return gender_dist
+
+
+def gender_ratio_from_cube(cube):
+    """各专业男女比例"""
+    gender_dist = gender_dist_from_cube(cube)
+    return gender_dist.div(gender_dist.sum(axis=1), axis=0)
+
+
+def radar_values_from_statistics(major_statistics, major):
+    """雷达图归一化数据（期末、期中、学习时长、出勤率、学生规模）"""
+    major_data = major_statistics.loc[major]
+    max_vals = major_statistics.max()
+    min_vals = major_statistics.min()
+
+    def _normalize(column):
+        value_range = max_vals[column] - min_vals[column]
+        return (major_data[column] - min_vals[column]) / value_range if value_range else 0.0
+
+    return [
+        _normalize('期末平均分'),
+        _normalize('期中平均分'),
+        _normalize('平均学习时长'),
+        major_data['平均出勤率'],
+        _normalize('学生人数'),
+    ]
+
+
+def overall_summary_from_cube(cube):
+    """全体学生的概览指标：学生人数、专业数量、期末平均分、平均出勤率"""
+    total = cube["人数"].sum()
+    return {
+        "学生人数": int(total),
+        "专业数量": cube.index.get_level_values("专业").nunique(),
+        "期末平均分": cube["期末考试分数_sum"].sum() / total if total else float("nan"),
+        "平均出勤率": cube["上课出勤率_sum"].sum() / total if total else float("nan"),
+    }
+
+
+def merge_cubes(cube, delta_cube):
+    """把新增数据的立方体合并进已有立方体（人数、和、平方和均可直接相加）"""
+    merged = cube.add(delta_cube, fill_value=0)
+    merged["人数"] = merged["人数"].astype("int64")
+    return merged
@@ -0,0 +1,192 @@
+# ---------------------- 专业数据分析页与成绩预测页图表 ----------------------
+# 每个函数只负责根据输入数据构建 matplotlib 图形并返回，渲染与缓存由 figure_cache.py 负责。
+# 应用只在图表页导入本模块，matplotlib 的导入与全局样式配置也随之推迟到首次绘图时。
+import matplotlib.pyplot as plt
+import numpy as np
+
+# 全局样式（解决中文乱码，统一图表格式）；先应用默认样式，再覆盖字体与网格设置
+plt.style.use('default')
+plt.rcParams["font.sans-serif"] = ["SimHei", "Microsoft YaHei", "WenQuanYi Micro Hei"]
+plt.rcParams["axes.unicode_minus"] = False
+plt.rcParams["figure.titlesize"] = 14
+plt.rcParams["axes.labelsize"] = 12
+plt.rcParams["legend.fontsize"] = 10
+plt.rcParams["figure.autolayout"] = True  # 自适应布局
+plt.rcParams["axes.grid"] = True  # 启用网格
+plt.rcParams["grid.alpha"] = 0.3  # 网格透明度
+plt.rcParams["grid.linestyle"] = "--"  # 网格线样式
+
+
+def plot_major_comparison(major_statistics):
+    """综合对比图：各专业期中期末成绩对比 + 学习时长与出勤率对比"""
+    fig, (ax1, ax2) = plt.subplots(2, 1, figsize=(12, 10))
+
+    # 成绩对比
+    x_pos = np.arange(len(major_statistics))
+    width = 0.35
+
+    bars1 = ax1.bar(x_pos - width/2, major_statistics['期末平均分'], 
+                   width, color='#4CAF50', alpha=0.7, label='期末平均分')
+    bars2 = ax1.bar(x_pos + width/2, major_statistics['期中平均分'],
+                   width, color='#2196F3', alpha=0.7, label='期中平均分')
+    ax1.set_ylabel('分数', fontsize=12)
+    ax1.set_title('各专业期中期末成绩对比', fontsize=14, fontweight='bold')
+    ax1.set_xticks(x_pos)
+    ax1.set_xticklabels(major_statistics.index, rotation=45, ha='right')
+    ax1.legend()
+    ax1.grid(True, alpha=0.3, linestyle='--')
+
+    # 添加数值标签
+    for bars in [bars1, bars2]:
+        for bar in bars:
+            height = bar.get_height()
+            ax1.annotate(f'{height:.1f}',
+                       xy=(bar.get_x() + bar.get_width() / 2, height),
+                       xytext=(0, 3),
+                       textcoords="offset points",
+                       ha='center', va='bottom', fontsize=9)
+
+    # 学习时长和出勤率
+    ax2_twin = ax2.twinx()
+
+    # 学习时长柱状图
+    bars3 = ax2.bar(x_pos, major_statistics['平均学习时长'], 
+                   color='#FF9800', alpha=0.7, width=0.4, label='平均学习时长')
+    ax2.set_ylabel('学习时长(小时)', fontsize=12, color='#FF9800')
+    ax2.set_xticks(x_pos)
+    ax2.set_xticklabels(major_statistics.index, rotation=45, ha='right')
+    ax2.tick_params(axis='y', labelcolor='#FF9800')
+
+    # 出勤率折线图
+    line = ax2_twin.plot(x_pos, major_statistics['平均出勤率']*100,
+                       color='#9C27B0', marker='o', linewidth=2, label='平均出勤率')
+    ax2_twin.set_ylabel('出勤率(%)', fontsize=12, color='#9C27B0')
+    ax2_twin.tick_params(axis='y', labelcolor='#9C27B0')
+
+    ax2.set_title('学习时长与出勤率对比', fontsize=14, fontweight='bold')
+    ax2.grid(True, alpha=0.3, linestyle='--')
+
+    # 合并图例
+    lines_labels = [ax2.get_legend_handles_labels(), ax2_twin.get_legend_handles_labels()]
+    lines, labels = [sum(lol, []) for lol in zip(*lines_labels)]
+    ax2.legend(lines, labels, loc='upper left')
+
+    fig.tight_layout()
+    return fig
+
+
+def plot_gender_distribution(gender_dist):
+    """各专业男女生分布柱状图"""
+    fig, ax = plt.subplots(figsize=(10, 6))
+    x_pos = np.arange(len(gender_dist))
+    width = 0.35
+
+    if len(gender_dist.columns) >= 2:
+        bars_male = ax.bar(x_pos - width/2, gender_dist.iloc[:, 0], width, 
+                          color='#4285F4', alpha=0.7, label=gender_dist.columns[0])
+        bars_female = ax.bar(x_pos + width/2, gender_dist.iloc[:, 1], width,
+                            color='#EA4335', alpha=0.7, label=gender_dist.columns[1])
+    elif len(gender_dist.columns) == 1:
+        bars = ax.bar(x_pos, gender_dist.iloc[:, 0], width, 
+                     color='#4285F4', alpha=0.7, label=gender_dist.columns[0])
+
+    ax.set_xlabel('专业', fontsize=12)
+    ax.set_ylabel('学生人数', fontsize=12)
+    ax.set_title('各专业男女生分布', fontsize=14, fontweight='bold')
+    ax.set_xticks(x_pos)
+    ax.set_xticklabels(gender_dist.index, rotation=45, ha='right')
+    ax.legend(title='性别')
+    ax.grid(True, alpha=0.3, axis='y', linestyle='--')
+    fig.tight_layout()
+    return fig
+
+
+def plot_major_radar(norm_data, categories, title):
+    """专业综合表现雷达图"""
+    fig, ax = plt.subplots(figsize=(8, 8), subplot_kw=dict(projection='polar'))
+
+    angles = [n / float(len(categories)) * 2 * np.pi for n in range(len(categories))]
+    angles += angles[:1]
+    norm_data = list(norm_data) + list(norm_data[:1])
+
+    ax.plot(angles, norm_data, 'o-', linewidth=2, color='#4169E1')
+    ax.fill(angles, norm_data, alpha=0.25, color='#4169E1')
+    ax.set_xticks(angles[:-1])
+    ax.set_xticklabels(categories)
+    ax.set_title(title, size=14, fontweight='bold')
+    ax.grid(True, alpha=0.3, linestyle='--')
+    return fig
+
+
+def plot_sensitivity_curves(curves, labels, current_values, target):
+    """成绩敏感性曲线：每个特征一个子图，标出当前取值与及格线"""
+    fig, axes = plt.subplots(2, 2, figsize=(12, 8))
+    for ax, (col, curve) in zip(axes.flat, curves.items()):
+        ax.plot(curve['取值'], curve['预测分数'], color='#2196F3', linewidth=2)
+        ax.axhline(target, color='#F44336', linestyle='--', linewidth=1, label=f'及格线 {target}')
+        ax.axvline(current_values[col], color='#FF9800', linestyle=':', linewidth=1.5, label='当前取值')
+        ax.set_title(labels[col], fontsize=12, fontweight='bold')
+        ax.set_ylabel('预测期末成绩', fontsize=10)
+        ax.grid(True, alpha=0.3, linestyle='--')
+        ax.legend(fontsize=9)
+    for ax in list(axes.flat)[len(curves):]:
+        ax.set_visible(False)
+
+    fig.tight_layout()
+    return fig
+
+
+def plot_feature_importances(importances):
+    """特征重要性水平条形图（importances 为按重要性降序的 [{"特征", "重要性"}]）"""
+    fig, ax = plt.subplots(figsize=(10, 5))
+    names = [item['特征'] for item in importances][::-1]
+    values = [item['重要性'] for item in importances][::-1]
+
+    bars = ax.barh(names, values, color='#4169E1', alpha=0.8)
+    for bar in bars:
+        ax.annotate(f'{bar.get_width():.1%}',
+                    xy=(bar.get_width(), bar.get_y() + bar.get_height() / 2),
+                    xytext=(3, 0),
+                    textcoords="offset points",
+                    ha='left', va='center', fontsize=9)
+    ax.set_xlabel('重要性', fontsize=12)
+    ax.set_title('随机森林特征重要性', fontsize=14, fontweight='bold')
+    ax.grid(True, alpha=0.3, axis='x', linestyle='--')
+    fig.tight_layout()
+    return fig
+
+
+def plot_partial_dependence(curves, labels):
+    """部分依赖曲线：curves 为 {特征: (取值, 平均预测成绩)}，每个特征一个子图"""
+    fig, axes = plt.subplots(2, 2, figsize=(12, 8))
+    for ax, (col, (grid, mean)) in zip(axes.flat, curves.items()):
+        ax.plot(grid, mean, 'o-', color='#4CAF50', linewidth=2, markersize=4)
+        ax.set_title(labels[col], fontsize=12, fontweight='bold')
+        ax.set_ylabel('平均预测期末成绩', fontsize=10)
+        ax.grid(True, alpha=0.3, linestyle='--')
+    for ax in list(axes.flat)[len(curves):]:
+        ax.set_visible(False)
+
+    fig.tight_layout()
+    return fig
+
+
+def plot_latency_accuracy(sweep_df):
+    """延迟-精度曲线：横轴为单行预测延迟，纵轴为留出集MAE，每个深度一条折线，点旁标注树的数量"""
+    fig, ax = plt.subplots(figsize=(10, 6))
+    for max_depth, group in sweep_df.groupby('max_depth'):
+        group = group.sort_values('n_estimators')
+        ax.plot(group['single_row_ms'], group['mae'], 'o-', linewidth=2, label=f'深度 {max_depth}')
+        for _, row in group.iterrows():
+            ax.annotate(f"{int(row['n_estimators'])}",
+                        xy=(row['single_row_ms'], row['mae']),
+                        xytext=(4, 4),
+                        textcoords="offset points",
+                        fontsize=8)
+    ax.set_xlabel('单行预测延迟(ms)', fontsize=12)
+    ax.set_ylabel('留出集MAE', fontsize=12)
+    ax.set_title('树的数量/深度：延迟与精度', fontsize=14, fontweight='bold')
+    ax.legend()
+    ax.grid(True, alpha=0.3, linestyle='--')
+    fig.tight_layout()
+    return fig
@@ -0,0 +1,223 @@
+# ---------------------- student.csv 增量导入（文件监听）----------------------
+# 用 watchdog 监听 student.csv 所在目录：文件被追加写入时只读取上次位置之后的新字节，
+# 按首次加载时的表头与编码解析、校验核心列，再把新增行追加到内存数据，并把新增行的聚合立方体
+# 合并进已有立方体，无需重新加载全量数据。文件被截断或开头内容变化（整体重写）时才完整重新加载。
+import hashlib
+import io
+import os
+import threading
+import time
+from typing import NamedTuple
+
+import pandas as pd
+from watchdog.events import FileSystemEventHandler
+from watchdog.observers import Observer
+
+from data_loader import (
+    CACHE_DIR,
+    CORE_DATA_COLUMNS,
+    NUMERIC_CORE_COLUMNS,
+    SNIFF_SAMPLE_BYTES,
+    MissingColumnsError,
+    _clean_column_name,
+    _read_header,
+    append_student_rows,
+    coerce_numeric_columns,
+    compact_student_frame,
+    content_hasher,
+    fingerprint_from_content,
+    load_student_core,
+    sniff_encoding
+)
+from student_analytics import build_major_cube, merge_cubes
+
+# 用于判断文件是否被整体重写的开头字节数
+HEAD_CHECK_BYTES = 64 * 1024
+
+
+class LiveSnapshot(NamedTuple):
+    """某一时刻的完整数据及其派生聚合（只读，替换时整体换成新对象）"""
+    df: pd.DataFrame
+    fingerprint: str
+    major_cube: pd.DataFrame
+    version: int
+
+
+def _head_digest(csv_path, length):
+    with open(csv_path, "rb") as f:
+        return hashlib.blake2b(f.read(length), digest_size=16).hexdigest()
+
+
+class LiveStudentDataset:
+    """持有内存中的学生数据；refresh() 检测文件的追加写入并增量应用"""
+
+    def __init__(self, csv_path="student.csv", cache_dir=CACHE_DIR):
+        self.csv_path = os.path.abspath(csv_path)
+        self.cache_dir = cache_dir
+        self._lock = threading.Lock()
+        self._observer = None
+        self._listeners = []
+        # 最近一次导入的结果：{"time", "rows", "rejected", "seconds", "mode"}
+        self.ingest_events = []
+        self.last_error = None
+        self._full_load(version=0)
+
+    def current(self):
+        """当前数据快照（读取引用本身是原子的）"""
+        return self._snapshot
+
+    def add_listener(self, listener):
+        """注册数据更新回调：listener(snapshot, new_rows)，在监听线程中调用"""
+        self._listeners.append(listener)
+
+    def _full_load(self, version):
+        # 记录已读取到的位置及其之前内容的哈希（追加后只需哈希新字节），
+        # 以及表头与编码（追加的新行沿用同一表头解析）
+        stat = os.stat(self.csv_path)
+        self._offset = stat.st_size
+        self._content_hasher = content_hasher(self.csv_path, self._offset)
+        fingerprint = fingerprint_from_content(self._content_hasher.hexdigest(), self._offset, stat.st_mtime_ns)
+        df = load_student_core(self.csv_path, cache_dir=self.cache_dir, fingerprint=fingerprint)
+        with open(self.csv_path, "rb") as f:
+            sample = f.read(SNIFF_SAMPLE_BYTES)
+        self._encoding = sniff_encoding(sample)
+        self._header = [_clean_column_name(col) for col in _read_header(sample, self._encoding)]
+        self._head_length = min(self._offset, HEAD_CHECK_BYTES)
+        self._head_digest = _head_digest(self.csv_path, self._head_length)
+        self._snapshot = LiveSnapshot(df, fingerprint, build_major_cube(df), version)
+
+    def _parse_new_rows(self, raw_bytes):
+        """解析追加的字节（只含完整的行），返回 (紧凑数据, 被拒绝的行数)"""
+        missing_columns = [col for col in CORE_DATA_COLUMNS if col not in self._header]
+        if missing_columns:
+            raise MissingColumnsError(missing_columns)
+        # 编码沿用首次探测的结果；UTF-8 BOM 只出现在文件开头
+        encoding = "utf-8" if self._encoding == "utf-8-sig" else self._encoding
+        lines = sum(1 for line in raw_bytes.splitlines() if line.strip())
+        delta = pd.read_csv(
+            io.BytesIO(raw_bytes),
+            header=None,
+            names=self._header,
+            usecols=CORE_DATA_COLUMNS,
+            dtype=str,
+            encoding=encoding,
+            on_bad_lines="skip",
+            skip_blank_lines=True,
+            engine="c"
+        )
+        # 与全量加载相同的规则：指标无法解析为数值的行整行丢弃
+        numeric_columns = list(NUMERIC_CORE_COLUMNS)
+        if pd.api.types.is_numeric_dtype(self._snapshot.df["学号"]):
+            numeric_columns.append("学号")
+        valid = coerce_numeric_columns(delta, numeric_columns).dropna(axis=0, how="any")
+        return compact_student_frame(valid[CORE_DATA_COLUMNS].reset_index(drop=True)), max(lines - len(valid), 0)
+
+    def refresh(self):
+        """检查文件变化并应用；返回是否更新了数据。数据更新回调在释放锁之后调用，回调中可以访问本对象"""
+        with self._lock:
+            new_rows = self._apply_changes()
+            snapshot = self._snapshot
+        if new_rows is None:
+            return False
+        self._notify(snapshot, new_rows)
+        return True
+
+    def _apply_changes(self):
+        """在锁内检测并应用文件变化；返回新增行数（数据未更新时返回 None）"""
+        start = time.perf_counter()
+        try:
+            size = os.path.getsize(self.csv_path)
+        except OSError:
+            return None
+        if size == self._offset:
+            return None
+
+        snapshot = self._snapshot
+        if size < self._offset or _head_digest(self.csv_path, self._head_length) != self._head_digest:
+            # 截断或重写：完整重新加载；新增行数按前后行数之差计（原地修改不计为新增）
+            self._full_load(snapshot.version + 1)
+            self._record("reload", len(self._snapshot.df), 0, start)
+            return max(len(self._snapshot.df) - len(snapshot.df), 0)
+
+        with open(self.csv_path, "rb") as f:
+            f.seek(self._offset)
+            raw_bytes = f.read(size - self._offset)
+        # 只处理到最后一个换行符为止，写了一半的行留到下一次
+        complete_length = raw_bytes.rfind(b"\n") + 1
+        if complete_length == 0:
+            return None
+        delta, rejected = self._parse_new_rows(raw_bytes[:complete_length])
+        self._offset += complete_length
+        # 指纹在已有内容哈希上增量扩展，与重新计算整个文件的 file_fingerprint 一致
+        self._content_hasher.update(raw_bytes[:complete_length])
+        fingerprint = fingerprint_from_content(
+            self._content_hasher.hexdigest(), self._offset, os.stat(self.csv_path).st_mtime_ns
+        )
+
+        df = append_student_rows(snapshot.df, delta)
+        major_cube = merge_cubes(snapshot.major_cube, build_major_cube(delta)) if len(delta) else snapshot.major_cube
+        self._snapshot = LiveSnapshot(df, fingerprint, major_cube, snapshot.version + 1)
+        self._record("append", len(delta), rejected, start)
+        return len(delta)
+
+    def _record(self, mode, rows, rejected, start):
+        self.ingest_events.append({
+            "time": time.strftime("%Y-%m-%d %H:%M:%S"),
+            "mode": mode,
+            "rows": rows,
+            "rejected": rejected,
+            "seconds": round(time.perf_counter() - start, 4),
+        })
+        del self.ingest_events[:-20]
+        print(f"[ingest] {mode}：{rows} 行（拒绝 {rejected} 行），耗时 {self.ingest_events[-1]['seconds']}s", flush=True)
+
+    def _notify(self, snapshot, new_rows):
+        for listener in self._listeners:
+            listener(snapshot, new_rows)
+
+    def _safe_refresh(self):
+        try:
+            self.refresh()
+            self.last_error = None
+        except Exception as e:
+            self.last_error = f"{type(e).__name__}: {e}"
+            print(f"[ingest] 增量导入失败：{self.last_error}", flush=True)
+
+    def start_watching(self):
+        """开始监听文件所在目录（重复调用无副作用）"""
+        if self._observer is not None:
+            return
+        self._observer = Observer()
+        self._observer.schedule(_CsvChangeHandler(self), os.path.dirname(self.csv_path), recursive=False)
+        self._observer.daemon = True
+        self._observer.start()
+        # 启动监听前已经发生的追加
+        self._safe_refresh()
+
+    def stop_watching(self):
+        if self._observer is not None:
+            self._observer.stop()
+            self._observer.join()
+            self._observer = None
+
+
+class _CsvChangeHandler(FileSystemEventHandler):
+    """只响应目标CSV文件的修改、创建与替换事件"""
+
+    def __init__(self, dataset):
+        self.dataset = dataset
+
+    def _matches(self, path):
+        return os.path.abspath(path) == self.dataset.csv_path
+
+    def on_modified(self, event):
+        if not event.is_directory and self._matches(event.src_path):
+            self.dataset._safe_refresh()
+
+    def on_created(self, event):
+        if not event.is_directory and self._matches(event.src_path):
+            self.dataset._safe_refresh()
+
+    def on_moved(self, event):
+        if not event.is_directory and self._matches(event.dest_path):
+            self.dataset._safe_refresh()
@@ -0,0 +1,592 @@
+# ---------------------- 学生期末成绩预测模型（训练 / 加载）----------------------
+# 与界面无关的纯逻辑，供 Streamlit 应用与命令行脚本共同使用。
+# 模型文件附带元数据（训练数据指纹、特征列、MAE），数据变化后旧模型继续服务，
+# 同时在后台线程中重新训练，训练完成后原子替换。
+# 支持多个模型档案（快速/标准/梯度提升），各自保存文件并记录实测延迟、吞吐量与MAE。
+# sklearn 只在训练（或加载没有紧凑森林的模型）时导入，joblib 只在读写模型文件时导入，
+# 应用启动与翻页时不必承担它们的导入耗时。
+import json
+import os
+import threading
+import time
+
+import numpy as np
+import pandas as pd
+
+from compact_forest import CompactForest, max_prediction_diff
+from feature_encoder import FeatureEncoder, predict_matrix
+from model_insights import compute_model_insights, load_insights, save_insights
+from training_metrics import append_metrics
+
+MODEL_FILE_PATH = "student_final_score_model.joblib"
+FEATURES_FILE_PATH = "student_model_features.joblib"
+ENCODER_FILE_PATH = "student_feature_encoder.joblib"
+META_FILE_PATH = "student_model_meta.json"
+# 紧凑森林（内存映射的扁平节点数组）
+COMPACT_NODES_PATH = "student_model_nodes.npy"
+COMPACT_ROOTS_PATH = "student_model_roots.npy"
+# 紧凑森林与 sklearn 预测允许的最大差异（仅浮点累加顺序带来的误差）
+COMPACT_MAX_DIFF = 1e-9
+COMPACT_CHECK_ROWS = 2000
+# 紧凑森林只用于单行与微批预测；超过该行数的批量预测交给 sklearn（逐层下降在大批量上更慢）
+COMPACT_MAX_ROWS = 256
+# 训练时预先计算的特征重要性与部分依赖
+INSIGHTS_FILE_PATH = "student_model_insights.json"
+TARGET_COLUMN = "期末考试分数"
+# 学号只是标识符，不参与训练
+ID_COLUMN = "学号"
+CATEGORICAL_COLUMNS = ["性别", "专业"]
+NUMERIC_FEATURE_COLUMNS = ["每周学习时长", "上课出勤率", "期中考试分数", "作业完成率"]
+# 应用默认的随机森林规模（可用 train_pipeline.py 的扫描结果调整）
+DEFAULT_N_ESTIMATORS = 150
+DEFAULT_MAX_DEPTH = 10
+# 模型档案：交互预测更看重单行延迟，批量预测更看重精度
+MODEL_PROFILES = {
+    "fast": {
+        "label": "快速（30棵树，深度8）",
+        "estimator": "random_forest",
+        "params": {"n_estimators": 30, "max_depth": 8},
+    },
+    "standard": {
+        "label": f"标准（{DEFAULT_N_ESTIMATORS}棵树，深度{DEFAULT_MAX_DEPTH}）",
+        "estimator": "random_forest",
+        "params": {"n_estimators": DEFAULT_N_ESTIMATORS, "max_depth": DEFAULT_MAX_DEPTH},
+    },
+    "hgb": {
+        "label": "梯度提升（HistGradientBoosting）",
+        "estimator": "hist_gradient_boosting",
+        "params": {"max_iter": 300, "learning_rate": 0.05, "max_depth": 6},
+    },
+}
+DEFAULT_PROFILE = "standard"
+INTERACTIVE_PROFILE = "fast"
+BATCH_PROFILE = "standard"
+# 数据行数相对模型训练时的变化达到该比例才重新训练（启动检查与增量导入共用；在此之前现有模型继续服务）
+RETRAIN_GROWTH_FRACTION = 0.05
+# 测量单行延迟时的采样次数
+LATENCY_SAMPLES = 200
+# 固定的留出集划分
+HOLDOUT_SIZE = 0.2
+SPLIT_RANDOM_STATE = 42
+# 批量预测时上传文件必须包含的列（与表单录入的信息一致）
+PREDICTION_INPUT_COLUMNS = CATEGORICAL_COLUMNS + NUMERIC_FEATURE_COLUMNS
+
+
+def encode_training_frame(df_input):
+    """独热编码分类特征，返回 (X, y)"""
+    df_encoded = pd.get_dummies(
+        df_input,
+        columns=CATEGORICAL_COLUMNS,
+        drop_first=True,
+        dtype=int
+    )
+    X = df_encoded.drop(columns=[TARGET_COLUMN, ID_COLUMN], errors="ignore")
+    y = df_encoded[TARGET_COLUMN]
+    return X, y
+
+
+def holdout_split(X, y):
+    """固定的训练/留出集划分（应用训练与训练流水线共用）"""
+    from sklearn.model_selection import train_test_split
+
+    return train_test_split(X, y, test_size=HOLDOUT_SIZE, random_state=SPLIT_RANDOM_STATE)
+
+
+def build_estimator(profile=DEFAULT_PROFILE):
+    """根据模型档案构建未训练的模型"""
+    spec = MODEL_PROFILES[profile]
+    if spec["estimator"] == "hist_gradient_boosting":
+        from sklearn.ensemble import HistGradientBoostingRegressor
+
+        return HistGradientBoostingRegressor(random_state=42, **spec["params"])
+    from sklearn.ensemble import RandomForestRegressor
+
+    return RandomForestRegressor(random_state=42, n_jobs=-1, **spec["params"])
+
+
+def train_model(df_input, profile=DEFAULT_PROFILE):
+    """按模型档案训练，返回 (model, encoder, mae)；训练耗时与MAE写入训练指标日志"""
+    from sklearn.metrics import mean_absolute_error
+
+    X, y = encode_training_frame(df_input)
+
+    # 数据集划分
+    X_train, X_test, y_train, y_test = holdout_split(X, y)
+
+    # 模型训练
+    model = build_estimator(profile)
+    start = time.perf_counter()
+    model.fit(X_train, y_train)
+    fit_seconds = time.perf_counter() - start
+
+    # 模型评估
+    start = time.perf_counter()
+    y_pred = model.predict(X_test)
+    predict_seconds = time.perf_counter() - start
+    mae = mean_absolute_error(y_test, y_pred)
+
+    append_metrics({
+        "kind": "train",
+        "profile": profile,
+        **MODEL_PROFILES[profile]["params"],
+        "n_rows": int(len(df_input)),
+        "n_cores": os.cpu_count(),
+        "fit_seconds": round(fit_seconds, 4),
+        "predict_seconds": round(predict_seconds, 4),
+        "mae": float(mae),
+    })
+
+    encoder = FeatureEncoder.fit(df_input, X.columns.tolist(), CATEGORICAL_COLUMNS)
+    return model, encoder, mae
+
+
+def load_encoder(encoder_path, features, df_input=None):
+    """加载编码器；缺失或版本不匹配时根据特征列重新构建（有训练数据时补全全部类别）"""
+    try:
+        encoder = FeatureEncoder.load(encoder_path)
+        if encoder.feature_columns == list(features):
+            return encoder
+    except Exception:
+        pass
+    if df_input is not None:
+        encoder = FeatureEncoder.fit(df_input, features, CATEGORICAL_COLUMNS)
+    else:
+        encoder = FeatureEncoder.from_feature_columns(features, CATEGORICAL_COLUMNS)
+    encoder.save(encoder_path)
+    return encoder
+
+
+class ModelReplacedError(RuntimeError):
+    """磁盘上的模型文件已被其他进程（另一个工作进程或 train_pipeline.py）替换为新版本"""
+
+
+class ModelBundle:
+    """一次训练的全部产物：模型、编码器、元数据，以及校验通过的紧凑森林（可选）"""
+
+    def __init__(self, encoder, meta, model=None, compact=None, insights=None,
+                 model_path=MODEL_FILE_PATH, meta_path=META_FILE_PATH):
+        self.encoder = encoder
+        self.meta = meta
+        self.compact = compact
+        self.insights = insights
+        self._model = model
+        self._model_path = model_path
+        self._meta_path = meta_path
+        self._lock = threading.Lock()
+
+    @property
+    def version(self):
+        return self.meta.get("model_version", "legacy")
+
+    @property
+    def model(self):
+        """完整的 sklearn 模型；有紧凑森林时只在确实需要（如重新导出）时才从磁盘加载"""
+        if self._model is None:
+            with self._lock:
+                if self._model is None:
+                    if _read_meta(self._meta_path).get("model_version") != self.meta.get("model_version"):
+                        raise ModelReplacedError("磁盘上的模型文件已被新版本替换")
+                    import joblib
+
+                    self._model = joblib.load(self._model_path, mmap_mode="r")
+        return self._model
+
+    @property
+    def predictor(self):
+        """单行与微批预测的对象：优先使用紧凑森林（numpy推理），否则使用 sklearn 模型"""
+        return self.compact if self.compact is not None else self.model
+
+    @property
+    def batch_predictor(self):
+        """批量与分块预测的对象：sklearn 模型"""
+        return self.model
+
+    def predictor_for(self, n_rows):
+        """按行数选择预测对象：不超过 COMPACT_MAX_ROWS 行用紧凑森林，更多行用 sklearn 模型"""
+        return self.predictor if n_rows <= COMPACT_MAX_ROWS else self.batch_predictor
+
+
+def _atomic_dump(obj, path):
+    """先写临时文件再替换，其他进程不会读到写了一半的文件"""
+    import joblib
+
+    tmp_path = f"{path}.tmp{os.getpid()}"
+    joblib.dump(obj, tmp_path)
+    os.replace(tmp_path, path)
+
+
+def _atomic_write_json(data, path):
+    tmp_path = f"{path}.tmp{os.getpid()}"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump(data, f, ensure_ascii=False, indent=2)
+    os.replace(tmp_path, path)
+
+
+def _read_meta(meta_path):
+    try:
+        with open(meta_path, encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
+def export_compact_forest(model, X_check):
+    """导出紧凑森林并与 sklearn 预测对比校验；模型不支持或校验不通过时返回 (None, 差异)"""
+    estimators = getattr(model, "estimators_", None)
+    if not estimators or not hasattr(estimators[0], "tree_") or getattr(model, "n_outputs_", 1) != 1:
+        return None, None
+    compact = CompactForest.from_sklearn(model)
+    diff = max_prediction_diff(compact, model, X_check)
+    return (compact if diff <= COMPACT_MAX_DIFF else None), diff
+
+
+def benchmark_predictor(predictor, X, batch_predictor=None):
+    """实测单行预测延迟（p50/p99，毫秒）与整批吞吐量（行/秒）；整批默认用 batch_predictor 测量"""
+    timings = np.empty(min(LATENCY_SAMPLES, len(X)))
+    for i in range(len(timings)):
+        start = time.perf_counter()
+        predict_matrix(predictor, X[i:i + 1])
+        timings[i] = time.perf_counter() - start
+
+    start = time.perf_counter()
+    predict_matrix(batch_predictor if batch_predictor is not None else predictor, X)
+    batch_seconds = time.perf_counter() - start
+    return {
+        "single_row_p50_ms": round(float(np.percentile(timings, 50)) * 1000, 3),
+        "single_row_p99_ms": round(float(np.percentile(timings, 99)) * 1000, 3),
+        "batch_rows_per_second": round(len(X) / batch_seconds, 1) if batch_seconds else None,
+        "batch_rows": int(len(X)),
+    }
+
+
+def _check_rows(df_input, encoder):
+    sample = df_input.sample(n=min(COMPACT_CHECK_ROWS, len(df_input)), random_state=0)
+    return encoder.transform_frame(sample)
+
+
+def train_model_bundle(df_input, data_fingerprint, profile=DEFAULT_PROFILE):
+    """按模型档案训练并生成元数据（训练数据指纹、特征列、MAE、实测延迟、版本号），同时导出紧凑森林"""
+    start = time.perf_counter()
+    model, encoder, mae = train_model(df_input, profile)
+    trained_at = time.strftime("%Y-%m-%d %H:%M:%S")
+    X_check = _check_rows(df_input, encoder)
+    compact, compact_diff = export_compact_forest(model, X_check)
+    predictor = compact if compact is not None else model
+    model_version = f"{time.strftime('%Y%m%d%H%M%S')}-{data_fingerprint[:8]}-{profile}"
+    insights = compute_model_insights(model, encoder, df_input, NUMERIC_FEATURE_COLUMNS, model_version)
+    meta = {
+        "model_version": model_version,
+        "profile": profile,
+        "data_fingerprint": data_fingerprint,
+        "feature_columns": encoder.feature_columns,
+        "mae": float(mae),
+        "n_rows": int(len(df_input)),
+        "trained_at": trained_at,
+        "train_seconds": round(time.perf_counter() - start, 2),
+        "compact_forest": _compact_meta(compact, compact_diff),
+        "benchmark": benchmark_predictor(predictor, X_check, batch_predictor=model),
+    }
+    return ModelBundle(encoder=encoder, meta=meta, model=model, compact=compact, insights=insights)
+
+
+def _compact_meta(compact, diff):
+    if compact is None:
+        return None
+    return {"n_nodes": int(len(compact.nodes)), "n_trees": int(compact.n_trees), "max_abs_diff": diff}
+
+
+def _with_profile_suffix(path, profile):
+    root, ext = os.path.splitext(path)
+    return f"{root}_{profile}{ext}"
+
+
+def profile_paths(profile=DEFAULT_PROFILE):
+    """模型档案的文件路径（save/load_model_bundle 的关键字参数）；默认档案沿用原有文件名"""
+    paths = {
+        "model_path": MODEL_FILE_PATH,
+        "features_path": FEATURES_FILE_PATH,
+        "encoder_path": ENCODER_FILE_PATH,
+        "meta_path": META_FILE_PATH,
+        "nodes_path": COMPACT_NODES_PATH,
+        "roots_path": COMPACT_ROOTS_PATH,
+        "insights_path": INSIGHTS_FILE_PATH,
+    }
+    if profile == DEFAULT_PROFILE:
+        return paths
+    return {key: _with_profile_suffix(path, profile) for key, path in paths.items()}
+
+
+def save_model_bundle(bundle, model_path=MODEL_FILE_PATH, features_path=FEATURES_FILE_PATH,
+                      encoder_path=ENCODER_FILE_PATH, meta_path=META_FILE_PATH,
+                      nodes_path=COMPACT_NODES_PATH, roots_path=COMPACT_ROOTS_PATH,
+                      insights_path=INSIGHTS_FILE_PATH):
+    """原子写入模型文件；元数据最后写入，写入中断时旧元数据与新模型不匹配会被判定为过期"""
+    _atomic_dump(bundle.model, model_path)
+    _atomic_dump(bundle.encoder.feature_columns, features_path)
+    _atomic_dump(bundle.encoder.to_dict(), encoder_path)
+    if bundle.compact is not None:
+        bundle.compact.save(nodes_path, roots_path)
+    if bundle.insights is not None:
+        save_insights(bundle.insights, insights_path)
+    _atomic_write_json(bundle.meta, meta_path)
+
+
+def _load_compact(meta, nodes_path, roots_path):
+    """按元数据记录的规模校验并以内存映射方式加载紧凑森林"""
+    compact_meta = meta.get("compact_forest")
+    if not compact_meta:
+        return None
+    try:
+        compact = CompactForest.load(nodes_path, roots_path, mmap=True)
+    except (OSError, ValueError):
+        return None
+    if len(compact.nodes) != compact_meta["n_nodes"] or compact.n_trees != compact_meta["n_trees"]:
+        return None
+    return compact
+
+
+def load_model_bundle(df_input=None, model_path=MODEL_FILE_PATH, features_path=FEATURES_FILE_PATH,
+                      encoder_path=ENCODER_FILE_PATH, meta_path=META_FILE_PATH,
+                      nodes_path=COMPACT_NODES_PATH, roots_path=COMPACT_ROOTS_PATH,
+                      insights_path=INSIGHTS_FILE_PATH):
+    """加载已保存的模型；文件不存在或损坏时返回 None。缺少元数据的旧模型元数据为空。
+    有紧凑森林时只内存映射节点数组，不反序列化 sklearn 模型"""
+    if not (os.path.exists(model_path) and os.path.exists(features_path)):
+        return None
+    import joblib
+
+    meta = _read_meta(meta_path)
+    try:
+        features = joblib.load(features_path)
+        encoder = load_encoder(encoder_path, features, df_input)
+        compact = _load_compact(meta, nodes_path, roots_path)
+        model = None if compact is not None else joblib.load(model_path, mmap_mode="r")
+    except Exception:
+        return None
+
+    # 旧模型没有紧凑森林：导出、校验并保存，下次启动即可直接内存映射
+    if compact is None and df_input is not None and meta.get("model_version"):
+        compact, compact_diff = export_compact_forest(model, _check_rows(df_input, encoder))
+        if compact is not None:
+            compact.save(nodes_path, roots_path)
+            meta = dict(meta, compact_forest=_compact_meta(compact, compact_diff))
+            _atomic_write_json(meta, meta_path)
+            compact = CompactForest.load(nodes_path, roots_path, mmap=True)
+
+    bundle = ModelBundle(encoder=encoder, meta=meta, model=model, compact=compact,
+                         model_path=model_path, meta_path=meta_path)
+
+    # 模型洞察与模型版本绑定；旧模型没有时补算一次并保存
+    bundle.insights = load_insights(insights_path, bundle.version)
+    if bundle.insights is None and df_input is not None:
+        try:
+            bundle.insights = compute_model_insights(
+                bundle.model, encoder, df_input, NUMERIC_FEATURE_COLUMNS, bundle.version
+            )
+            save_insights(bundle.insights, insights_path)
+        except Exception as e:
+            # 洞察只用于展示，计算失败不影响模型服务
+            print(f"[model] 模型洞察计算失败：{type(e).__name__}: {e}", flush=True)
+
+    # 旧模型没有实测延迟：补测一次写回元数据
+    if "benchmark" not in meta and df_input is not None and meta.get("model_version"):
+        bundle.meta = dict(meta, benchmark=benchmark_predictor(
+            bundle.predictor, _check_rows(df_input, encoder), batch_predictor=bundle.batch_predictor
+        ))
+        _atomic_write_json(bundle.meta, meta_path)
+    return bundle
+
+
+def is_stale(bundle, data_fingerprint, n_rows=None):
+    """模型是否过期：元数据中的特征列与实际加载的不一致；或训练数据指纹不同，且数据行数相对训练时的变化
+    达到 RETRAIN_GROWTH_FRACTION（未提供行数或元数据中没有训练行数时，指纹不同即视为过期）"""
+    meta = bundle.meta
+    if meta.get("feature_columns") != bundle.encoder.feature_columns:
+        return True
+    if meta.get("data_fingerprint") == data_fingerprint:
+        return False
+    trained_rows = meta.get("n_rows")
+    if n_rows is None or trained_rows is None:
+        return True
+    return abs(n_rows - trained_rows) >= RETRAIN_GROWTH_FRACTION * max(trained_rows, 1)
+
+
+# 多个档案的后台训练串行执行，避免同时训练时互相争抢CPU
+_TRAIN_LOCK = threading.Lock()
+
+
+class ModelRegistry:
+    """进程内某个模型档案的持有者：过期模型继续服务，后台重新训练完成后原子替换；
+    尚无可用模型时 current() 返回 None，直到后台训练完成。
+    pending=(训练数据, 数据指纹) 时延迟加载：首次取用模型时才从磁盘加载（缺失或过期则后台训练）"""
+
+    def __init__(self, bundle, profile=DEFAULT_PROFILE, pending=None):
+        self.profile = profile
+        self._bundle = bundle
+        self._pending = pending
+        self._lock = threading.Lock()
+        self._load_lock = threading.Lock()
+        self._retrain_thread = None
+        self.last_error = None
+        # 替换记录：[{"time", "from_version", "to_version", "mae", "train_seconds"}]
+        self.swap_events = []
+
+    @property
+    def is_loaded(self):
+        return self._pending is None
+
+    def _load(self):
+        if self._pending is None:
+            return
+        with self._load_lock:
+            if self._pending is None:
+                return
+            df_input, data_fingerprint = self._pending
+            self._bundle = load_model_bundle(df_input, **profile_paths(self.profile))
+            self._pending = None
+        self.ensure_fresh(df_input, data_fingerprint)
+
+    def current(self):
+        """当前服务中的模型（读取引用本身是原子的，调用方拿到的是不可变快照）"""
+        self._load()
+        return self._bundle
+
+    def reload(self, stale_bundle):
+        """磁盘上的模型已被其他进程替换：重新加载并替换当前模型（并发调用时只加载一次）"""
+        with self._load_lock:
+            if self._bundle is not stale_bundle:
+                return self._bundle
+            new_bundle = load_model_bundle(**profile_paths(self.profile))
+            if new_bundle is None:
+                raise ModelReplacedError("磁盘上的模型文件已被替换，且无法重新加载")
+            self.swap(new_bundle)
+            return new_bundle
+
+    def predictor(self, batch=False):
+        """返回 (当前模型, 预测对象)：batch=True 时为 sklearn 模型，否则为单行/微批预测对象。
+        sklearn 模型在首次使用时才从磁盘加载，此时若已被其他进程替换，则重新加载后重试"""
+        bundle = self.current()
+        try:
+            return bundle, (bundle.batch_predictor if batch else bundle.predictor)
+        except ModelReplacedError:
+            bundle = self.reload(bundle)
+            return bundle, (bundle.batch_predictor if batch else bundle.predictor)
+
+    def saved_meta(self):
+        """模型元数据；尚未加载时直接读取磁盘上的元数据文件，不加载模型"""
+        if not self.is_loaded:
+            return _read_meta(profile_paths(self.profile)["meta_path"])
+        return self._bundle.meta if self._bundle is not None else {}
+
+    @property
+    def is_ready(self):
+        return self.current() is not None
+
+    @property
+    def is_retraining(self):
+        thread = self._retrain_thread
+        return thread is not None and thread.is_alive()
+
+    def ensure_fresh(self, df_input, data_fingerprint, save=True):
+        """模型缺失或过期时在后台线程中重新训练；已在训练中则直接返回。返回是否启动了训练"""
+        if not self.is_loaded:
+            with self._load_lock:
+                if self._pending is not None:
+                    # 尚未加载：只记录最新数据，首次加载时再检查是否过期
+                    self._pending = (df_input, data_fingerprint)
+                    return False
+        with self._lock:
+            if self.is_retraining:
+                return False
+            if self._bundle is not None and not is_stale(self._bundle, data_fingerprint, len(df_input)):
+                return False
+            self._retrain_thread = threading.Thread(
+                target=self._retrain,
+                args=(df_input, data_fingerprint, save),
+                name=f"model-retrain-{self.profile}",
+                daemon=True
+            )
+            self._retrain_thread.start()
+            return True
+
+    def _retrain(self, df_input, data_fingerprint, save):
+        try:
+            with _TRAIN_LOCK:
+                new_bundle = train_model_bundle(df_input, data_fingerprint, self.profile)
+                if save:
+                    save_model_bundle(new_bundle, **profile_paths(self.profile))
+        except Exception as e:
+            self.last_error = f"{type(e).__name__}: {e}"
+            print(f"[model] {self.profile} 后台训练失败：{self.last_error}", flush=True)
+            return
+        self.swap(new_bundle)
+
+    def swap(self, new_bundle):
+        """原子替换当前模型并记录本次替换"""
+        with self._lock:
+            old_version = self._bundle.version if self._bundle is not None else "无"
+            self._bundle = new_bundle
+            self.last_error = None
+            event = {
+                "time": time.strftime("%Y-%m-%d %H:%M:%S"),
+                "from_version": old_version,
+                "to_version": new_bundle.version,
+                "mae": new_bundle.meta.get("mae"),
+                "train_seconds": new_bundle.meta.get("train_seconds"),
+            }
+            self.swap_events.append(event)
+        print(
+            f"[model] 已替换模型 {event['from_version']} -> {event['to_version']}"
+            f"（MAE: {event['mae']:.2f}，训练耗时 {event['train_seconds']}s）",
+            flush=True
+        )
+        return event
+
+
+def create_model_registry(df_input, data_fingerprint, profile=DEFAULT_PROFILE, wait=True):
+    """加载已保存的模型作为初始服务模型（过期则后台重训）；
+    没有可用模型时 wait=True 同步训练，否则在后台训练"""
+    bundle = load_model_bundle(df_input, **profile_paths(profile))
+    if bundle is None and wait:
+        with _TRAIN_LOCK:
+            bundle = train_model_bundle(df_input, data_fingerprint, profile)
+            save_model_bundle(bundle, **profile_paths(profile))
+        return ModelRegistry(bundle, profile)
+    registry = ModelRegistry(bundle, profile)
+    registry.ensure_fresh(df_input, data_fingerprint)
+    return registry
+
+
+def create_model_registries(df_input, data_fingerprint, profiles=None):
+    """为每个模型档案创建注册表：默认档案同步可用；其余档案延迟到首次选用时才加载
+    （梯度提升等没有紧凑森林的档案加载时需要导入 sklearn，不应出现在启动路径上）"""
+    profiles = list(profiles or MODEL_PROFILES)
+    # 默认档案排在最前（界面选项顺序不变）
+    profiles.sort(key=lambda profile: profile != DEFAULT_PROFILE)
+    return {
+        profile: (
+            create_model_registry(df_input, data_fingerprint, profile, wait=True)
+            if profile == DEFAULT_PROFILE
+            else ModelRegistry(None, profile, pending=(df_input, data_fingerprint))
+        )
+        for profile in profiles
+    }
+
+
+def ready_bundle(registries, profile):
+    """取指定档案的当前模型；该档案尚未就绪时退回默认档案。返回 (档案名, 模型)"""
+    registry = registries.get(profile)
+    if registry is not None and registry.is_ready:
+        return profile, registry.current()
+    return DEFAULT_PROFILE, registries[DEFAULT_PROFILE].current()
+
+
+def encode_batch(df_input, encoder):
+    """向量化编码整批数据：分类取值直接映射为列下标写入预分配矩阵"""
+    return encoder.transform_frame(df_input[PREDICTION_INPUT_COLUMNS])
+
+
+def predict_in_chunks(model, X, chunk_size=10000):
+    """分块预测，逐块产出 (起始行, 预测值)，便于展示进度和流式写出结果"""
+    for start in range(0, len(X), chunk_size):
+        yield start, predict_matrix(model, X[start:start + chunk_size])
@@ -0,0 +1,72 @@
+# ---------------------- 成绩敏感性分析（What-if）----------------------
+# 以当前输入为基准，把四个数值特征分别在滑块范围内扫描，所有扫描点拼成一个特征矩阵，
+# 只调用一次 predict 得到全部曲线；再从曲线中找出达到及格线所需的最小调整。
+import numpy as np
+import pandas as pd
+
+from feature_encoder import predict_matrix
+
+PASS_SCORE = 60
+
+# 扫描范围与表单滑块一致；scale 为界面取值换算为模型特征的系数（百分比 -> 比例）
+SENSITIVITY_SPECS = {
+    "每周学习时长": {"label": "每周学习时长(小时)", "min": 0.0, "max": 50.0, "step": 0.5, "scale": 1.0},
+    "上课出勤率": {"label": "上课出勤率(%)", "min": 0.0, "max": 100.0, "step": 1.0, "scale": 0.01},
+    "期中考试分数": {"label": "期中考试分数", "min": 0.0, "max": 100.0, "step": 1.0, "scale": 1.0},
+    "作业完成率": {"label": "作业完成率(%)", "min": 0.0, "max": 100.0, "step": 1.0, "scale": 0.01},
+}
+
+
+def build_sensitivity_grid(encoder, base_values, specs=SENSITIVITY_SPECS):
+    """构建扫描矩阵：每行为基准输入只改动一个特征。返回 (矩阵, {特征: (界面取值, 行切片)})"""
+    base_row = encoder.transform_row(base_values)
+    sweeps = {
+        col: np.arange(spec["min"], spec["max"] + spec["step"] / 2, spec["step"])
+        for col, spec in specs.items()
+        if col in encoder.numeric_index
+    }
+
+    X = np.repeat(base_row, sum(len(values) for values in sweeps.values()), axis=0)
+    blocks = {}
+    start = 0
+    for col, ui_values in sweeps.items():
+        stop = start + len(ui_values)
+        X[start:stop, encoder.numeric_index[col]] = ui_values * specs[col]["scale"]
+        blocks[col] = (ui_values, slice(start, stop))
+        start = stop
+    return X, blocks
+
+
+def sensitivity_curves(model, encoder, base_values, specs=SENSITIVITY_SPECS):
+    """各数值特征的预测成绩曲线：{特征: DataFrame(取值, 预测分数)}，整批只预测一次"""
+    X, blocks = build_sensitivity_grid(encoder, base_values, specs)
+    predictions = predict_matrix(model, X)
+    return {
+        col: pd.DataFrame({"取值": ui_values, "预测分数": predictions[rows]})
+        for col, (ui_values, rows) in blocks.items()
+    }
+
+
+def minimal_changes_to_pass(curves, base_values, target=PASS_SCORE, specs=SENSITIVITY_SPECS):
+    """每个特征单独调整时达到目标分数所需的最小改动，按改动幅度占滑块范围的比例排序；
+    无论怎样调整都达不到目标的特征不列出"""
+    rows = []
+    for col, curve in curves.items():
+        spec = specs[col]
+        current = base_values[col] / spec["scale"]
+        reached = curve[curve["预测分数"] >= target]
+        if reached.empty:
+            continue
+        best = reached.loc[(reached["取值"] - current).abs().idxmin()]
+        change = best["取值"] - current
+        rows.append({
+            "特征": spec["label"],
+            "当前值": current,
+            "所需值": best["取值"],
+            "调整量": change,
+            "预测分数": best["预测分数"],
+            "调整幅度": abs(change) / (spec["max"] - spec["min"]),
+        })
+    if not rows:
+        return pd.DataFrame(columns=["特征", "当前值", "所需值", "调整量", "预测分数", "调整幅度"])
+    return pd.DataFrame(rows).sort_values("调整幅度").reset_index(drop=True)
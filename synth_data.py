@@ -0,0 +1,206 @@
+# ---------------------- 合成数据生成器（任意规模，结构与源数据一致）----------------------
+# 为三个数据集生成确定性的合成数据：列名、编码、换行符与分类取值都与源文件一致，
+# 数值分布与相关关系近似源数据（期末成绩与各项学业指标相关、医疗费用与年龄/BMI/吸烟相关），
+# 可用于测试 1M、10M 行时应用与模型的表现。同一 (数据集, 行数, 随机种子) 总是生成相同的文件。
+# 用法：python synth_data.py student --rows 1000000 [--out .bench_data] [--seed 42] [--encoding gbk]
+#       python synth_data.py sales --rows 200000
+import argparse
+import datetime
+import os
+
+import numpy as np
+import pandas as pd
+
+# 分块生成与写出，内存占用与总行数无关
+CHUNK_ROWS = 500_000
+
+# 单个工作表的数据行数上限（Excel 最多 1,048,576 行，扣除标题行与表头）
+MAX_SHEET_ROWS = 1_048_576 - 2
+
+STUDENT_MAJORS = ["工商管理", "大数据管理", "电子商务", "人工智能", "财务管理"]
+STUDENT_GENDERS = ["男", "女"]
+STUDENT_ID_START = 2023000001
+
+MEDICAL_GENDERS = ["男性", "女性"]
+MEDICAL_REGIONS = ["东南部", "西南部", "西北部", "东北部"]
+# 子女数量 0-5 的分布（与 sj2.csv 的频数比例一致）
+MEDICAL_CHILDREN_P = np.array([574, 324, 240, 157, 25, 18]) / 1338
+MEDICAL_SMOKER_RATE = 274 / 1338
+
+# 销售数据：分店与城市一一对应
+SALES_TITLE = "2022年前3个月销售数据"
+SALES_COLUMNS = ["订单号", "分店", "城市", "顾客类型", "性别", "产品类型", "单价", "数量", "总价", "日期", "时间", "评分"]
+SALES_BRANCHES = {"1号店": "太原", "2号店": "大同", "3号店": "临汾"}
+SALES_CUSTOMER_TYPES = ["会员用户", "普通用户"]
+SALES_GENDERS = ["男性", "女性"]
+SALES_PRODUCTS = ["健康美容", "电子配件", "食品饮料", "时尚配饰", "运动旅行", "家居生活"]
+SALES_START_DATE = datetime.date(2022, 1, 1)
+SALES_DAYS = 89
+# 订单号：行号经乘法置换（乘数与10互素）映射为9位数字，保证唯一且看起来是随机的
+ORDER_ID_MULTIPLIER = 387_420_489
+ORDER_ID_SPACE = 10 ** 9
+
+# 数据集 -> (默认文件名, 默认编码)
+DATASETS = {
+    "student": ("student.csv", "gbk"),
+    "medical": ("sj2.csv", "gbk"),
+    "sales": ("sj.xlsx", None),
+}
+
+
+def _chunk_rng(seed, chunk_index):
+    """每个分块使用独立的随机数流，结果只取决于种子与分块下标"""
+    return np.random.default_rng([seed, chunk_index])
+
+
+def _chunks(rows):
+    for chunk_index, start in enumerate(range(0, rows, CHUNK_ROWS)):
+        yield chunk_index, start, min(CHUNK_ROWS, rows - start)
+
+
+def student_chunk(rng, start, n):
+    """学生数据：期末成绩由期中成绩、学习时长、出勤率、作业完成率线性决定再加噪声"""
+    hours = rng.uniform(5, 40, n)
+    attendance = rng.uniform(0.6, 1.0, n)
+    midterm = np.clip(rng.normal(75, 12, n), 0, 100)
+    homework = rng.uniform(0.7, 1.0, n)
+    final = 0.6 * midterm + 0.5 * hours + 15 * attendance + 10 * homework - 3 + rng.normal(0, 5, n)
+    return pd.DataFrame({
+        "学号": np.arange(STUDENT_ID_START + start, STUDENT_ID_START + start + n),
+        "性别": rng.choice(STUDENT_GENDERS, n),
+        "专业": rng.choice(STUDENT_MAJORS, n),
+        "每周学习时长": hours.round(2),
+        "上课出勤率": attendance.round(2),
+        "期中考试分数": midterm.round(2),
+        "作业完成率": homework.round(2),
+        "期末考试分数": np.clip(final, 0, 100).round(2),
+    })
+
+
+def medical_chunk(rng, start, n):
+    """医疗费用数据：费用随年龄、BMI、子女数增长，吸烟者显著更高"""
+    age = rng.integers(18, 65, n)
+    bmi = np.clip(rng.normal(30.7, 6.1, n), 16, 53.1)
+    children = rng.choice(len(MEDICAL_CHILDREN_P), n, p=MEDICAL_CHILDREN_P)
+    smoker = rng.random(n) < MEDICAL_SMOKER_RATE
+    charges = 256 * age + 339 * bmi + 475 * children + 23850 * smoker - 12000 + rng.normal(0, 6000, n)
+    return pd.DataFrame({
+        "年龄": age,
+        "性别": rng.choice(MEDICAL_GENDERS, n),
+        "BMI": bmi.round(1),
+        "子女数量": children,
+        "是否吸烟": np.where(smoker, "是", "否"),
+        "区域": rng.choice(MEDICAL_REGIONS, n),
+        "医疗费用": np.maximum(charges, 1121.87).round(2),
+    })
+
+
+def sales_chunk(rng, start, n):
+    """销售数据：总价 = 单价 × 数量，日期覆盖2022年前3个月，时间在营业时间 10:00-21:00 内"""
+    branches = rng.choice(list(SALES_BRANCHES), n)
+    unit_price = rng.uniform(10, 100, n).round(2)
+    quantity = rng.integers(1, 11, n)
+    order_digits = (np.arange(start, start + n, dtype=np.int64) * ORDER_ID_MULTIPLIER) % ORDER_ID_SPACE
+    minutes = rng.integers(10 * 60, 21 * 60, n)
+    return pd.DataFrame({
+        # 订单号格式与源数据一致（dddd-dd-dddd）
+        "订单号": [f"1{d // 10**6:03d}-{d // 10**4 % 100:02d}-{d % 10**4:04d}" for d in order_digits.tolist()],
+        "分店": branches,
+        "城市": [SALES_BRANCHES[b] for b in branches],
+        "顾客类型": rng.choice(SALES_CUSTOMER_TYPES, n),
+        "性别": rng.choice(SALES_GENDERS, n),
+        "产品类型": rng.choice(SALES_PRODUCTS, n),
+        "单价": unit_price,
+        "数量": quantity,
+        "总价": (unit_price * quantity).round(2),
+        "日期": pd.to_datetime(SALES_START_DATE) + pd.to_timedelta(rng.integers(0, SALES_DAYS, n), unit="D"),
+        "时间": [datetime.time(m // 60, m % 60) for m in minutes],
+        "评分": rng.uniform(4, 10, n).round(1),
+    })
+
+
+CHUNK_GENERATORS = {
+    "student": student_chunk,
+    "medical": medical_chunk,
+    "sales": sales_chunk,
+}
+
+
+def generate_frame(dataset, rows, seed=42):
+    """在内存中生成完整的合成数据（适合较小规模；大规模请用 write_dataset 分块写出）"""
+    generator = CHUNK_GENERATORS[dataset]
+    frames = [generator(_chunk_rng(seed, index), start, n) for index, start, n in _chunks(rows)]
+    return pd.concat(frames, ignore_index=True)
+
+
+def _write_csv(dataset, rows, path, seed, encoding):
+    generator = CHUNK_GENERATORS[dataset]
+    tmp_path = f"{path}.tmp{os.getpid()}"
+    # 与源文件一致：Windows换行符
+    with open(tmp_path, "w", encoding=encoding, newline="") as f:
+        for index, start, n in _chunks(rows):
+            generator(_chunk_rng(seed, index), start, n).to_csv(
+                f, header=(index == 0), index=False, lineterminator="\r\n"
+            )
+    os.replace(tmp_path, path)
+
+
+def _write_xlsx(rows, path, seed):
+    """以 openpyxl 只写模式逐行写出；超过单表行数上限时拆分为多个工作表，每个表都带标题行与表头"""
+    import openpyxl
+
+    workbook = openpyxl.Workbook(write_only=True)
+    sheet = None
+    sheet_rows = MAX_SHEET_ROWS
+    for index, start, n in _chunks(rows):
+        chunk = sales_chunk(_chunk_rng(seed, index), start, n)
+        for record in chunk.itertuples(index=False, name=None):
+            if sheet_rows >= MAX_SHEET_ROWS:
+                sheet = workbook.create_sheet(f"Sheet{len(workbook.worksheets) + 1}")
+                sheet.append([SALES_TITLE])
+                sheet.append(SALES_COLUMNS)
+                sheet_rows = 0
+            sheet.append(record)
+            sheet_rows += 1
+    tmp_path = f"{path}.tmp{os.getpid()}"
+    workbook.save(tmp_path)
+    os.replace(tmp_path, path)
+
+
+def synthetic_path(dataset, rows, out_dir, seed=42, encoding=None):
+    """合成文件路径：<输出目录>/<数据集>-<行数>-s<种子>[-<编码>]/<源文件名>"""
+    file_name, default_encoding = DATASETS[dataset]
+    encoding = encoding or default_encoding
+    suffix = f"-{encoding}" if encoding and encoding != default_encoding else ""
+    return os.path.join(out_dir, f"{dataset}-{rows}-s{seed}{suffix}", file_name)
+
+
+def write_dataset(dataset, rows, out_dir, seed=42, encoding=None, overwrite=False):
+    """生成并写出合成数据，返回文件路径；文件已存在且不要求覆盖时直接复用"""
+    path = synthetic_path(dataset, rows, out_dir, seed, encoding)
+    if os.path.exists(path) and not overwrite:
+        return path
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    if dataset == "sales":
+        _write_xlsx(rows, path, seed)
+    else:
+        _write_csv(dataset, rows, path, seed, encoding or DATASETS[dataset][1])
+    return path
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="生成与源数据结构一致的合成数据")
+    parser.add_argument("dataset", choices=sorted(DATASETS))
+    parser.add_argument("--rows", type=int, required=True)
+    parser.add_argument("--out", default=".bench_data")
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--encoding", default=None, help="CSV编码（默认与源文件一致：gbk；可选 utf-8 / utf-8-sig）")
+    parser.add_argument("--overwrite", action="store_true")
+    args = parser.parse_args(argv)
+
+    path = write_dataset(args.dataset, args.rows, args.out, args.seed, args.encoding, args.overwrite)
+    print(f"已生成 {args.rows} 行 {args.dataset} 数据：{path}（{os.path.getsize(path) / 1024 / 1024:.1f} MB）")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,35 @@
+# ---------------------- 紧凑森林与 sklearn 预测一致性测试 ----------------------
+# 运行：python -m pytest -q test_compact_forest.py
+import pytest
+
+np = pytest.importorskip("numpy")
+pytest.importorskip("sklearn")
+
+from sklearn.ensemble import RandomForestRegressor
+from sklearn.model_selection import train_test_split
+
+from compact_forest import CompactForest
+
+
+@pytest.fixture(scope="module")
+def forest_and_holdout():
+    rng = np.random.default_rng(0)
+    X = rng.uniform(0, 100, size=(3000, 6))
+    y = 0.6 * X[:, 0] + 0.3 * X[:, 1] - 0.2 * X[:, 2] + 5 * (X[:, 3] > 50) + rng.normal(0, 2, 3000)
+    X_train, X_test, y_train, _ = train_test_split(X, y, test_size=0.2, random_state=42)
+    model = RandomForestRegressor(n_estimators=20, max_depth=8, random_state=42).fit(X_train, y_train)
+    return model, X_test
+
+
+def test_compact_forest_matches_sklearn(forest_and_holdout):
+    model, X_test = forest_and_holdout
+    compact = CompactForest.from_sklearn(model)
+    assert np.array_equal(compact.predict(X_test), model.predict(X_test))
+
+
+def test_compact_forest_matches_after_mmap_load(forest_and_holdout, tmp_path):
+    model, X_test = forest_and_holdout
+    nodes_path, roots_path = tmp_path / "nodes.npy", tmp_path / "roots.npy"
+    CompactForest.from_sklearn(model).save(str(nodes_path), str(roots_path))
+    compact = CompactForest.load(str(nodes_path), str(roots_path), mmap=True)
+    assert np.array_equal(compact.predict(X_test), model.predict(X_test))
@@ -0,0 +1,94 @@
+# ---------------------- student.csv 增量导入与全量加载一致性测试 ----------------------
+# 运行：python -m pytest -q test_student_ingest.py
+import threading
+
+import pytest
+
+pd = pytest.importorskip("pandas")
+pytest.importorskip("pyarrow")
+pytest.importorskip("watchdog")
+
+from data_loader import parse_student_csv
+from student_analytics import build_major_cube
+from student_ingest import LiveStudentDataset
+
+HEADER = "学号,性别,专业,每周学习时长,上课出勤率,期中考试分数,作业完成率,期末考试分数"
+BASE_ROWS = [
+    f"{2023000001 + i},{'男' if i % 2 else '女'},{['工商管理', '电子商务', '财务管理'][i % 3]},"
+    f"{10 + i * 0.5},{0.8 + (i % 5) * 0.03:.2f},{60 + i},{0.9},{65 + i * 0.7:.2f}"
+    for i in range(30)
+]
+
+
+def _write(path, lines, mode="wb"):
+    # 与源文件一致：GBK编码、Windows换行符
+    with open(path, mode) as f:
+        f.write("".join(line + "\r\n" for line in lines).encode("gbk"))
+
+
+def _comparable(df):
+    """分类列转为字符串（增量追加的新类别排在原有类别之后，类别顺序与全量解析不同）"""
+    return df.astype({"性别": str, "专业": str}).reset_index(drop=True)
+
+
+def _comparable_cube(cube):
+    cube = cube.copy()
+    cube.index = pd.MultiIndex.from_tuples([tuple(map(str, key)) for key in cube.index], names=cube.index.names)
+    return cube.sort_index()
+
+
+@pytest.fixture
+def csv_path(tmp_path):
+    path = tmp_path / "student.csv"
+    _write(path, [HEADER] + BASE_ROWS)
+    return path
+
+
+def test_append_matches_full_load(csv_path, tmp_path):
+    dataset = LiveStudentDataset(str(csv_path), cache_dir=str(tmp_path / "cache"))
+    updates = []
+    dataset.add_listener(lambda snapshot, new_rows: updates.append(new_rows))
+
+    # 新类别（人工智能）、无法解析的指标（整行拒绝），以及写了一半的最后一行
+    _write(csv_path, [
+        "2023000031,男,人工智能,21.5,0.95,88,0.97,90.1",
+        "2023000032,女,电子商务,abc,0.9,70,0.9,72",
+        "2023000033,女,财务管理,18,0.85,75,0.92,77.5",
+    ], mode="ab")
+    with open(csv_path, "ab") as f:
+        f.write("2023000034,男,大数据".encode("gbk"))
+    assert dataset.refresh()
+    assert len(dataset.current().df) == len(BASE_ROWS) + 2
+    assert dataset.ingest_events[-1]["rejected"] == 1
+
+    # 补全写了一半的行
+    with open(csv_path, "ab") as f:
+        f.write("管理,15,0.8,66,0.88,70.25\r\n".encode("gbk"))
+    assert dataset.refresh()
+    assert updates == [2, 1]
+
+    snapshot = dataset.current()
+    expected = parse_student_csv(str(csv_path))
+    pd.testing.assert_frame_equal(_comparable(snapshot.df), _comparable(expected))
+    pd.testing.assert_frame_equal(
+        _comparable_cube(snapshot.major_cube), _comparable_cube(build_major_cube(expected)), check_exact=False
+    )
+
+
+def test_listener_can_call_back_on_reload(csv_path, tmp_path):
+    dataset = LiveStudentDataset(str(csv_path), cache_dir=str(tmp_path / "cache"))
+    updates = []
+
+    def listener(snapshot, new_rows):
+        # 回调中访问数据集本身（锁已释放，不会死锁）
+        dataset.refresh()
+        updates.append((len(dataset.current().df), new_rows))
+
+    dataset.add_listener(listener)
+    # 整体重写（开头内容变化）：完整重新加载，新增行数为前后行数之差
+    _write(csv_path, [HEADER] + BASE_ROWS[::-1] + BASE_ROWS[:3])
+    worker = threading.Thread(target=dataset.refresh, daemon=True)
+    worker.start()
+    worker.join(timeout=30)
+    assert not worker.is_alive()
+    assert updates == [(len(BASE_ROWS) + 3, 3)]
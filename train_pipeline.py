@@ -0,0 +1,211 @@
+# ---------------------- 学生成绩模型训练流水线 ----------------------
+# 1. 增量扫描：warm_start 随机森林逐步增加树的数量，每一步只训练新增的树，
+#    记录每一步的训练耗时、留出集预测耗时（单行/批量）与MAE；
+# 2. 交叉验证：各折在进程池中并行训练（每个进程单线程），可按不同核数重复以比较墙钟时间。
+# 所有结果追加到训练指标日志（training_metrics.jsonl），供应用内的“训练记录”查看。
+# 用法：
+#   python train_pipeline.py sweep --depths 6 8 10 12 --trees 25 50 100 150 200
+#   python train_pipeline.py cv --n-estimators 150 --max-depth 10 --folds 5 --cores 1 2 4
+import argparse
+import os
+import time
+import uuid
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+from sklearn.ensemble import RandomForestRegressor
+from sklearn.metrics import mean_absolute_error
+from sklearn.model_selection import KFold
+
+from data_loader import file_fingerprint, load_student_core
+from student_model import encode_training_frame, holdout_split
+from training_metrics import append_metrics
+
+DEFAULT_TREE_STEPS = (25, 50, 100, 150, 200)
+DEFAULT_DEPTHS = (10,)
+# 测量单行预测延迟时重复的次数
+LATENCY_REPEATS = 50
+
+# 交叉验证工作进程中的训练数据（通过进程池 initializer 传入一次，避免每折重复序列化）
+_WORKER_DATA = {}
+
+
+def _new_run_id():
+    return f"{time.strftime('%Y%m%d%H%M%S')}-{uuid.uuid4().hex[:6]}"
+
+
+def _encoded_arrays(df_input):
+    X, y = encode_training_frame(df_input)
+    return X.to_numpy(dtype=np.float32), y.to_numpy(dtype=np.float64)
+
+
+def _single_row_latency_ms(model, row):
+    """单行预测的中位延迟（毫秒）"""
+    timings = []
+    for _ in range(LATENCY_REPEATS):
+        start = time.perf_counter()
+        model.predict(row)
+        timings.append(time.perf_counter() - start)
+    return float(np.median(timings) * 1000)
+
+
+def incremental_sweep(df_input, max_depth, tree_steps=DEFAULT_TREE_STEPS, data_fingerprint=None,
+                      n_jobs=-1, run_id=None, progress_fn=None):
+    """warm_start 增量训练：树的数量按 tree_steps 逐步增加，每一步记录耗时与留出集MAE"""
+    run_id = run_id or _new_run_id()
+    X, y = _encoded_arrays(df_input)
+    X_train, X_test, y_train, y_test = holdout_split(X, y)
+
+    tree_steps = sorted(tree_steps)
+    model = RandomForestRegressor(
+        n_estimators=tree_steps[0],
+        max_depth=max_depth,
+        random_state=42,
+        n_jobs=n_jobs,
+        warm_start=True
+    )
+    records = []
+    cumulative_fit = 0.0
+    for n_estimators in tree_steps:
+        # warm_start：已训练的树保留，只训练新增的部分
+        model.set_params(n_estimators=n_estimators)
+        start = time.perf_counter()
+        model.fit(X_train, y_train)
+        step_fit = time.perf_counter() - start
+        cumulative_fit += step_fit
+
+        start = time.perf_counter()
+        y_pred = model.predict(X_test)
+        predict_seconds = time.perf_counter() - start
+
+        record = append_metrics({
+            "kind": "sweep",
+            "run_id": run_id,
+            "data_fingerprint": data_fingerprint,
+            "n_estimators": n_estimators,
+            "max_depth": max_depth,
+            "n_rows": int(len(X)),
+            "n_cores": os.cpu_count(),
+            "step_fit_seconds": round(step_fit, 4),
+            "fit_seconds": round(cumulative_fit, 4),
+            "predict_seconds": round(predict_seconds, 4),
+            "batch_rows_per_second": round(len(X_test) / predict_seconds, 1) if predict_seconds else None,
+            "single_row_ms": round(_single_row_latency_ms(model, X_test[:1]), 3),
+            "mae": float(mean_absolute_error(y_test, y_pred)),
+        })
+        records.append(record)
+        if progress_fn is not None:
+            progress_fn(record)
+    return records
+
+
+def _init_worker(X, y):
+    _WORKER_DATA["X"] = X
+    _WORKER_DATA["y"] = y
+
+
+def _fit_fold(fold, train_index, test_index, n_estimators, max_depth):
+    """在工作进程中训练一折（单线程，并行度由进程池控制）"""
+    X, y = _WORKER_DATA["X"], _WORKER_DATA["y"]
+    model = RandomForestRegressor(
+        n_estimators=n_estimators,
+        max_depth=max_depth,
+        random_state=42,
+        n_jobs=1
+    )
+    start = time.perf_counter()
+    model.fit(X[train_index], y[train_index])
+    fit_seconds = time.perf_counter() - start
+
+    start = time.perf_counter()
+    y_pred = model.predict(X[test_index])
+    predict_seconds = time.perf_counter() - start
+    return {
+        "fold": fold,
+        "fit_seconds": fit_seconds,
+        "predict_seconds": predict_seconds,
+        "mae": float(mean_absolute_error(y[test_index], y_pred)),
+    }
+
+
+def parallel_cross_validate(df_input, n_estimators, max_depth, n_folds=5, n_cores=None,
+                            data_fingerprint=None, run_id=None):
+    """各折在进程池中并行训练，返回汇总记录（平均MAE、各折耗时与墙钟时间）"""
+    run_id = run_id or _new_run_id()
+    n_cores = n_cores or os.cpu_count()
+    X, y = _encoded_arrays(df_input)
+    folds = list(KFold(n_splits=n_folds, shuffle=True, random_state=42).split(X))
+
+    start = time.perf_counter()
+    with ProcessPoolExecutor(max_workers=n_cores, initializer=_init_worker, initargs=(X, y)) as pool:
+        futures = [
+            pool.submit(_fit_fold, fold, train_index, test_index, n_estimators, max_depth)
+            for fold, (train_index, test_index) in enumerate(folds)
+        ]
+        fold_results = [future.result() for future in futures]
+    wall_seconds = time.perf_counter() - start
+
+    maes = [result["mae"] for result in fold_results]
+    return append_metrics({
+        "kind": "cv",
+        "run_id": run_id,
+        "data_fingerprint": data_fingerprint,
+        "n_estimators": n_estimators,
+        "max_depth": max_depth,
+        "n_rows": int(len(X)),
+        "n_folds": n_folds,
+        "n_cores": n_cores,
+        "wall_seconds": round(wall_seconds, 4),
+        "fit_seconds": round(sum(result["fit_seconds"] for result in fold_results), 4),
+        "predict_seconds": round(sum(result["predict_seconds"] for result in fold_results), 4),
+        "mae": float(np.mean(maes)),
+        "mae_std": float(np.std(maes)),
+        "folds": fold_results,
+    })
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="学生成绩模型训练流水线")
+    parser.add_argument("--csv", default="student.csv")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    sweep_parser = subparsers.add_parser("sweep", help="warm_start 增量扫描树的数量与深度")
+    sweep_parser.add_argument("--depths", type=int, nargs="+", default=list(DEFAULT_DEPTHS))
+    sweep_parser.add_argument("--trees", type=int, nargs="+", default=list(DEFAULT_TREE_STEPS))
+
+    cv_parser = subparsers.add_parser("cv", help="进程池并行交叉验证")
+    cv_parser.add_argument("--n-estimators", type=int, default=150)
+    cv_parser.add_argument("--max-depth", type=int, default=10)
+    cv_parser.add_argument("--folds", type=int, default=5)
+    cv_parser.add_argument("--cores", type=int, nargs="+", default=[os.cpu_count()])
+    args = parser.parse_args(argv)
+
+    fingerprint = file_fingerprint(args.csv)
+    df = load_student_core(args.csv, fingerprint=fingerprint)
+    print(f"已加载 {len(df)} 条数据，数据指纹 {fingerprint[:8]}")
+
+    if args.command == "sweep":
+        print(f"{'深度':>4} {'树数':>5} {'本步训练s':>9} {'累计训练s':>9} {'单行ms':>8} {'批量行/s':>10} {'MAE':>7}")
+        for max_depth in args.depths:
+            incremental_sweep(
+                df, max_depth, args.trees, data_fingerprint=fingerprint,
+                progress_fn=lambda r: print(
+                    f"{r['max_depth']:>4} {r['n_estimators']:>5} {r['step_fit_seconds']:>9.2f} "
+                    f"{r['fit_seconds']:>9.2f} {r['single_row_ms']:>8.2f} "
+                    f"{r['batch_rows_per_second'] or 0:>10.0f} {r['mae']:>7.3f}",
+                    flush=True
+                )
+            )
+    else:
+        print(f"{'核数':>4} {'墙钟s':>8} {'训练合计s':>9} {'MAE':>7} {'MAE标准差':>9}")
+        for n_cores in args.cores:
+            r = parallel_cross_validate(
+                df, args.n_estimators, args.max_depth, n_folds=args.folds,
+                n_cores=n_cores, data_fingerprint=fingerprint
+            )
+            print(f"{n_cores:>4} {r['wall_seconds']:>8.2f} {r['fit_seconds']:>9.2f} "
+                  f"{r['mae']:>7.3f} {r['mae_std']:>9.3f}", flush=True)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,42 @@
+# ---------------------- 训练指标日志（JSON Lines）----------------------
+# 每次训练/交叉验证/增量扫描追加一行记录（参数、耗时、MAE），
+# 命令行与应用内运行共用同一个日志，用于在“延迟-精度”曲线上选择超参数。
+import json
+import os
+import threading
+import time
+
+METRICS_LOG_PATH = "training_metrics.jsonl"
+
+_LOG_LOCK = threading.Lock()
+
+
+def append_metrics(record, log_path=METRICS_LOG_PATH):
+    """追加一条记录（自动补充记录时间与进程号），返回写入的记录"""
+    record = dict(record, logged_at=time.strftime("%Y-%m-%d %H:%M:%S"), pid=os.getpid())
+    line = json.dumps(record, ensure_ascii=False)
+    try:
+        with _LOG_LOCK:
+            with open(log_path, "a", encoding="utf-8") as f:
+                f.write(line + "\n")
+    except OSError as e:
+        # 日志只用于分析，写入失败不影响训练本身
+        print(f"[metrics] 训练指标写入失败：{e}", flush=True)
+    return record
+
+
+def read_metrics(log_path=METRICS_LOG_PATH, kind=None):
+    """读取全部记录（可按 kind 过滤）；跳过写了一半的行"""
+    records = []
+    try:
+        with open(log_path, encoding="utf-8") as f:
+            for line in f:
+                try:
+                    record = json.loads(line)
+                except ValueError:
+                    continue
+                if kind is None or record.get("kind") == kind:
+                    records.append(record)
+    except OSError:
+        pass
+    return records
@@ -0,0 +1,268 @@
+# ---------------------- 多页面共用的界面组件 ----------------------
+# 入口脚本 Final_project.py 与 app_pages/ 下的各页面共用的加载、图片、分区与模型档案组件。
+# 模块在首次导入后常驻 sys.modules，切换页面时不会重复执行这里的定义。
+import base64
+import io
+import os
+import time
+
+import numpy as np
+import pandas as pd
+import streamlit as st
+
+from app_services import get_app_resources
+from data_loader import STUDENT_PARSE_DTYPES, MissingColumnsError, coerce_numeric_columns, read_csv_sniffed
+from student_model import (
+    BATCH_PROFILE,
+    MODEL_PROFILES,
+    NUMERIC_FEATURE_COLUMNS,
+    PREDICTION_INPUT_COLUMNS,
+    encode_batch,
+    predict_in_chunks,
+    ready_bundle
+)
+from student_what_if import PASS_SCORE
+
+
+# ---------------------- 数据与模型加载（进程级共享）----------------------
+def load_shared_resources():
+    """获取进程内共享的只读数据与模型句柄（所有会话共用，不再逐会话拷贝）"""
+    try:
+        return get_app_resources("student.csv")
+    
+    except MissingColumnsError as e:
+        st.error(f"❌ 缺少核心列：{e.missing_columns}")
+        st.stop()
+    except FileNotFoundError:
+        st.error("❌ 未找到 student.csv 文件")
+        st.stop()
+    except Exception as e:
+        st.error(f"❌ 数据加载失败：{str(e)}")
+        st.stop()
+
+# ---------------------- 图片处理函数（支持网络图片和本地图片）----------------------
+def get_image_base64(image_path, default_emoji="🎓"):
+    """获取图片的base64编码或返回默认emoji"""
+    try:
+        if os.path.exists(image_path):
+            with open(image_path, "rb") as img_file:
+                return base64.b64encode(img_file.read()).decode()
+    except:
+        pass
+    return None
+
+def display_result_image(is_passed, predicted_score):
+    """显示结果图片"""
+    if is_passed:
+        # 及格图片
+        img_base64 = get_image_base64("congrats.png")
+        if img_base64:
+            st.markdown(f"""
+                <div style="text-align:center; margin:20px 0;">
+                    <img src="data:image/png;base64,{img_base64}" style="max-width:100%; border-radius:15px; box-shadow:0 5px 15px rgba(0,0,0,0.2);">
+                    <h3 style="color:#2E7D32; margin-top:15px;">🎉 预测分数: {predicted_score}分 - 恭喜通过！</h3>
+                </div>
+            """, unsafe_allow_html=True)
+        else:
+            st.markdown(f"""
+                <div style="text-align:center; padding:30px; background:linear-gradient(135deg, #E8F5E9, #C8E6C9); border-radius:15px; margin:20px 0;">
+                    <span style="font-size:80px;">🎓</span>
+                    <h3 style="color:#2E7D32; margin:10px 0;">预测分数: {predicted_score}分</h3>
+                    <h4 style="color:#388E3C;">🎊 恭喜！预测成绩已通过！</h4>
+                    <p style="color:#555; margin-top:10px;">保持优秀的学习习惯，继续努力！</p>
+                </div>
+            """, unsafe_allow_html=True)
+    else:
+        # 不及格图片
+        img_base64 = get_image_base64("encourage.png")
+        if img_base64:
+            st.markdown(f"""
+                <div style="text-align:center; margin:20px 0;">
+                    <img src="data:image/png;base64,{img_base64}" style="max-width:100%; border-radius:15px; box-shadow:0 5px 15px rgba(0,0,0,0.2);">
+                    <h3 style="color:#D32F2F; margin-top:15px;">💪 预测分数: {predicted_score}分 - 继续加油！</h3>
+                </div>
+            """, unsafe_allow_html=True)
+        else:
+            st.markdown(f"""
+                <div style="text-align:center; padding:30px; background:linear-gradient(135deg, #FFEBEE, #FFCDD2); border-radius:15px; margin:20px 0;">
+                    <span style="font-size:80px;">📚</span>
+                    <h3 style="color:#D32F2F; margin:10px 0;">预测分数: {predicted_score}分</h3>
+                    <h4 style="color:#F44336;">💪 别灰心！分析原因，继续努力！</h4>
+                    <p style="color:#555; margin-top:10px;">分析不足，调整学习策略，下次一定成功！</p>
+                </div>
+            """, unsafe_allow_html=True)
+
+# ---------------------- 惰性分区（替代 st.tabs，只执行可见分区）----------------------
+def render_lazy_sections(sections, key):
+    """st.tabs 会在每次重跑时执行全部标签页的代码；这里只执行当前选中分区的渲染函数"""
+    selected_label = st.radio(
+        "选择分析视图",
+        list(sections),
+        horizontal=True,
+        label_visibility="collapsed",
+        key=key
+    )
+    sections[selected_label]()
+
+# ---------------------- 批量预测（上传CSV，向量化编码 + 分块预测）----------------------
+BATCH_CHUNK_SIZE = 10000
+
+def render_batch_prediction(registries):
+    """批量预测界面：上传与 student.csv 相同格式的文件，预测结果可下载"""
+    st.markdown('<h2 class="sub-title">📦 批量成绩预测</h2>', unsafe_allow_html=True)
+    st.caption(f"上传与 student.csv 相同格式的CSV（需包含：{'、'.join(PREDICTION_INPUT_COLUMNS)}），支持GBK/UTF-8编码")
+    
+    # 批量预测默认使用精度更高的档案
+    batch_profile = select_model_profile(registries, "批量预测模型", BATCH_PROFILE, key="batch_profile")
+    uploaded_file = st.file_uploader("上传学生数据CSV", type=["csv"], key="batch_upload")
+    if uploaded_file is not None and st.button("🚀 开始批量预测", key="batch_predict_btn"):
+        try:
+            # 整批预测用 sklearn 模型（紧凑森林只用于单行与微批）
+            active_profile, active_bundle, model = resolve_model_profile(registries, batch_profile, batch=True)
+        except Exception as e:
+            st.error(f"❌ 模型加载失败：{str(e)}")
+            return
+        encoder = active_bundle.encoder
+        try:
+            df_batch = read_csv_sniffed(uploaded_file, dtype=STUDENT_PARSE_DTYPES)
+        except Exception as e:
+            st.error(f"❌ 文件解析失败：{str(e)}")
+            return
+        
+        missing_columns = [col for col in PREDICTION_INPUT_COLUMNS if col not in df_batch.columns]
+        if missing_columns:
+            st.error(f"❌ 缺少必要列：{missing_columns}")
+            return
+        
+        # 与加载 student.csv 相同的规则：指标无法解析为数值的行与缺失值一起跳过
+        df_batch = coerce_numeric_columns(df_batch, NUMERIC_FEATURE_COLUMNS)
+        total_rows = len(df_batch)
+        df_batch = df_batch.dropna(subset=PREDICTION_INPUT_COLUMNS)
+        skipped_rows = total_rows - len(df_batch)
+        
+        # 与预测服务一致：性别/专业取值不在模型已知类别中的行会被当作基准类别预测，整个文件拒绝并列出这些行
+        unknown_mask = encoder.unknown_category_mask(df_batch)
+        if unknown_mask.any():
+            unknown_rows = df_batch.loc[unknown_mask, PREDICTION_INPUT_COLUMNS]
+            st.error(
+                f"❌ 有 {len(unknown_rows)} 行的分类取值不在模型已知类别中，请修正后重新上传"
+                f"（性别：{encoder.categories.get('性别')}；专业：{encoder.categories.get('专业')}）"
+            )
+            # 行号为CSV文件中的行号（第1行为表头）
+            st.dataframe(unknown_rows.head(100).set_axis(unknown_rows.index[:100] + 2).rename_axis("行号"))
+            return
+        df_batch = df_batch.reset_index(drop=True)
+        if df_batch.empty:
+            st.warning("⚠️ 文件中没有可预测的有效数据")
+            return
+        
+        start_time = time.perf_counter()
+        progress_bar = st.progress(0.0, text="正在编码特征...")
+        
+        # 一次性向量化编码整批数据
+        X_batch = encode_batch(df_batch, encoder)
+        
+        # 分块预测，逐块写入结果文件
+        output_buffer = io.StringIO()
+        for start, chunk_pred in predict_in_chunks(model, X_batch, chunk_size=BATCH_CHUNK_SIZE):
+            end = start + len(chunk_pred)
+            result_chunk = df_batch.iloc[start:end].copy()
+            result_chunk["预测期末分数"] = np.round(chunk_pred, 2)
+            result_chunk["预测结果"] = np.where(chunk_pred >= PASS_SCORE, "通过", "未通过")
+            result_chunk.to_csv(output_buffer, header=(start == 0), index=False)
+            
+            elapsed = time.perf_counter() - start_time
+            progress_bar.progress(
+                end / len(df_batch),
+                text=f"已预测 {end}/{len(df_batch)} 行（{end / max(elapsed, 1e-9):,.0f} 行/秒）"
+            )
+        
+        elapsed = time.perf_counter() - start_time
+        st.session_state.batch_result = {
+            "csv_bytes": output_buffer.getvalue().encode("utf-8-sig"),
+            "rows": len(df_batch),
+            "skipped": skipped_rows,
+            "seconds": elapsed,
+            "profile": active_profile,
+            "file_name": f"{os.path.splitext(uploaded_file.name)[0]}_预测结果.csv"
+        }
+    
+    # 结果保存在会话中，点击下载按钮触发重跑后依然可用
+    batch_result = st.session_state.get("batch_result")
+    if batch_result:
+        metric_col1, metric_col2, metric_col3 = st.columns(3)
+        with metric_col1:
+            st.metric("预测行数", f"{batch_result['rows']:,}")
+        with metric_col2:
+            st.metric("耗时", f"{batch_result['seconds']:.2f} 秒")
+        with metric_col3:
+            st.metric("吞吐量", f"{batch_result['rows'] / max(batch_result['seconds'], 1e-9):,.0f} 行/秒")
+        st.caption(f"使用模型：{MODEL_PROFILES[batch_result['profile']]['label']}")
+        if batch_result["skipped"]:
+            st.info(f"已跳过 {batch_result['skipped']} 行缺失必要字段的数据")
+        st.download_button(
+            "📥 下载预测结果",
+            data=batch_result["csv_bytes"],
+            file_name=batch_result["file_name"],
+            mime="text/csv",
+            use_container_width=True
+        )
+
+# ---------------------- 模型档案选择 ----------------------
+def format_profile_option(registries, profile):
+    """下拉选项文字：档案说明 + 实测单行p99延迟与MAE；尚未就绪的档案标注训练中。
+    尚未加载的档案只读取元数据文件，不在渲染选项时加载模型"""
+    registry = registries[profile]
+    parts = [MODEL_PROFILES[profile]["label"]]
+    meta = registry.saved_meta()
+    if not meta and registry.is_loaded:
+        parts.append("训练中")
+        return " · ".join(parts)
+    benchmark = meta.get("benchmark")
+    if benchmark:
+        parts.append(f"p99 {benchmark['single_row_p99_ms']:.1f}ms")
+    if meta.get("mae") is not None:
+        parts.append(f"MAE {meta['mae']:.2f}")
+    return " · ".join(parts)
+
+def select_model_profile(registries, label, default_profile, key):
+    """选择模型档案，返回档案名"""
+    profiles = list(registries)
+    return st.selectbox(
+        label,
+        options=profiles,
+        index=profiles.index(default_profile) if default_profile in profiles else 0,
+        format_func=lambda profile: format_profile_option(registries, profile),
+        key=key
+    )
+
+def resolve_model_profile(registries, profile, batch=False):
+    """取所选档案的当前模型与预测对象；尚未训练完成时退回默认档案并提示。
+    返回 (档案名, 模型, 预测对象)，batch=True 时预测对象为 sklearn 模型"""
+    active_profile, _ = ready_bundle(registries, profile)
+    if active_profile != profile:
+        st.caption(f"⏳ {MODEL_PROFILES[profile]['label']} 仍在训练，本次使用 {MODEL_PROFILES[active_profile]['label']}")
+    bundle, predictor = registries[active_profile].predictor(batch=batch)
+    return active_profile, bundle, predictor
+
+def profile_summary(registries):
+    """各档案的实测延迟、吞吐量与MAE"""
+    rows = []
+    for profile, registry in registries.items():
+        meta = registry.saved_meta()
+        benchmark = meta.get("benchmark") or {}
+        if not registry.is_loaded:
+            status = "未加载（首次选用时加载）"
+        elif registry.is_retraining:
+            status = "训练中"
+        else:
+            status = "就绪" if registry.current() is not None else "不可用"
+        rows.append({
+            "档案": profile,
+            "状态": status,
+            "单行p50(ms)": benchmark.get("single_row_p50_ms"),
+            "单行p99(ms)": benchmark.get("single_row_p99_ms"),
+            "批量(行/秒)": benchmark.get("batch_rows_per_second"),
+            "MAE": meta.get("mae"),
+        })
+    return pd.DataFrame(rows)